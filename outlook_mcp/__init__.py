@@ -22,7 +22,7 @@ from .constants import (
     PR_LAST_VERB_EXECUTION_TIME,
 )
 from .logger import logger
-from .connection import connect_to_outlook
+from .connection import connect_to_outlook, reset_outlook_connection
 from .cache import (
     clear_calendar_cache,
     clear_email_cache,
@@ -35,6 +35,7 @@ from . import utils
 
 __all__ = [
     "connect_to_outlook",
+    "reset_outlook_connection",
     "logger",
     "utils",
     "clear_calendar_cache",
@@ -2,27 +2,34 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from collections import OrderedDict
-from collections.abc import MutableMapping
-from typing import Any, Iterator, Optional, Tuple
+from collections.abc import Hashable, MutableMapping
+from typing import Any, Iterable, Iterator, Optional, Tuple
 
 from .logger import logger
 
 
-class TimedLRUCache(MutableMapping[int, Any]):
-    """LRU cache with optional TTL eviction."""
+class TimedLRUCache(MutableMapping[Hashable, Any]):
+    """LRU cache with optional TTL eviction, keyed by any hashable value.
+
+    Tools run both on the event loop thread and on the COM worker thread, so every
+    public operation holds a re-entrant lock (``pop`` and ``items`` call back into
+    ``__contains__``).
+    """
 
     def __init__(self, *, max_entries: int, ttl_seconds: Optional[float]) -> None:
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
-        self._store: "OrderedDict[int, Any]" = OrderedDict()
-        self._timestamps: dict[int, float] = {}
+        self._store: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._timestamps: dict[Hashable, float] = {}
+        self._lock = threading.RLock()
 
     def _now(self) -> float:
         return time.monotonic()
 
-    def _is_expired(self, key: int) -> bool:
+    def _is_expired(self, key: Hashable) -> bool:
         if self.ttl_seconds is None:
             return False
         ts = self._timestamps.get(key)
@@ -30,7 +37,7 @@ class TimedLRUCache(MutableMapping[int, Any]):
             return False
         return (self._now() - ts) > self.ttl_seconds
 
-    def _evict_key(self, key: int) -> None:
+    def _evict_key(self, key: Hashable) -> None:
         self._store.pop(key, None)
         self._timestamps.pop(key, None)
 
@@ -48,70 +55,88 @@ class TimedLRUCache(MutableMapping[int, Any]):
             self._timestamps.pop(oldest_key, None)
             logger.debug("Cache LRU: rimossa voce obsoleta con indice %s", oldest_key)
 
-    def __getitem__(self, key: int) -> Any:
-        if key not in self._store:
-            raise KeyError(key)
-        if self._is_expired(key):
-            self._evict_key(key)
-            raise KeyError(key)
-        self._store.move_to_end(key)
-        return self._store[key]
-
-    def __setitem__(self, key: int, value: Any) -> None:
-        self._store[key] = value
-        self._timestamps[key] = self._now()
-        self._store.move_to_end(key)
-        self._purge_expired()
-        self._ensure_capacity()
-
-    def __delitem__(self, key: int) -> None:
-        if key in self._store:
-            self._store.pop(key, None)
-        self._timestamps.pop(key, None)
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._store:
+                raise KeyError(key)
+            if self._is_expired(key):
+                self._evict_key(key)
+                raise KeyError(key)
+            self._store.move_to_end(key)
+            return self._store[key]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._store[key] = value
+            self._timestamps[key] = self._now()
+            self._store.move_to_end(key)
+            self._purge_expired()
+            self._ensure_capacity()
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._store:
+                self._store.pop(key, None)
+            self._timestamps.pop(key, None)
 
-    def __iter__(self) -> Iterator[int]:
-        self._purge_expired()
-        return iter(self._store.copy())
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            self._purge_expired()
+            return iter(self._store.copy())
 
     def __len__(self) -> int:
-        self._purge_expired()
-        return len(self._store)
+        with self._lock:
+            self._purge_expired()
+            return len(self._store)
 
     def __contains__(self, key: object) -> bool:  # type: ignore[override]
-        if not isinstance(key, int):
-            return False
-        if key not in self._store:
-            return False
-        if self._is_expired(key):
-            self._evict_key(key)
-            return False
-        return True
+        with self._lock:
+            if not isinstance(key, Hashable):
+                return False
+            if key not in self._store:
+                return False
+            if self._is_expired(key):
+                self._evict_key(key)
+                return False
+            return True
 
     def clear(self) -> None:  # type: ignore[override]
-        self._store.clear()
-        self._timestamps.clear()
-
-    def get(self, key: int, default: Any = None) -> Any:  # type: ignore[override]
+        with self._lock:
+            self._store.clear()
+            self._timestamps.clear()
+
+    def replace_all(self, entries: Iterable[Tuple[Hashable, Any]]) -> None:
+        """Swap the whole content for ``entries`` with a single timestamp and capacity pass."""
+        with self._lock:
+            self._store.clear()
+            self._timestamps.clear()
+            now = self._now()
+            for key, value in entries:
+                self._store[key] = value
+                self._timestamps[key] = now
+            self._ensure_capacity()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:  # type: ignore[override]
         try:
             return self[key]
         except KeyError:
             return default
 
-    def pop(self, key: int, default: Any = None) -> Any:  # type: ignore[override]
-        if key in self and not self._is_expired(key):
-            value = self._store.pop(key)
-            self._timestamps.pop(key, None)
-            return value
-        if default is not None:
-            return default
-        raise KeyError(key)
-
-    def items(self) -> Iterator[Tuple[int, Any]]:  # type: ignore[override]
-        self._purge_expired()
-        snapshot = list(self._store.items())
-        for key, value in snapshot:
-            if key in self:
-                yield key, value
+    def pop(self, key: Hashable, default: Any = None) -> Any:  # type: ignore[override]
+        with self._lock:
+            if key in self and not self._is_expired(key):
+                value = self._store.pop(key)
+                self._timestamps.pop(key, None)
+                return value
+            if default is not None:
+                return default
+            raise KeyError(key)
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:  # type: ignore[override]
+        with self._lock:
+            self._purge_expired()
+            snapshot = [(key, value) for key, value in list(self._store.items()) if key in self]
+        yield from snapshot
 
 
 email_cache: TimedLRUCache = TimedLRUCache(max_entries=500, ttl_seconds=1800.0)
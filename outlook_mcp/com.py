@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import threading
 import time
-from typing import Callable, Optional, Tuple, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+try:
+    import pythoncom  # type: ignore
+except ImportError:  # pywin32 missing: no apartment setup and no worker pool
+    pythoncom = None  # type: ignore[assignment]
 
 from outlook_mcp import logger
 
@@ -86,4 +95,68 @@ def wrap_com_exception(description: str, exc: Exception) -> OutlookComError:
     return OutlookComError(description, exc, suggestion, transient)
 
 
-__all__ = ["run_com_call", "OutlookComError", "wrap_com_exception"]
+# Offloaded tool calls run in order on one long-lived thread that owns its COM
+# apartment, so the event loop stays free meanwhile and the connection is reused.
+_COM_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_COM_EXECUTOR_LOCK = threading.Lock()
+
+
+def _initialize_com_thread() -> None:
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+
+
+def _get_com_executor() -> ThreadPoolExecutor:
+    global _COM_EXECUTOR
+    with _COM_EXECUTOR_LOCK:
+        if _COM_EXECUTOR is None:
+            _COM_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="outlook-com",
+                initializer=_initialize_com_thread,
+            )
+        return _COM_EXECUTOR
+
+
+# Independent folder reads and batch actions fan out over a second long-lived pool.
+# Each of its threads initialises COM once and keeps its own cached Outlook connection
+# (see connect_to_outlook), so later fan-outs reuse both instead of paying for new ones.
+_COM_POOL_WORKERS = 4
+_COM_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def com_worker_pool() -> Optional[ThreadPoolExecutor]:
+    """Return the shared COM worker pool, or None when work must stay on the calling thread.
+
+    Jobs run in their own apartment, so they must connect to Outlook themselves and
+    re-open folders by ID; they must not wait on other jobs of the same pool.
+    """
+    global _COM_POOL
+    if pythoncom is None:
+        return None
+    with _COM_EXECUTOR_LOCK:
+        if _COM_POOL is None:
+            _COM_POOL = ThreadPoolExecutor(
+                max_workers=_COM_POOL_WORKERS,
+                thread_name_prefix="outlook-com-pool",
+                initializer=_initialize_com_thread,
+            )
+        return _COM_POOL
+
+
+async def run_in_com_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``func`` on the dedicated COM worker thread without blocking the event loop.
+
+    COM proxies cannot cross threads: ``func`` must connect to Outlook itself.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_com_executor(), functools.partial(func, *args, **kwargs))
+
+
+__all__ = [
+    "run_com_call",
+    "OutlookComError",
+    "wrap_com_exception",
+    "com_worker_pool",
+    "run_in_com_thread",
+]
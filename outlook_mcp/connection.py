@@ -1,10 +1,19 @@
 """Thin wrapper around Outlook COM connection logic."""
 
+import threading
+import time
+
 import win32com.client  # type: ignore
 
 from .logger import logger
 
 _version_logged = False
+# COM proxies are bound to the apartment (thread) that created them, so the
+# reusable (outlook, namespace) pair is cached per thread.
+_thread_state = threading.local()
+# A connection verified this recently is reused without another liveness round trip,
+# so bursts of calls (bulk tools, batch loops) pay for the probe once.
+_LIVENESS_CHECK_INTERVAL = 2.0
 
 
 def _log_outlook_version(app) -> None:
@@ -32,17 +41,57 @@ def _log_outlook_version(app) -> None:
     _version_logged = True
 
 
+def _dispatch_outlook():
+    """Return an early-bound Outlook.Application, falling back to late binding.
+
+    Early binding (generated typelib) turns property reads into direct vtable
+    calls; a broken or read-only gen_py cache must not prevent the connection.
+    """
+    try:
+        return win32com.client.gencache.EnsureDispatch("Outlook.Application")
+    except Exception:
+        logger.debug("Early binding Outlook non disponibile, uso Dispatch dinamico.", exc_info=True)
+        return win32com.client.Dispatch("Outlook.Application")
+
+
+def reset_outlook_connection() -> None:
+    """Drop the connection cached for the current thread (next call reconnects)."""
+    _thread_state.connection = None
+    _thread_state.verified_at = None
+
+
+def _cached_connection_alive(connection) -> bool:
+    now = time.monotonic()
+    verified_at = getattr(_thread_state, "verified_at", None)
+    if verified_at is not None and now - verified_at < _LIVENESS_CHECK_INTERVAL:
+        return True
+    try:
+        connection[0].Name  # cheap property read: fails once Outlook has gone away
+        _thread_state.verified_at = now
+        return True
+    except Exception:
+        logger.info("Connessione Outlook in cache non piu' valida. Mi riconnetto.")
+        return False
+
+
 def connect_to_outlook():
-    """Connect to Outlook application using COM."""
+    """Connect to Outlook application using COM, reusing this thread's connection."""
+    cached = getattr(_thread_state, "connection", None)
+    if cached is not None and _cached_connection_alive(cached):
+        return cached
+    reset_outlook_connection()
     try:
-        outlook = win32com.client.Dispatch("Outlook.Application")
+        outlook = _dispatch_outlook()
         namespace = outlook.GetNamespace("MAPI")
         _log_outlook_version(outlook)
         logger.debug("Connessione a Outlook MAPI completata.")
-        return outlook, namespace
+        connection = (outlook, namespace)
+        _thread_state.connection = connection
+        _thread_state.verified_at = time.monotonic()
+        return connection
     except Exception as exc:  # pragma: no cover - depends on Outlook runtime
         logger.exception("Errore durante la connessione a Outlook.")
         raise Exception(f"Impossibile connettersi a Outlook: {exc}") from exc
 
 
-__all__ = ["connect_to_outlook"]
+__all__ = ["connect_to_outlook", "reset_outlook_connection"]
@@ -10,7 +10,29 @@ LOG_FILE_NAME = "outlook_mcp_server.log"
 MAX_EVENT_LOOKAHEAD_DAYS = 90
 PR_LAST_VERB_EXECUTED = "http://schemas.microsoft.com/mapi/proptag/0x10810003"
 PR_LAST_VERB_EXECUTION_TIME = "http://schemas.microsoft.com/mapi/proptag/0x10820040"
+PR_CREATION_TIME = "http://schemas.microsoft.com/mapi/proptag/0x30070040"
+PR_ATTACH_DATA_BIN = "http://schemas.microsoft.com/mapi/proptag/0x37010102"
+PR_ATTACH_LONG_FILENAME = "http://schemas.microsoft.com/mapi/proptag/0x3707001F"
+PR_ATTACH_SIZE = "http://schemas.microsoft.com/mapi/proptag/0x0E200003"
+PID_LID_TASK_COMPLETE = "http://schemas.microsoft.com/mapi/id/{00062003-0000-0000-C000-000000000046}/811C000B"
+DASL_SUBJECT = "urn:schemas:httpmail:subject"
+DASL_TEXT_DESCRIPTION = "urn:schemas:httpmail:textdescription"
+DASL_CALENDAR_LOCATION = "urn:schemas:calendar:location"
+PR_SENT_REPRESENTING_NAME = "http://schemas.microsoft.com/mapi/proptag/0x0042001F"
+PR_DISPLAY_TO = "http://schemas.microsoft.com/mapi/proptag/0x0E04001F"
+PR_DISPLAY_CC = "http://schemas.microsoft.com/mapi/proptag/0x0E03001F"
 LAST_VERB_REPLY_CODES = {102, 103}
+# Outlook object model enumeration values (OlDefaultFolders, OlItemType, OlMeetingStatus,
+# OlMeetingRecipientType, OlAttachmentType). Plain ints work with both early- and late-bound dispatch,
+# unlike win32com.client.constants, which is only populated once makepy has run.
+OL_FOLDER_INBOX = 6
+OL_FOLDER_CALENDAR = 9
+OL_FOLDER_CONTACTS = 10
+OL_APPOINTMENT_ITEM = 1
+OL_MEETING = 1
+OL_MEETING_RECEIVED = 3
+OL_REQUIRED = 1
+OL_BY_VALUE = 1
 DEFAULT_CONVERSATION_SAMPLE_LIMIT = 15
 MAX_CONVERSATION_LOOKBACK_DAYS = 180
 PENDING_SCAN_MULTIPLIER = 4
@@ -52,6 +74,27 @@ ITEM_TYPE_NAME_MAP = {
 # Task-specific constants
 MAX_TASK_DAYS = 365
 DEFAULT_TASK_MAX_RESULTS = 50
+MAX_TASKS_PER_FOLDER = 500
+# Outlook stores "no date" as 1/1/4501; any year past this marks an empty date.
+OUTLOOK_NO_DATE_YEAR = 4000
+# Columns fetched in bulk via Folder.GetTable(); Body cannot be exposed by
+# Outlook tables and is loaded on demand for the tasks actually displayed.
+TASK_TABLE_COLUMNS = (
+    "EntryID",
+    "Subject",
+    "DueDate",
+    "StartDate",
+    "DateCompleted",
+    "CreationTime",
+    "Status",
+    "Importance",
+    "PercentComplete",
+    "Complete",
+    "Owner",
+    "Categories",
+    "ReminderSet",
+    "ReminderTime",
+)
 TASK_STATUS_MAP = {
     0: "Non iniziata",
     1: "In corso",
@@ -64,6 +107,9 @@ TASK_PRIORITY_MAP = {
     1: "Normale",
     2: "Alta",
 }
+# Outlook status/importance codes are dense small integers: index tuples directly.
+TASK_STATUS_LABELS = tuple(TASK_STATUS_MAP[code] for code in range(len(TASK_STATUS_MAP)))
+TASK_PRIORITY_LABELS = tuple(TASK_PRIORITY_MAP[code] for code in range(len(TASK_PRIORITY_MAP)))
 TASK_STATUS_REVERSE_MAP = {
     "non iniziata": 0,
     "non iniziato": 0,
@@ -85,3 +131,19 @@ TASK_PRIORITY_REVERSE_MAP = {
     "alta": 2,
     "high": 2,
 }
+
+# Contact-specific constants
+# DASL names of every field search_contacts matches against (name, email, company, phones, categories).
+CONTACT_SEARCH_PROPERTIES = (
+    "http://schemas.microsoft.com/mapi/proptag/0x3001001F",  # FullName
+    "http://schemas.microsoft.com/mapi/id/{00062004-0000-0000-C000-000000000046}/8005001F",  # FileAs
+    "http://schemas.microsoft.com/mapi/proptag/0x3A16001F",  # CompanyName
+    "http://schemas.microsoft.com/mapi/id/{00062004-0000-0000-C000-000000000046}/8083001F",  # Email1Address
+    "http://schemas.microsoft.com/mapi/id/{00062004-0000-0000-C000-000000000046}/8093001F",  # Email2Address
+    "http://schemas.microsoft.com/mapi/id/{00062004-0000-0000-C000-000000000046}/80A3001F",  # Email3Address
+    "http://schemas.microsoft.com/mapi/proptag/0x3A1C001F",  # MobileTelephoneNumber
+    "http://schemas.microsoft.com/mapi/proptag/0x3A08001F",  # BusinessTelephoneNumber
+    "http://schemas.microsoft.com/mapi/proptag/0x3A09001F",  # HomeTelephoneNumber
+    "http://schemas.microsoft.com/mapi/proptag/0x3A1A001F",  # PrimaryTelephoneNumber
+    "urn:schemas-microsoft-com:office:office#Keywords",  # Categories
+)
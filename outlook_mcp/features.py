@@ -31,6 +31,8 @@ from .logger import logger
 
 # Runtime registry: tool_name -> group
 _TOOL_GROUPS: Dict[str, str] = {}
+# Bumped by reload_features() so callers can cache data derived from the gates.
+_FEATURES_GENERATION = 0
 
 
 def _project_root() -> Path:
@@ -110,6 +112,8 @@ def _normalize_group(group: Optional[str]) -> Optional[str]:
 
 def reload_features() -> None:
     """(Re)load configuration from disk and environment."""
+    global _FEATURES_GENERATION
+    _FEATURES_GENERATION += 1
     _FEATURES.enabled_groups.clear()
     _FEATURES.disabled_groups.clear()
     _FEATURES.enabled_tools.clear()
@@ -161,8 +165,7 @@ def feature_gate(group: Optional[str] = None, name: Optional[str] = None):
         if group:
             _TOOL_GROUPS[tool_name] = str(group)
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
+        def ensure_enabled() -> None:
             grp = _TOOL_GROUPS.get(tool_name)
             if not is_tool_enabled(tool_name, grp):
                 from mcp.server.fastmcp.exceptions import ToolError  # local import
@@ -171,7 +174,21 @@ def feature_gate(group: Optional[str] = None, name: Optional[str] = None):
                     f"Lo strumento '{tool_name}' e' disabilitato. "
                     f"Aggiorna features.json o le variabili ambiente per abilitarlo."
                 )
-            return func(*args, **kwargs)
+
+        # Async tools need an async wrapper so FastMCP keeps awaiting them.
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                ensure_enabled()
+                return await func(*args, **kwargs)
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                ensure_enabled()
+                return func(*args, **kwargs)
 
         # Preserve attributes/signature so FastMCP can derive JSON schema
         wrapper.__name__ = func.__name__
@@ -190,6 +207,11 @@ def get_tool_group(tool_name: str) -> Optional[str]:
     return _TOOL_GROUPS.get(tool_name)
 
 
+def features_generation() -> int:
+    """Return a counter that changes whenever the feature configuration is reloaded."""
+    return _FEATURES_GENERATION
+
+
 def feature_metrics() -> Dict[str, Any]:
     """Return diagnostic information about feature configuration and tool mappings."""
     enabled_groups = sorted(_FEATURES.enabled_groups)
@@ -235,6 +257,7 @@ __all__ = [
     "is_tool_enabled",
     "reload_features",
     "get_tool_group",
+    "features_generation",
     "feature_metrics",
 ]
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from .cache import TimedLRUCache
 from .logger import logger
 from .utils import (
     coerce_bool,
@@ -147,6 +148,41 @@ def resolve_folder(
     return None, attempts
 
 
+# Move targets are usually the same few folders, so resolved destinations are kept
+# briefly: (id(namespace), folder_id, folder_path, folder_name) -> (namespace, folder).
+# The namespace is stored too since COM proxies are per-connection.
+_resolved_folders: TimedLRUCache = TimedLRUCache(max_entries=128, ttl_seconds=60.0)
+
+
+def invalidate_resolved_folder_cache() -> None:
+    """Forget cached folder resolutions (call after folder changes or COM failures)."""
+    _resolved_folders.clear()
+    logger.debug("Cache delle cartelle risolte svuotata.")
+
+
+def resolve_folder_cached(
+    namespace,
+    *,
+    folder_id: Optional[str] = None,
+    folder_path: Optional[str] = None,
+    folder_name: Optional[str] = None,
+) -> Tuple[Optional[Any], List[str]]:
+    """Like :func:`resolve_folder`, reusing a recent successful resolution."""
+    key = (id(namespace), folder_id, folder_path, folder_name)
+    entry = _resolved_folders.get(key)
+    if entry is not None and entry[0] is namespace:
+        return entry[1], []
+    folder, attempts = resolve_folder(
+        namespace,
+        folder_id=folder_id,
+        folder_path=folder_path,
+        folder_name=folder_name,
+    )
+    if folder is not None:
+        _resolved_folders[key] = (namespace, folder)
+    return folder, attempts
+
+
 def list_folders(
     namespace,
     *,
@@ -410,6 +446,8 @@ __all__ = [
     "get_folder_by_name",
     "get_folder_by_path",
     "resolve_folder",
+    "resolve_folder_cached",
+    "invalidate_resolved_folder_cache",
     "list_folders",
     "folder_metadata",
     "create_folder",
@@ -7,6 +7,8 @@ from .email import (
     extract_email_domain,
     derive_sender_email,
     ensure_domain_folder_structure,
+    find_subfolder,
+    invalidate_subfolder_index,
     collect_user_addresses,
     mail_item_marked_replied,
     format_email,
@@ -25,6 +27,9 @@ from .email import (
 from .calendar import (
     get_all_calendar_folders,
     get_calendar_folder_by_name,
+    get_default_calendar_folder,
+    invalidate_calendar_folder_cache,
+    invalidate_calendar_entry,
     format_calendar_event,
     get_events_from_folder,
     collect_events_across_calendars,
@@ -39,6 +44,8 @@ __all__ = [
     "extract_email_domain",
     "derive_sender_email",
     "ensure_domain_folder_structure",
+    "find_subfolder",
+    "invalidate_subfolder_index",
     "collect_user_addresses",
     "mail_item_marked_replied",
     "format_email",
@@ -55,6 +62,9 @@ __all__ = [
     "get_email_context",
     "get_all_calendar_folders",
     "get_calendar_folder_by_name",
+    "get_default_calendar_folder",
+    "invalidate_calendar_folder_cache",
+    "invalidate_calendar_entry",
     "format_calendar_event",
     "get_events_from_folder",
     "collect_events_across_calendars",
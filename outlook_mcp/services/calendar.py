@@ -3,10 +3,24 @@
 from __future__ import annotations
 
 import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-
-from outlook_mcp import calendar_cache, clear_calendar_cache, logger
-from outlook_mcp.com import OutlookComError, run_com_call, wrap_com_exception
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from outlook_mcp import calendar_cache, clear_calendar_cache, connect_to_outlook, logger
+from outlook_mcp.cache import TimedLRUCache
+from outlook_mcp.com import (
+    OutlookComError,
+    com_worker_pool,
+    run_com_call,
+    wrap_com_exception,
+)
+from outlook_mcp.constants import (
+    DASL_CALENDAR_LOCATION,
+    DASL_SUBJECT,
+    DASL_TEXT_DESCRIPTION,
+    PR_DISPLAY_CC,
+    PR_DISPLAY_TO,
+    PR_SENT_REPRESENTING_NAME,
+)
 from outlook_mcp.utils import ensure_naive_datetime, build_body_preview, safe_folder_path, to_python_datetime
 
 from .common import format_yes_no
@@ -14,6 +28,9 @@ from .common import format_yes_no
 __all__ = [
     "get_all_calendar_folders",
     "get_calendar_folder_by_name",
+    "get_default_calendar_folder",
+    "invalidate_calendar_folder_cache",
+    "invalidate_calendar_entry",
     "format_calendar_event",
     "get_events_from_folder",
     "collect_events_across_calendars",
@@ -21,9 +38,40 @@ __all__ = [
 ]
 
 
+# Enumerated calendar folders per namespace:
+# id(namespace) -> (namespace, folders, default folder, lowercase name -> folder index).
+_calendar_folder_cache: TimedLRUCache = TimedLRUCache(max_entries=4, ttl_seconds=60.0)
+
+
+def invalidate_calendar_folder_cache() -> None:
+    """Forget enumerated calendar folders (call after creating/renaming/deleting folders)."""
+    _calendar_folder_cache.clear()
+    logger.debug("Cache delle cartelle calendario svuotata.")
+
+
+def _cached_calendar_folders(namespace) -> Optional[Tuple[List, Any, Dict[str, Any]]]:
+    entry = _calendar_folder_cache.get(id(namespace))
+    if entry is None or entry[0] is not namespace:
+        return None
+    return entry[1], entry[2], entry[3]
+
+
+def get_default_calendar_folder(namespace):
+    """Return the default calendar, reusing the one found by the last folder walk."""
+    cached = _cached_calendar_folders(namespace)
+    if cached is not None and cached[1] is not None:
+        return cached[1]
+    return namespace.GetDefaultFolder(9)  # olFolderCalendar
+
+
 def get_all_calendar_folders(namespace) -> List:
     """Return every Outlook folder that stores appointments."""
+    cached = _cached_calendar_folders(namespace)
+    if cached is not None:
+        return list(cached[0])
+
     calendar_folders: List = []
+    default_calendar = None
     visited_paths = set()
 
     def visit(folder) -> None:
@@ -62,21 +110,26 @@ def get_all_calendar_folders(namespace) -> List:
         logger.warning("Impossibile enumerare le radici per i calendari.")
 
     logger.debug("Rilevate %s cartelle calendario totali.", len(calendar_folders))
-    return calendar_folders
+    _calendar_folder_cache[id(namespace)] = (namespace, calendar_folders, default_calendar, {})
+    return list(calendar_folders)
 
 
 def get_calendar_folder_by_name(namespace, calendar_name: str):
     """Find a calendar folder by its display name."""
     if not calendar_name:
-        return namespace.GetDefaultFolder(9)
+        return get_default_calendar_folder(namespace)
     target = calendar_name.lower()
-    for folder in get_all_calendar_folders(namespace):
-        try:
-            if folder.Name.lower() == target:
-                return folder
-        except Exception:
-            continue
-    return None
+    folders = get_all_calendar_folders(namespace)
+    cached = _cached_calendar_folders(namespace)
+    by_name: Dict[str, Any] = cached[2] if cached is not None else {}
+    if not by_name:
+        # One pass of Name reads indexes every calendar; later lookups skip the COM scan.
+        for folder in folders:
+            try:
+                by_name.setdefault(folder.Name.lower(), folder)
+            except Exception:
+                continue
+    return by_name.get(target)
 
 
 def format_calendar_event(appointment) -> Dict[str, Any]:
@@ -124,6 +177,56 @@ def format_calendar_event(appointment) -> Dict[str, Any]:
         raise Exception(f"Impossibile formattare l'evento di calendario: {exc}")
 
 
+def invalidate_calendar_entry(entry_id: Optional[str], appointment: Any = None) -> None:
+    """Refresh or drop the listed events matching ``entry_id`` without clearing the listing.
+
+    With ``appointment`` the cached entry is re-read from it (keeping its number, so
+    later ``event_number`` references stay valid); without it, or when the entry is a
+    recurring series, the matches are removed. Expanded occurrences share the series
+    EntryID but carry their own start and end, so re-reading the series would overwrite
+    them. Other listed events are left untouched.
+    """
+    if not entry_id:
+        clear_calendar_cache()
+        return
+    numbers = [number for number, event in calendar_cache.items() if event.get("id") == entry_id]
+    if not numbers:
+        return
+    refreshed = None
+    if appointment is not None and len(numbers) == 1 and not getattr(appointment, "IsRecurring", False):
+        try:
+            refreshed = format_calendar_event(appointment)
+        except Exception:
+            logger.debug("Impossibile aggiornare in cache l'evento %s.", entry_id, exc_info=True)
+    for number in numbers:
+        if refreshed is None:
+            del calendar_cache[number]
+        else:
+            calendar_cache[number] = dict(refreshed)
+
+
+# Same fields as the Python-side haystack: subject, location, body, organizer, attendees.
+_EVENT_SEARCH_PROPERTIES = (
+    DASL_SUBJECT,
+    DASL_CALENDAR_LOCATION,
+    DASL_TEXT_DESCRIPTION,
+    PR_SENT_REPRESENTING_NAME,
+    PR_DISPLAY_TO,
+    PR_DISPLAY_CC,
+)
+
+
+def _build_event_search_filter(search_terms: Sequence[str]) -> Optional[str]:
+    """Return a DASL filter matching any term in any searchable event field."""
+    clauses = []
+    for term in search_terms:
+        escaped = term.replace("'", "''")
+        clauses.extend(f"\"{prop}\" LIKE '%{escaped}%'" for prop in _EVENT_SEARCH_PROPERTIES)
+    if not clauses:
+        return None
+    return "@SQL=" + " OR ".join(clauses)
+
+
 def get_events_from_folder(folder, days: int, search_term: Optional[str] = None) -> List[Dict[str, Any]]:
     """Retrieve upcoming events from a calendar folder."""
     now = ensure_naive_datetime(datetime.datetime.now())
@@ -131,11 +234,13 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
         now = datetime.datetime.now()
     horizon = now + datetime.timedelta(days=days)
     events: List[Dict[str, Any]] = []
+    # Read once: every log line below would otherwise pay a COM round trip for it.
+    folder_name = getattr(folder, "Name", folder)
 
     try:
         items = run_com_call(
             lambda: folder.Items,
-            f"Ottenere gli eventi della cartella '{getattr(folder, 'Name', folder)}'",
+            f"Ottenere gli eventi della cartella '{folder_name}'",
             retries=2,
         )
         run_com_call(lambda: items.Sort("[Start]"), "Ordinare gli eventi per data", retries=1)
@@ -147,7 +252,7 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
     except OutlookComError as exc:
         logger.warning(
             "Impossibile preparare la cartella calendario '%s': %s",
-            getattr(folder, "Name", folder),
+            folder_name,
             exc,
         )
         return events
@@ -156,6 +261,22 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
     if search_term:
         search_terms = [term.strip().lower() for term in search_term.split(" OR ") if term.strip()]
 
+    search_filter = _build_event_search_filter(search_terms)
+    if search_filter:
+        # Let the store drop non-matching items; the Python check below stays as a safety net.
+        try:
+            items = run_com_call(
+                lambda: items.Restrict(search_filter),
+                "Filtrare gli eventi per termine di ricerca",
+                retries=0,
+            )
+        except OutlookComError:
+            logger.debug(
+                "Restrict DASL non disponibile per la cartella calendario '%s'; filtro in Python.",
+                folder_name,
+                exc_info=True,
+            )
+
     def fmt(dt: datetime.datetime) -> str:
         return dt.strftime("%m/%d/%Y %I:%M %p")
 
@@ -172,7 +293,7 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
     except OutlookComError:
         logger.debug(
             "Find non disponibile per la cartella calendario '%s'.",
-            getattr(folder, "Name", folder),
+            folder_name,
             exc_info=True,
         )
         current = None
@@ -181,13 +302,13 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
     if current:
         logger.info(
             "Find iniziale per la cartella calendario '%s' ha trovato l'evento '%s'.",
-            getattr(folder, "Name", folder),
+            folder_name,
             getattr(current, "Subject", None),
         )
     else:
         logger.info(
             "Find iniziale per la cartella calendario '%s' non ha trovato elementi (filtro=%s).",
-            getattr(folder, "Name", folder),
+            folder_name,
             find_filter,
         )
 
@@ -262,7 +383,7 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
     else:
         logger.info(
             "Iterazione completa sugli eventi della cartella calendario '%s' (filtro Find non disponibile).",
-            getattr(folder, "Name", folder),
+            folder_name,
         )
         try:
             for appointment in items:
@@ -274,11 +395,11 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
         except Exception as exc:
             logger.debug(
                 "Errore durante l'iterazione degli eventi della cartella '%s'.",
-                getattr(folder, "Name", folder),
+                folder_name,
                 exc_info=True,
             )
             com_error = wrap_com_exception(
-                f"Iterazione sugli eventi della cartella '{getattr(folder, 'Name', folder)}'",
+                f"Iterazione sugli eventi della cartella '{folder_name}'",
                 exc,
             )
             logger.warning(str(com_error))
@@ -286,17 +407,72 @@ def get_events_from_folder(folder, days: int, search_term: Optional[str] = None)
     logger.info(
         "Recuperati %s eventi dalla cartella calendario '%s'.",
         len(events),
-        getattr(folder, "Name", folder),
+        folder_name,
     )
     logger.info(
         "Dettagli scansione calendario '%s': analizzati=%s salti=%s",
-        getattr(folder, "Name", folder),
+        folder_name,
         scanned,
         skip_counters,
     )
     return events
 
 
+def _calendar_ids_for_workers(folders: Sequence) -> Optional[List[Tuple[str, str]]]:
+    """Return ``(EntryID, StoreID)`` pairs when calendars can be read concurrently."""
+    if len(folders) <= 1:
+        return None
+    folder_ids: List[Tuple[str, str]] = []
+    for folder in folders:
+        try:
+            entry_id = folder.EntryID
+            store_id = folder.StoreID
+        except Exception:
+            return None
+        if not entry_id or not store_id:
+            return None
+        folder_ids.append((entry_id, store_id))
+    return folder_ids
+
+
+def _get_events_in_worker(
+    entry_id: str,
+    store_id: str,
+    days: int,
+    search_term: Optional[str],
+) -> List[Dict[str, Any]]:
+    """Read one calendar on a COM pool thread; the folder is re-resolved in its apartment."""
+    _, namespace = connect_to_outlook()
+    folder = namespace.GetFolderFromID(entry_id, store_id)
+    return get_events_from_folder(folder, days, search_term)
+
+
+def _fetch_events_per_folder(
+    folders: Sequence,
+    days: int,
+    search_term: Optional[str],
+) -> List[List[Dict[str, Any]]]:
+    """Return the events of each folder, in folder order, reading calendars concurrently."""
+    pool = com_worker_pool()
+    folder_ids = _calendar_ids_for_workers(folders) if pool is not None else None
+    if folder_ids is None:
+        return [get_events_from_folder(folder, days, search_term) for folder in folders]
+
+    futures = [
+        pool.submit(_get_events_in_worker, entry_id, store_id, days, search_term)
+        for entry_id, store_id in folder_ids
+    ]
+    results: List[List[Dict[str, Any]]] = []
+    # Consume in submission order so duplicate events resolve exactly as in the serial scan.
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as exc:
+            logger.warning("Errore nel recupero eventi da una cartella calendario: %s", exc)
+            results.append([])
+    return results
+
+
 def collect_events_across_calendars(
     folders: Sequence,
     days: int,
@@ -304,8 +480,7 @@ def collect_events_across_calendars(
 ) -> List[Dict[str, Any]]:
     """Aggregate calendar events across multiple folders."""
     aggregated: Dict[str, Dict[str, Any]] = {}
-    for folder in folders:
-        folder_events = get_events_from_folder(folder, days, search_term)
+    for folder_events in _fetch_events_per_folder(folders, days, search_term):
         for event in folder_events:
             event_id = event.get("id")
             if not event_id:
@@ -325,6 +500,33 @@ def collect_events_across_calendars(
     return sorted_events
 
 
+def _render_event_block(
+    idx: int,
+    event: Dict[str, Any],
+    calendar_display: str,
+    include_description: bool,
+) -> str:
+    lines = [
+        f"Evento #{idx}",
+        f"Oggetto: {event.get('subject', '(Senza oggetto)')}",
+        f"Inizio: {event.get('start_time', 'Sconosciuto')}",
+        f"Fine: {event.get('end_time', 'Sconosciuto')}",
+        f"Calendario: {event.get('folder_path') or calendar_display}",
+        f"Luogo: {event.get('location', '') or 'Non specificato'}",
+        f"Organizzatore: {event.get('organizer', 'Non disponibile')}",
+        f"Giornata intera: {format_yes_no(event.get('all_day'))}",
+    ]
+    if event.get("required_attendees"):
+        lines.append(f"Partecipanti obbligatori: {event['required_attendees']}")
+    if event.get("optional_attendees"):
+        lines.append(f"Partecipanti facoltativi: {event['optional_attendees']}")
+    if event.get("categories"):
+        lines.append(f"Categorie: {event['categories']}")
+    if include_description and event.get("preview"):
+        lines.append(f"Anteprima: {event['preview']}")
+    return "\n".join(lines)
+
+
 def present_event_listing(
     events: Sequence[Dict[str, Any]],
     calendar_display: str,
@@ -365,29 +567,13 @@ def present_event_listing(
         calendar_display,
     )
 
-    result = header + "\n\n"
-
-    for idx, event in enumerate(visible_events, 1):
-        calendar_cache[idx] = event
-
-        result += f"Evento #{idx}\n"
-        result += f"Oggetto: {event.get('subject', '(Senza oggetto)')}\n"
-        result += f"Inizio: {event.get('start_time', 'Sconosciuto')}\n"
-        result += f"Fine: {event.get('end_time', 'Sconosciuto')}\n"
-        result += f"Calendario: {event.get('folder_path') or calendar_display}\n"
-        result += f"Luogo: {event.get('location', '') or 'Non specificato'}\n"
-        result += f"Organizzatore: {event.get('organizer', 'Non disponibile')}\n"
-        result += f"Giornata intera: {format_yes_no(event.get('all_day'))}\n"
-        if event.get("required_attendees"):
-            result += f"Partecipanti obbligatori: {event['required_attendees']}\n"
-        if event.get("optional_attendees"):
-            result += f"Partecipanti facoltativi: {event['optional_attendees']}\n"
-        if event.get("categories"):
-            result += f"Categorie: {event['categories']}\n"
-        if include_description and event.get("preview"):
-            result += f"Anteprima: {event['preview']}\n"
-        result += "\n"
-
+    # One bulk cache write; the detail view renders lazily, so nothing is formatted twice here.
+    calendar_cache.replace_all(enumerate(visible_events, 1))
+    blocks = "\n\n".join(
+        _render_event_block(idx, event, calendar_display, include_description)
+        for idx, event in enumerate(visible_events, 1)
+    )
+    result = f"{header}\n\n{blocks}"
     return result.rstrip()
 
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import datetime
+import functools
 from typing import Any, Optional
 
 __all__ = [
     "parse_datetime_string",
+    "parse_iso_input",
     "describe_importance",
     "describe_sensitivity",
     "describe_flag_status",
@@ -56,6 +58,18 @@ def parse_datetime_string(value: Optional[str]) -> Optional[datetime.datetime]:
     return None
 
 
+# Tool inputs such as 2025-10-22T14:30Z become "2025-10-22 14:30" for fromisoformat.
+_ISO_INPUT_SEPARATORS = str.maketrans({"T": " ", "Z": None})
+
+
+def parse_iso_input(value: str) -> datetime.datetime:
+    """Parse an ISO date/time tool argument, dropping the ``T`` separator and ``Z`` suffix.
+
+    Raises ``ValueError`` for malformed input, like ``datetime.fromisoformat``.
+    """
+    return datetime.datetime.fromisoformat(value.translate(_ISO_INPUT_SEPARATORS))
+
+
 def describe_importance(value: Any) -> str:
     """Map Outlook importance values to readable Italian labels."""
     importance_map = {0: "Bassa", 1: "Normale", 2: "Alta"}
@@ -99,35 +113,38 @@ def describe_flag_status(value: Any) -> str:
     return str(value) if value is not None else "Sconosciuto"
 
 
+_IMPORTANCE_CODES = {
+    "bassa": 0,
+    "low": 0,
+    "normale": 1,
+    "normal": 1,
+    "alta": 2,
+    "high": 2,
+}
+
+_SENSITIVITY_CODES = {
+    "normale": 0,
+    "normal": 0,
+    "personale": 1,
+    "personal": 1,
+    "privato": 2,
+    "private": 2,
+    "confidenziale": 3,
+    "confidential": 3,
+}
+
+
+@functools.lru_cache(maxsize=32)
 def parse_importance(importance_input: Optional[str]) -> Optional[int]:
     """Parse an importance string to Outlook importance code."""
     if importance_input is None:
         return None
-    normalized = importance_input.strip().lower()
-    importance_reverse_map = {
-        "bassa": 0,
-        "low": 0,
-        "normale": 1,
-        "normal": 1,
-        "alta": 2,
-        "high": 2,
-    }
-    return importance_reverse_map.get(normalized)
+    return _IMPORTANCE_CODES.get(importance_input.strip().lower())
 
 
+@functools.lru_cache(maxsize=32)
 def parse_sensitivity(sensitivity_input: Optional[str]) -> Optional[int]:
     """Parse a sensitivity string to Outlook sensitivity code."""
     if sensitivity_input is None:
         return None
-    normalized = sensitivity_input.strip().lower()
-    sensitivity_reverse_map = {
-        "normale": 0,
-        "normal": 0,
-        "personale": 1,
-        "personal": 1,
-        "privato": 2,
-        "private": 2,
-        "confidenziale": 3,
-        "confidential": 3,
-    }
-    return sensitivity_reverse_map.get(normalized)
+    return _SENSITIVITY_CODES.get(sensitivity_input.strip().lower())
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import logging
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 from mcp.server.fastmcp.exceptions import ToolError
@@ -19,6 +21,7 @@ from outlook_mcp import (
     email_cache,
     logger,
 )
+from outlook_mcp.cache import TimedLRUCache
 from outlook_mcp.utils import (
     build_body_preview,
     coerce_bool,
@@ -29,6 +32,7 @@ from outlook_mcp.utils import (
     safe_folder_path,
     to_python_datetime,
     trim_conversation_id,
+    truncate_text,
 )
 from outlook_mcp import folders as folder_service
 
@@ -46,6 +50,8 @@ __all__ = [
     "extract_email_domain",
     "derive_sender_email",
     "ensure_domain_folder_structure",
+    "find_subfolder",
+    "invalidate_subfolder_index",
     "collect_user_addresses",
     "mail_item_marked_replied",
     "format_email",
@@ -76,11 +82,11 @@ def resolve_mail_item(
     cached_entry: Optional[Dict[str, Any]] = None
 
     if email_number is not None:
-        if not email_cache or email_number not in email_cache:
+        cached_entry = email_cache.get(email_number)
+        if cached_entry is None:
             raise ToolError(
                 "Messaggio non presente nella cache corrente. Elenca prima le email o specifica un message_id."
             )
-        cached_entry = email_cache[email_number]
         if not message_id:
             message_id = cached_entry.get("id")
 
@@ -102,9 +108,10 @@ def update_cached_email(email_number: Optional[int], **updates: Any) -> None:
     """Apply in-place updates to the cached representation of an email."""
     if email_number is None:
         return
-    if not email_cache or email_number not in email_cache:
+    cached_entry = email_cache.get(email_number)
+    if cached_entry is None:
         return
-    email_cache[email_number].update({key: value for key, value in updates.items() if value is not None})
+    cached_entry.update({key: value for key, value in updates.items() if value is not None})
 
 
 def normalize_email_address(value: Optional[str]) -> Optional[str]:
@@ -138,8 +145,9 @@ def normalize_email_address(value: Optional[str]) -> Optional[str]:
     return fallback or None
 
 
+@functools.lru_cache(maxsize=256)
 def extract_email_domain(address: Optional[str]) -> Optional[str]:
-    """Return email domain portion."""
+    """Return email domain portion (memoized: domain routing sees the same senders repeatedly)."""
     normalized = normalize_email_address(address)
     if not normalized or "@" not in normalized:
         return None
@@ -151,18 +159,71 @@ def derive_sender_email(entry: Dict[str, Any]) -> Optional[str]:
     return entry.get("sender_email") or entry.get("sender")
 
 
-def _get_or_create_subfolder(parent, name: str):
-    """Return existing Outlook subfolder or create it."""
+# Child folders by lowercase name, per parent folder:
+# (id(namespace), parent EntryID) -> (namespace, {name: folder}). The namespace is kept
+# so a reused id() of a dropped connection never matches.
+_subfolder_index: TimedLRUCache = TimedLRUCache(max_entries=64, ttl_seconds=60.0)
+
+
+def invalidate_subfolder_index() -> None:
+    """Forget indexed subfolders (call after creating/renaming/deleting folders)."""
+    _subfolder_index.clear()
+    logger.debug("Indice delle sottocartelle svuotato.")
+
+
+def _subfolders_by_name(namespace, parent) -> Optional[Dict[str, Any]]:
+    """Return the ``{name.lower(): folder}`` index of ``parent``, enumerating it at most once."""
+    entry_id = safe_entry_id(parent)
+    if entry_id is None:
+        return None
+    key = (id(namespace), entry_id)
+    entry = _subfolder_index.get(key)
+    if entry is not None and entry[0] is namespace:
+        return entry[1]
+    index: Dict[str, Any] = {}
+    for sub in parent.Folders:
+        try:
+            index.setdefault(sub.Name.lower(), sub)
+        except Exception:
+            continue
+    _subfolder_index[key] = (namespace, index)
+    return index
+
+
+def find_subfolder(namespace, parent, name: str):
+    """Return the direct child of ``parent`` called ``name`` (case-insensitive), or ``None``."""
+    target = name.lower()
     try:
+        index = _subfolders_by_name(namespace, parent)
+        if index is not None:
+            return index.get(target)
         for sub in parent.Folders:
-            if sub.Name.lower() == name.lower():
-                return sub, False
+            if sub.Name.lower() == target:
+                return sub
     except Exception:
         logger.debug("Impossibile enumerare le sottocartelle di '%s'.", getattr(parent, "Name", parent), exc_info=True)
+    return None
+
+
+def _get_or_create_subfolder(parent, name: str, namespace=None):
+    """Return existing Outlook subfolder or create it."""
+    existing = find_subfolder(namespace, parent, name)
+    if existing is None:
+        # The index may predate a folder another client has just created: rescan the
+        # parent before Add, which would fail on an existing name.
+        key = (id(namespace), safe_entry_id(parent))
+        _subfolder_index.pop(key, False)
+        existing = find_subfolder(namespace, parent, name)
+    if existing is not None:
+        return existing, False
     try:
-        return parent.Folders.Add(name), True
+        created = parent.Folders.Add(name)
     except Exception as exc:  # pragma: no cover - Outlook COM guarded
         raise Exception(f"Impossibile creare la cartella '{name}': {exc}") from exc
+    entry = _subfolder_index.get(key)
+    if entry is not None and entry[0] is namespace:
+        entry[1][name.lower()] = created
+    return created, True
 
 
 def ensure_domain_folder_structure(
@@ -175,22 +236,12 @@ def ensure_domain_folder_structure(
     if not subfolders:
         subfolders = DEFAULT_DOMAIN_SUBFOLDERS
     inbox = namespace.GetDefaultFolder(6)  # olFolderInbox
-    root_folder, _ = _get_or_create_subfolder(inbox, root_folder_name)
-    domain_folder, domain_created = _get_or_create_subfolder(root_folder, domain)
+    root_folder, _ = _get_or_create_subfolder(inbox, root_folder_name, namespace)
+    domain_folder, domain_created = _get_or_create_subfolder(root_folder, domain, namespace)
     created_subfolders: List[str] = []
     for name in subfolders:
-        existing = False
         try:
-            for sub in domain_folder.Folders:
-                if sub.Name.lower() == name.lower():
-                    existing = True
-                    break
-        except Exception:
-            existing = False
-        if existing:
-            continue
-        try:
-            folder, created = _get_or_create_subfolder(domain_folder, name)
+            folder, created = _get_or_create_subfolder(domain_folder, name, namespace)
         except Exception as exc:
             logger.warning("Creazione della sottocartella '%s' fallita: %s", name, exc)
             continue
@@ -266,10 +317,10 @@ def collect_user_addresses(namespace) -> Set[str]:
         for normalized in (normalize_email_address(addr) for addr in addresses)
         if normalized
     }
-    if normalized:
-        logger.debug("Rilevati indirizzi utente: %s", ", ".join(sorted(normalized)))
-    else:
+    if not normalized:
         logger.debug("Nessun indirizzo utente normalizzato rilevato.")
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Rilevati indirizzi utente: %s", ", ".join(sorted(normalized)))
     return normalized
 
 
@@ -424,21 +475,24 @@ def get_emails_from_folder(folder, days: int, search_term: Optional[str] = None)
         except Exception:
             default_item_type = None
         if default_item_type not in (None, 0):  # 0 == olMailItem
-            logger.debug(
-                "Cartella '%s' ignorata (tipo elemento predefinito=%s).",
-                getattr(folder, "Name", str(folder)),
-                default_item_type,
-            )
+            # The folder name costs a COM round trip: only fetch it when the line is emitted.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Cartella '%s' ignorata (tipo elemento predefinito=%s).",
+                    getattr(folder, "Name", str(folder)),
+                    default_item_type,
+                )
             return []
 
         folder_items = folder.Items
         folder_items.Sort("[ReceivedTime]", True)
-        logger.info(
-            "Raccolta email dalla cartella '%s' con giorni=%s termine=%s.",
-            getattr(folder, "Name", str(folder)),
-            days,
-            search_term,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Raccolta email dalla cartella '%s' con giorni=%s termine=%s.",
+                getattr(folder, "Name", str(folder)),
+                days,
+                search_term,
+            )
 
         def _matches_search_groups(email_data: Dict[str, Any]) -> bool:
             if not term_groups:
@@ -619,7 +673,7 @@ def collect_emails_across_folders(
             continue
 
         limited_emails = folder_emails if search_term else folder_emails[:max_per_folder]
-        if not search_term and len(folder_emails) > len(limited_emails):
+        if not search_term and len(folder_emails) > len(limited_emails) and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "Cartella '%s': limitati %s messaggi su %s per contenere la scansione globale.",
                 getattr(folder, "Name", str(folder)),
@@ -1263,10 +1317,10 @@ def get_email_context(
             context_lines.append(f"Allegati: {', '.join(attachment_names)}")
 
         body_content = email_data.get("body", "")
-        if body_content and len(body_content) > 4000:
-            truncated_body = body_content[:4000].rstrip() + "\n[Corpo troncato per brevita]"
+        if body_content:
+            truncated_body = truncate_text(body_content, 4000, "[Corpo troncato per brevita]")
         else:
-            truncated_body = body_content or "(Nessun contenuto)"
+            truncated_body = "(Nessun contenuto)"
 
         context_lines.append("")
         context_lines.append("Corpo del messaggio corrente:")
@@ -2,17 +2,52 @@
 
 from __future__ import annotations
 
+import copy
 import datetime
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from outlook_mcp import logger
-from outlook_mcp.features import get_tool_group, is_tool_enabled
+from outlook_mcp.features import features_generation, get_tool_group, is_tool_enabled
+from outlook_mcp.toolkit import get_registration_generation
 from outlook_mcp.utils import coerce_bool
 
 from outlook_mcp import connect_to_outlook
 from outlook_mcp.services.email import collect_user_addresses, normalize_email_address
 
-__all__ = ["build_params_payload", "get_current_datetime", "get_profile_identity"]
+__all__ = [
+    "build_params_payload",
+    "get_current_datetime",
+    "get_profile_identity",
+    "invalidate_accounts_cache",
+]
+
+# (id(mcp_instance), registration generation, features generation) -> tool summaries.
+_TOOL_SUMMARY_CACHE: Dict[Tuple[int, int, int], Dict[str, Dict[str, Any]]] = {}
+
+
+def _summarize_tools(mcp_instance: Any) -> Dict[str, Dict[str, Any]]:
+    """Return summaries of the enabled tools, rebuilt only when tools or gates change."""
+    key = (id(mcp_instance), get_registration_generation(), features_generation())
+    cached = _TOOL_SUMMARY_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    tool_summaries: Dict[str, Dict[str, Any]] = {}
+    for tool in mcp_instance._tool_manager.list_tools():  # type: ignore[attr-defined]
+        tool_group = get_tool_group(getattr(tool, "name", ""))
+        if not is_tool_enabled(getattr(tool, "name", ""), tool_group):
+            continue
+        tool_summaries[tool.name] = {
+            "description": getattr(tool, "description", None),
+            "inputSchema": getattr(tool, "input_schema", None),
+            "outputSchema": getattr(tool, "output_schema", None),
+            "annotations": getattr(tool, "annotations", None),
+        }
+
+    _TOOL_SUMMARY_CACHE.clear()
+    _TOOL_SUMMARY_CACHE[key] = tool_summaries
+    return tool_summaries
 
 
 def build_params_payload(
@@ -29,17 +64,8 @@ def build_params_payload(
         client_info,
     )
 
-    tool_summaries: Dict[str, Dict[str, Any]] = {}
-    for tool in mcp_instance._tool_manager.list_tools():  # type: ignore[attr-defined]
-        tool_group = get_tool_group(getattr(tool, "name", ""))
-        if not is_tool_enabled(getattr(tool, "name", ""), tool_group):
-            continue
-        tool_summaries[tool.name] = {
-            "description": getattr(tool, "description", None),
-            "inputSchema": getattr(tool, "input_schema", None),
-            "outputSchema": getattr(tool, "output_schema", None),
-            "annotations": getattr(tool, "annotations", None),
-        }
+    # Shallow copy so callers cannot mutate the cached summaries.
+    tool_summaries = dict(_summarize_tools(mcp_instance))
 
     default_capabilities = {"tools": {"list": True, "call": True}}
     response_capabilities: Dict[str, Any] = default_capabilities
@@ -91,16 +117,32 @@ def get_current_datetime(include_utc: bool = True) -> str:
         return f"Errore durante il calcolo della data/ora corrente: {exc}"
 
 
+# Outlook accounts rarely change within a session: enumerate them once per namespace.
+# A reconnect (reset_outlook_connection, Outlook restart or profile switch) yields a new
+# namespace object, so the cached list is never served to another session.
+_ACCOUNTS_CACHE: Optional[Tuple[Any, list[dict[str, str]]]] = None
+
+
+def invalidate_accounts_cache() -> None:
+    """Forget the cached account list so the next lookup re-enumerates Outlook."""
+    global _ACCOUNTS_CACHE
+    _ACCOUNTS_CACHE = None
+
+
 def _safe_collect_accounts(namespace) -> list[dict[str, str]]:
     """Return display name and SMTP address for each Outlook account."""
+    global _ACCOUNTS_CACHE
+    cached = _ACCOUNTS_CACHE
+    if cached is not None and cached[0] is namespace:
+        return [dict(info) for info in cached[1]]
+
     accounts_info: list[dict[str, str]] = []
     try:
         session = namespace.Application.Session
         accounts = getattr(session, "Accounts", None)
         if not accounts:
             return accounts_info
-        for idx in range(1, accounts.Count + 1):
-            account = accounts.Item(idx)
+        for account in accounts:
             display_name = getattr(account, "DisplayName", None)
             smtp_address = getattr(account, "SmtpAddress", None)
             info: dict[str, str] = {}
@@ -112,11 +154,23 @@ def _safe_collect_accounts(namespace) -> list[dict[str, str]]:
                 accounts_info.append(info)
     except Exception:
         logger.debug("Impossibile enumerare gli account Outlook.", exc_info=True)
+        return accounts_info
+    _ACCOUNTS_CACHE = (namespace, [dict(info) for info in accounts_info])
     return accounts_info
 
 
+# The active profile does not change mid-session: reuse the identity for a short while.
+_PROFILE_IDENTITY_TTL_SECONDS = 30.0
+_profile_identity_cache: Optional[Tuple[float, dict[str, object]]] = None
+
+
 def get_profile_identity() -> dict[str, object]:
     """Return display name, primary address and aliases for the active Outlook profile."""
+    global _profile_identity_cache
+    cached = _profile_identity_cache
+    if cached is not None and (time.monotonic() - cached[0]) <= _PROFILE_IDENTITY_TTL_SECONDS:
+        return copy.deepcopy(cached[1])
+
     try:
         _, namespace = connect_to_outlook()
     except Exception as exc:  # pragma: no cover - Outlook COM guarded
@@ -145,10 +199,8 @@ def get_profile_identity() -> dict[str, object]:
     except Exception:
         logger.debug("Impossibile leggere CurrentUser da Outlook.", exc_info=True)
 
-    addresses = sorted(collect_user_addresses(namespace))
-    normalized_addresses = sorted(
-        {addr for addr in (normalize_email_address(address) for address in addresses) if addr}
-    )
+    # collect_user_addresses already returns normalized, non-empty addresses.
+    normalized_addresses = sorted(collect_user_addresses(namespace))
 
     if not primary_address and normalized_addresses:
         primary_address = normalized_addresses[0]
@@ -164,9 +216,11 @@ def get_profile_identity() -> dict[str, object]:
             display_name = normalized_addresses[0]
 
     account_entries = _safe_collect_accounts(namespace)
-    return {
+    payload: dict[str, object] = {
         "display_name": display_name,
         "primary_address": primary_address,
-        "addresses": normalized_addresses or addresses,
+        "addresses": normalized_addresses,
         "accounts": account_entries,
     }
+    _profile_identity_cache = (time.monotonic(), payload)
+    return copy.deepcopy(payload)
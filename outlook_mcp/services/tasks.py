@@ -3,19 +3,41 @@
 from __future__ import annotations
 
 import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-
-from outlook_mcp import logger
-from outlook_mcp.com import OutlookComError, run_com_call, wrap_com_exception
+import heapq
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from outlook_mcp import connect_to_outlook, logger
+from outlook_mcp.cache import TimedLRUCache, clear_task_cache, task_cache
+from outlook_mcp.com import (
+    OutlookComError,
+    com_worker_pool,
+    run_com_call,
+    wrap_com_exception,
+)
 from outlook_mcp.utils import ensure_naive_datetime, build_body_preview, safe_folder_path, to_python_datetime
-from outlook_mcp.constants import TASK_STATUS_MAP, TASK_PRIORITY_MAP, TASK_STATUS_REVERSE_MAP, TASK_PRIORITY_REVERSE_MAP
+from outlook_mcp.constants import (
+    DASL_SUBJECT,
+    DASL_TEXT_DESCRIPTION,
+    MAX_TASKS_PER_FOLDER,
+    OUTLOOK_NO_DATE_YEAR,
+    PID_LID_TASK_COMPLETE,
+    PR_CREATION_TIME,
+    TASK_PRIORITY_LABELS,
+    TASK_PRIORITY_REVERSE_MAP,
+    TASK_STATUS_LABELS,
+    TASK_STATUS_REVERSE_MAP,
+    TASK_TABLE_COLUMNS,
+)
 
 from .common import format_yes_no
 
 __all__ = [
     "get_all_task_folders",
     "get_task_folder_by_name",
+    "invalidate_task_folder_cache",
     "format_task_item",
+    "load_task_body",
     "get_tasks_from_folder",
     "collect_tasks_across_folders",
     "present_task_listing",
@@ -24,19 +46,57 @@ __all__ = [
 ]
 
 
+# Enumerated task folders per namespace: id(namespace) -> (namespace, folders, name index).
+_task_folder_cache: TimedLRUCache = TimedLRUCache(max_entries=4, ttl_seconds=30.0)
+
+
+def invalidate_task_folder_cache() -> None:
+    """Forget enumerated task folders (call after creating/renaming/deleting folders)."""
+    _task_folder_cache.clear()
+    logger.debug("Cache delle cartelle attività svuotata.")
+
+
+def _cached_task_folders(namespace) -> Optional[Tuple[List, Dict[str, Any]]]:
+    entry = _task_folder_cache.get(id(namespace))
+    if entry is None or entry[0] is not namespace:
+        return None
+    return entry[1], entry[2]
+
+
 def get_all_task_folders(namespace) -> List:
     """Return every Outlook folder that stores tasks."""
+    cached = _cached_task_folders(namespace)
+    if cached is not None:
+        return list(cached[0])
+
     task_folders: List = []
-    visited_paths = set()
+    visited_ids: Set[str] = set()
+    roots: List = []
 
-    def visit(folder) -> None:
+    try:
+        roots.append(namespace.GetDefaultFolder(13))  # olFolderTasks
+    except Exception:
+        logger.warning("Impossibile ottenere la cartella Attività predefinita.")
+
+    try:
+        roots.extend(namespace.Folders)
+    except Exception:
+        logger.warning("Impossibile enumerare le radici per le attività.")
+
+    # Depth-first walk with an explicit stack (children pushed in reverse to keep
+    # Outlook's ordering); EntryID is used for dedup since MAPI caches it locally.
+    stack = list(reversed(roots))
+    while stack:
+        folder = stack.pop()
         try:
-            path = folder.FolderPath
+            key = folder.EntryID
         except Exception:
-            path = str(folder)
-        if path in visited_paths:
-            return
-        visited_paths.add(path)
+            key = None
+        if not key:
+            key = str(id(folder))
+        if key in visited_ids:
+            continue
+        visited_ids.add(key)
 
         try:
             default_item_type = folder.DefaultItemType
@@ -47,25 +107,14 @@ def get_all_task_folders(namespace) -> List:
             task_folders.append(folder)
 
         try:
-            for sub in folder.Folders:
-                visit(sub)
+            children = list(folder.Folders)
         except Exception:
-            return
-
-    try:
-        default_tasks = namespace.GetDefaultFolder(13)  # olFolderTasks
-        visit(default_tasks)
-    except Exception:
-        logger.warning("Impossibile ottenere la cartella Attività predefinita.")
-
-    try:
-        for root in namespace.Folders:
-            visit(root)
-    except Exception:
-        logger.warning("Impossibile enumerare le radici per le attività.")
+            continue
+        stack.extend(reversed(children))
 
     logger.debug("Rilevate %s cartelle attività totali.", len(task_folders))
-    return task_folders
+    _task_folder_cache[id(namespace)] = (namespace, task_folders, {})
+    return list(task_folders)
 
 
 def get_task_folder_by_name(namespace, folder_name: str):
@@ -73,13 +122,46 @@ def get_task_folder_by_name(namespace, folder_name: str):
     if not folder_name:
         return namespace.GetDefaultFolder(13)
     target = folder_name.lower()
-    for folder in get_all_task_folders(namespace):
-        try:
-            if folder.Name.lower() == target:
-                return folder
-        except Exception:
-            continue
-    return None
+    folders = get_all_task_folders(namespace)
+    cached = _cached_task_folders(namespace)
+    by_name = cached[1] if cached is not None else {}
+    if not by_name:
+        for folder in folders:
+            try:
+                by_name.setdefault(folder.Name.lower(), folder)
+            except Exception:
+                continue
+    return by_name.get(target)
+
+
+# Owner, categories and folder paths repeat across tasks: share one string object per value.
+_STR_CACHE: Dict[str, str] = {}
+_STR_CACHE_MAX_ENTRIES = 1024
+
+
+def _canon(value: str) -> str:
+    """Return a shared instance of ``value`` (interned when ASCII)."""
+    cached = _STR_CACHE.get(value)
+    if cached is not None:
+        return cached
+    if len(_STR_CACHE) >= _STR_CACHE_MAX_ENTRIES:
+        _STR_CACHE.clear()
+    canonical = sys.intern(value) if value.isascii() else value
+    _STR_CACHE[value] = canonical
+    return canonical
+
+
+def _format_task_date(dt_raw) -> Optional[str]:
+    """Format a COM task date, returning ``None`` for empty/sentinel values."""
+    if not dt_raw:
+        return None
+    # Reject the 1/1/4501 "no date" sentinel before paying for the conversion.
+    if getattr(dt_raw, "year", 0) > OUTLOOK_NO_DATE_YEAR:
+        return None
+    dt = to_python_datetime(dt_raw)
+    if not dt or dt.year > OUTLOOK_NO_DATE_YEAR:
+        return None
+    return dt.strftime("%Y-%m-%d %H:%M")
 
 
 def format_task_item(task) -> Dict[str, Any]:
@@ -95,41 +177,38 @@ def format_task_item(task) -> Dict[str, Any]:
         completed_date_raw = getattr(task, "DateCompleted", None)
         created_date_raw = getattr(task, "CreationTime", None)
 
-        def fmt_date(dt_raw) -> Optional[str]:
-            if not dt_raw:
-                return None
-            dt = to_python_datetime(dt_raw)
-            if not dt:
-                return None
-            # Check if it's a valid date (Outlook sometimes uses 1/1/4501 for "no date")
-            if dt.year > 4000:
-                return None
-            return dt.strftime("%Y-%m-%d %H:%M")
-
-        due_date = fmt_date(due_date_raw)
-        start_date = fmt_date(start_date_raw)
-        completed_date = fmt_date(completed_date_raw)
-        created_date = fmt_date(created_date_raw)
+        due_date = _format_task_date(due_date_raw)
+        start_date = _format_task_date(start_date_raw)
+        completed_date = _format_task_date(completed_date_raw)
+        created_date = _format_task_date(created_date_raw)
 
         # Status and priority
         status_code = getattr(task, "Status", 0)
         priority_code = getattr(task, "Importance", 1)
         percent_complete = getattr(task, "PercentComplete", 0)
 
-        status_label = TASK_STATUS_MAP.get(status_code, f"Sconosciuto ({status_code})")
-        priority_label = TASK_PRIORITY_MAP.get(priority_code, f"Sconosciuto ({priority_code})")
+        status_label = (
+            TASK_STATUS_LABELS[status_code]
+            if type(status_code) is int and 0 <= status_code < len(TASK_STATUS_LABELS)
+            else f"Sconosciuto ({status_code})"
+        )
+        priority_label = (
+            TASK_PRIORITY_LABELS[priority_code]
+            if type(priority_code) is int and 0 <= priority_code < len(TASK_PRIORITY_LABELS)
+            else f"Sconosciuto ({priority_code})"
+        )
 
         # Other properties
         complete = getattr(task, "Complete", False)
-        owner = getattr(task, "Owner", "") or ""
-        categories = getattr(task, "Categories", "") or ""
+        owner = _canon(str(getattr(task, "Owner", "") or ""))
+        categories = _canon(str(getattr(task, "Categories", "") or ""))
         reminder_set = getattr(task, "ReminderSet", False)
-        reminder_time = fmt_date(getattr(task, "ReminderTime", None)) if reminder_set else None
+        reminder_time = _format_task_date(getattr(task, "ReminderTime", None)) if reminder_set else None
 
         # Get folder path
         try:
             parent_folder = task.Parent
-            folder_path = safe_folder_path(parent_folder)
+            folder_path = _canon(safe_folder_path(parent_folder))
         except Exception:
             folder_path = ""
 
@@ -171,6 +250,135 @@ def format_task_item(task) -> Dict[str, Any]:
         }
 
 
+def _format_task_row(columns: Sequence[str], row: Sequence[Any], folder_path: str = "") -> Dict[str, Any]:
+    """Build the task dictionary from a ``Table.GetArray`` row.
+
+    The body is not part of the table: ``body`` is left as ``None`` so that
+    :func:`load_task_body` can fetch it only for the tasks actually shown.
+    """
+    values = dict(zip(columns, row))
+
+    status_code = values.get("Status")
+    if status_code is None:
+        status_code = 0
+    priority_code = values.get("Importance")
+    if priority_code is None:
+        priority_code = 1
+    reminder_set = bool(values.get("ReminderSet"))
+    status_label = (
+        TASK_STATUS_LABELS[status_code]
+        if type(status_code) is int and 0 <= status_code < len(TASK_STATUS_LABELS)
+        else f"Sconosciuto ({status_code})"
+    )
+    priority_label = (
+        TASK_PRIORITY_LABELS[priority_code]
+        if type(priority_code) is int and 0 <= priority_code < len(TASK_PRIORITY_LABELS)
+        else f"Sconosciuto ({priority_code})"
+    )
+
+    return {
+        "id": values.get("EntryID") or "",
+        "subject": values.get("Subject") or "(Senza oggetto)",
+        "body": None,
+        "preview": "",
+        "due_date": _format_task_date(values.get("DueDate")),
+        "start_date": _format_task_date(values.get("StartDate")),
+        "completed_date": _format_task_date(values.get("DateCompleted")),
+        "created_date": _format_task_date(values.get("CreationTime")),
+        "status": status_label,
+        "status_code": status_code,
+        "priority": priority_label,
+        "priority_code": priority_code,
+        "percent_complete": values.get("PercentComplete") or 0,
+        "complete": bool(values.get("Complete")),
+        "owner": _canon(str(values.get("Owner") or "")),
+        "categories": _canon(str(values.get("Categories") or "")),
+        "reminder_set": reminder_set,
+        "reminder_time": _format_task_date(values.get("ReminderTime")) if reminder_set else None,
+        "folder_path": folder_path,
+    }
+
+
+def load_task_body(namespace, task: Dict[str, Any]) -> None:
+    """Fetch ``body``/``preview`` for a task produced by the table fast path."""
+    if task.get("body") is not None or not task.get("id"):
+        return
+    try:
+        item = namespace.GetItemFromID(task["id"])
+        body = getattr(item, "Body", "") or ""
+    except Exception:
+        logger.debug("Impossibile recuperare la descrizione dell'attività %s.", task.get("id"), exc_info=True)
+        body = ""
+    task["body"] = body
+    task["preview"] = build_body_preview(body, max_chars=220)
+
+
+def _get_tasks_via_table(folder, task_filter: Optional[str], max_items: int) -> Optional[List[Dict[str, Any]]]:
+    """Read task rows with a single ``GetArray`` call; ``None`` if tables are unavailable."""
+    try:
+        table = folder.GetTable(task_filter) if task_filter else folder.GetTable()
+        columns = table.Columns
+        columns.RemoveAll()
+        for column in TASK_TABLE_COLUMNS:
+            columns.Add(column)
+        table.Sort("[DueDate]", False)
+        rows = table.GetArray(max_items) or ()
+        truncated = not table.EndOfTable
+    except Exception as exc:
+        logger.debug("Tabella attività non disponibile, uso la lettura per elemento: %s", exc)
+        return None
+
+    try:
+        folder_path = folder.FolderPath or ""
+    except Exception:
+        folder_path = ""
+
+    tasks = [_format_task_row(TASK_TABLE_COLUMNS, row, folder_path) for row in rows]
+    if truncated:
+        logger.warning("Limite di %s attività raggiunto per la cartella.", max_items)
+    logger.debug("Recuperate %s attività dalla cartella (tabella).", len(tasks))
+    return tasks
+
+
+def _build_task_filter(
+    days: Optional[int],
+    include_completed: bool,
+    search_term: Optional[str],
+    use_content_index: bool = True,
+) -> Optional[str]:
+    """Combine every task predicate into a single DASL (``@SQL=``) filter.
+
+    Jet predicates (``[Complete] = False``) cannot be AND-ed with DASL ones, so
+    all conditions are expressed with DASL property names. ``ci_phrasematch``
+    relies on the store search index; ``use_content_index=False`` falls back
+    to ``LIKE`` for stores where indexing is unavailable.
+    """
+    clauses: List[str] = []
+
+    if days is not None and days > 0:
+        # DASL compares dates in UTC.
+        cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=days)
+        clauses.append(f"\"{PR_CREATION_TIME}\" >= '{cutoff.strftime('%m/%d/%Y %H:%M')}'")
+
+    if not include_completed:
+        clauses.append(f"\"{PID_LID_TASK_COMPLETE}\" = 0")
+
+    if search_term:
+        term = search_term.replace("'", "''")
+        if use_content_index:
+            search_clause = (
+                f"ci_phrasematch(\"{DASL_SUBJECT}\", '{term}') "
+                f"OR ci_phrasematch(\"{DASL_TEXT_DESCRIPTION}\", '{term}')"
+            )
+        else:
+            search_clause = f"\"{DASL_SUBJECT}\" LIKE '%{term}%' OR \"{DASL_TEXT_DESCRIPTION}\" LIKE '%{term}%'"
+        clauses.append(search_clause)
+
+    if not clauses:
+        return None
+    return "@SQL=" + " AND ".join(f"({clause})" for clause in clauses)
+
+
 def get_tasks_from_folder(
     folder,
     days: Optional[int] = None,
@@ -181,35 +389,33 @@ def get_tasks_from_folder(
     tasks = []
 
     try:
-        items = folder.Items
-        items.Sort("[DueDate]", False)  # Sort by due date, descending
-
-        # Build filter
-        filters = []
-
-        if days is not None and days > 0:
-            cutoff = datetime.datetime.now() - datetime.timedelta(days=days)
-            cutoff_str = cutoff.strftime("%m/%d/%Y")
-            filters.append(f"[CreationTime] >= '{cutoff_str}'")
-
-        if not include_completed:
-            filters.append("[Complete] = False")
-
+        candidate_filters = [_build_task_filter(days, include_completed, search_term)]
         if search_term:
-            # Simple search in subject and body
-            search_filter = f"@SQL=\"urn:schemas:httpmail:subject\" LIKE '%{search_term}%' OR \"urn:schemas:httpmail:textdescription\" LIKE '%{search_term}%'"
-            filters.append(search_filter)
+            candidate_filters.append(
+                _build_task_filter(days, include_completed, search_term, use_content_index=False)
+            )
+        max_items = MAX_TASKS_PER_FOLDER
 
-        # Apply combined filter
-        if filters:
-            combined_filter = " AND ".join(f"({f})" for f in filters)
+        for task_filter in candidate_filters:
+            table_tasks = _get_tasks_via_table(folder, task_filter, max_items)
+            if table_tasks is not None:
+                return table_tasks
+
+        # Restrict first, then sort only the (smaller) restricted collection.
+        items = folder.Items
+        for task_filter in candidate_filters:
+            if not task_filter:
+                break
             try:
-                items = items.Restrict(combined_filter)
+                items = folder.Items.Restrict(task_filter)
+                break
             except Exception as exc:
-                logger.warning("Filtro attività non riuscito, uso raccolta completa: %s", exc)
+                logger.warning("Filtro attività non riuscito (%s): %s", task_filter, exc)
+        else:
+            logger.warning("Nessun filtro attività applicabile, uso raccolta completa.")
+        items.Sort("[DueDate]", False)  # Sort by due date, ascending
 
         count = 0
-        max_items = 500  # Safety limit
 
         for item in items:
             if count >= max_items:
@@ -232,26 +438,104 @@ def get_tasks_from_folder(
     return tasks
 
 
+def _folder_ids_for_workers(folders: Sequence) -> Optional[List[Tuple[str, str]]]:
+    """Return ``(EntryID, StoreID)`` pairs when a parallel scan is possible."""
+    if len(folders) <= 1:
+        return None
+    folder_ids: List[Tuple[str, str]] = []
+    for folder in folders:
+        try:
+            entry_id = folder.EntryID
+            store_id = folder.StoreID
+        except Exception:
+            return None
+        if not entry_id or not store_id:
+            return None
+        folder_ids.append((entry_id, store_id))
+    return folder_ids
+
+
+def _collect_folder_tasks_in_worker(
+    entry_id: str,
+    store_id: str,
+    days: Optional[int],
+    include_completed: bool,
+    search_term: Optional[str],
+) -> List[Dict[str, Any]]:
+    """Read one task folder on a COM pool thread.
+
+    COM proxies cannot cross threads, so the folder is re-resolved by ID.
+    """
+    _, namespace = connect_to_outlook()
+    folder = namespace.GetFolderFromID(entry_id, store_id)
+    return get_tasks_from_folder(folder, days, include_completed, search_term)
+
+
+def _collect_tasks_in_parallel(
+    pool,
+    folder_ids: Sequence[Tuple[str, str]],
+    days: Optional[int],
+    include_completed: bool,
+    search_term: Optional[str],
+    collection_limit: Optional[int],
+) -> List[Dict[str, Any]]:
+    """Scan task folders concurrently, stopping once ``collection_limit`` is reached.
+
+    Results are consumed in folder order, so the limit cuts the same folders as the
+    serial scan whichever worker finishes first.
+    """
+    all_tasks: List[Dict[str, Any]] = []
+    futures = [
+        pool.submit(_collect_folder_tasks_in_worker, entry_id, store_id, days, include_completed, search_term)
+        for entry_id, store_id in folder_ids
+    ]
+    for position, future in enumerate(futures):
+        try:
+            all_tasks.extend(future.result())
+        except Exception as exc:
+            logger.warning("Errore nel processamento cartella attività: %s", exc)
+            continue
+        if collection_limit and len(all_tasks) >= collection_limit:
+            for pending in futures[position + 1:]:
+                pending.cancel()
+            break
+    return all_tasks
+
+
 def collect_tasks_across_folders(
     folders: Sequence,
     days: Optional[int] = None,
     include_completed: bool = False,
     search_term: Optional[str] = None,
     target_total: Optional[int] = None,
-) -> List[Dict[str, Any]]:
-    """Collect tasks from multiple folders and merge them."""
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Collect tasks from multiple folders and merge them.
+
+    Returns the sorted tasks together with how many were collected. With
+    ``target_total`` only the earliest ``target_total`` tasks are kept, while the
+    count still covers every collected task. Folder collection stops after a 4x
+    overshoot so the global ordering stays sensible.
+    """
     all_tasks: List[Dict[str, Any]] = []
+    collection_limit = target_total * 4 if target_total else None
+
+    pool = com_worker_pool()
+    folder_ids = _folder_ids_for_workers(folders) if pool is not None else None
+    if folder_ids is not None:
+        all_tasks = _collect_tasks_in_parallel(
+            pool, folder_ids, days, include_completed, search_term, collection_limit
+        )
+    else:
+        for folder in folders:
+            try:
+                folder_tasks = get_tasks_from_folder(folder, days, include_completed, search_term)
+                all_tasks.extend(folder_tasks)
 
-    for folder in folders:
-        try:
-            folder_tasks = get_tasks_from_folder(folder, days, include_completed, search_term)
-            all_tasks.extend(folder_tasks)
-
-            if target_total and len(all_tasks) >= target_total:
-                break
-        except Exception as exc:
-            logger.warning("Errore nel processamento cartella attività: %s", exc)
-            continue
+                if collection_limit and len(all_tasks) >= collection_limit:
+                    break
+            except Exception as exc:
+                logger.warning("Errore nel processamento cartella attività: %s", exc)
+                continue
 
     # Sort by due date (tasks without due date go to the end)
     def sort_key(task: Dict[str, Any]):
@@ -260,10 +544,37 @@ def collect_tasks_across_folders(
             return ("9999-99-99", task.get("subject", ""))
         return (due_date, task.get("subject", ""))
 
+    if target_total and len(all_tasks) > target_total:
+        collected = len(all_tasks)
+        all_tasks = heapq.nsmallest(target_total, all_tasks, key=sort_key)
+        logger.info(
+            "Raccolte %s attività totali da %s cartelle (mantenute le prime %s).",
+            collected,
+            len(folders),
+            target_total,
+        )
+        return all_tasks, collected
+
     all_tasks.sort(key=sort_key)
 
     logger.info("Raccolte %s attività totali da %s cartelle.", len(all_tasks), len(folders))
-    return all_tasks
+    return all_tasks, len(all_tasks)
+
+
+def _render_task(idx: int, task: Dict[str, Any], include_preview: bool) -> str:
+    """Render one listing entry, including its trailing blank line."""
+    details = f"Stato: {task.get('status', 'Sconosciuto')}"
+    percent = task.get("percent_complete") or 0
+    if percent > 0:
+        details += f" | {percent}%"
+    details += f" | Priorità: {task.get('priority', 'Normale')} | Scadenza: {task.get('due_date') or 'Nessuna scadenza'}"
+    categories = task.get("categories")
+    if categories:
+        details += f" | Categorie: {categories}"
+
+    preview = task.get("preview") if include_preview else None
+    preview_line = f"   Anteprima: {preview}\n" if preview else ""
+    return f"{idx}. {task.get('subject', '(Senza oggetto)')}\n   {details}\n{preview_line}"
 
 
 def present_task_listing(
@@ -272,59 +583,42 @@ def present_task_listing(
     max_results: int,
     include_preview: bool,
     log_context: str,
+    namespace: Any = None,
+    total_found: Optional[int] = None,
 ) -> str:
-    """Format tasks for presentation to the user."""
-    from outlook_mcp import task_cache, clear_task_cache
+    """Format tasks for presentation to the user.
 
+    When ``namespace`` is supplied, bodies skipped by the table fast path are
+    loaded for the visible tasks only, so previews stay available. ``total_found``
+    overrides ``len(tasks)`` when the list was already trimmed by the caller.
+    """
     clear_task_cache()
 
     if not tasks:
         return f"Nessuna attività trovata in {folder_display}."
 
     # Limit results
-    total_found = len(tasks)
+    total_found = max(total_found or 0, len(tasks))
     tasks_to_show = tasks[:max_results]
 
-    lines = [
-        f"Attività in {folder_display} (visualizzate {len(tasks_to_show)} di {total_found}):",
-        "",
-    ]
-
-    for idx, task in enumerate(tasks_to_show, start=1):
-        task_cache[idx] = task
-
-        subject = task.get("subject", "(Senza oggetto)")
-        status = task.get("status", "Sconosciuto")
-        priority = task.get("priority", "Normale")
-        due_date = task.get("due_date", "Nessuna scadenza")
-        percent = task.get("percent_complete", 0)
-        categories = task.get("categories", "")
-
-        line_parts = [f"{idx}. {subject}"]
-
-        details = []
-        details.append(f"Stato: {status}")
-        if percent > 0:
-            details.append(f"{percent}%")
-        details.append(f"Priorità: {priority}")
-        details.append(f"Scadenza: {due_date}")
-
-        if categories:
-            details.append(f"Categorie: {categories}")
-
-        lines.append(f"{line_parts[0]}")
-        lines.append(f"   {' | '.join(details)}")
-
-        if include_preview and task.get("preview"):
-            lines.append(f"   Anteprima: {task['preview']}")
+    if include_preview and namespace is not None:
+        for task in tasks_to_show:
+            load_task_body(namespace, task)
 
-        lines.append("")
+    task_cache.replace_all(enumerate(tasks_to_show, start=1))
 
-    if total_found > max_results:
-        lines.append(f"(Altre {total_found - max_results} attività non visualizzate)")
+    header = f"Attività in {folder_display} (visualizzate {len(tasks_to_show)} di {total_found}):"
+    body = "\n".join(
+        _render_task(idx, task, include_preview) for idx, task in enumerate(tasks_to_show, start=1)
+    )
+    footer = (
+        f"\n(Altre {total_found - max_results} attività non visualizzate)"
+        if total_found > max_results
+        else ""
+    )
 
     logger.info("%s ha presentato %s attività.", log_context, len(tasks_to_show))
-    return "\n".join(lines)
+    return f"{header}\n\n{body}{footer}"
 
 
 def parse_task_status(status_input: Optional[str]) -> Optional[int]:
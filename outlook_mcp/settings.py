@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Iterable, Pattern, Set
 
 from outlook_mcp.logger import logger
 
 _CONFIG_CACHE: dict | None = None
+_CONFIG_MTIME: int | None = None
 _PROMOTIONAL_CACHE: Set[str] | None = None
+_PROMOTIONAL_MATCHER: Pattern[str] | None = None
 
 DEFAULT_PROMOTIONAL_KEYWORDS: Iterable[str] = (
     "newsletter",
@@ -28,13 +31,31 @@ DEFAULT_PROMOTIONAL_KEYWORDS: Iterable[str] = (
 CONFIG_FILE = Path(__file__).resolve().parent.parent / "config.json"
 
 
+def _config_mtime() -> int | None:
+    try:
+        return CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def _load_raw_config() -> dict:
-    """Read the JSON config from disk, returning an empty dict on failure."""
-    global _CONFIG_CACHE
+    """Read the JSON config from disk, returning an empty dict on failure.
 
-    if _CONFIG_CACHE is not None:
+    The parsed file is reused until its modification time changes; derived
+    caches (promotional keywords/matcher) are dropped when it is reparsed.
+    """
+    global _CONFIG_CACHE, _CONFIG_MTIME, _PROMOTIONAL_CACHE, _PROMOTIONAL_MATCHER
+
+    mtime = _config_mtime()
+    if _CONFIG_CACHE is not None and mtime == _CONFIG_MTIME:
         return _CONFIG_CACHE
 
+    if _CONFIG_CACHE is not None:
+        logger.info("File di configurazione %s modificato. Ricarico le impostazioni.", CONFIG_FILE)
+    _PROMOTIONAL_CACHE = None
+    _PROMOTIONAL_MATCHER = None
+    _CONFIG_MTIME = mtime
+
     try:
         with CONFIG_FILE.open("r", encoding="utf-8") as handle:
             _CONFIG_CACHE = json.load(handle)
@@ -50,10 +71,10 @@ def _load_raw_config() -> dict:
 def get_promotional_keywords() -> Set[str]:
     """Return a normalized set of promotional keywords used to filter marketing emails."""
     global _PROMOTIONAL_CACHE
+    config = _load_raw_config()
     if _PROMOTIONAL_CACHE is not None:
         return _PROMOTIONAL_CACHE
 
-    config = _load_raw_config()
     filters_section = config.get("filters", {})
     raw_keywords = []
 
@@ -78,11 +99,31 @@ def get_promotional_keywords() -> Set[str]:
     return _PROMOTIONAL_CACHE
 
 
+def get_promotional_matcher() -> Pattern[str]:
+    """Return a compiled pattern matching any promotional keyword in a single scan."""
+    global _PROMOTIONAL_MATCHER
+    _load_raw_config()
+    if _PROMOTIONAL_MATCHER is not None:
+        return _PROMOTIONAL_MATCHER
+
+    # Longest keywords first so overlapping alternatives prefer the most specific one.
+    keywords = sorted(get_promotional_keywords(), key=lambda keyword: (-len(keyword), keyword))
+    _PROMOTIONAL_MATCHER = re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+    return _PROMOTIONAL_MATCHER
+
+
 def reload_settings() -> None:
     """Clear cached configuration so the next access reloads data from disk."""
-    global _CONFIG_CACHE, _PROMOTIONAL_CACHE
+    global _CONFIG_CACHE, _CONFIG_MTIME, _PROMOTIONAL_CACHE, _PROMOTIONAL_MATCHER
     _CONFIG_CACHE = None
+    _CONFIG_MTIME = None
     _PROMOTIONAL_CACHE = None
+    _PROMOTIONAL_MATCHER = None
 
 
-__all__ = ["get_promotional_keywords", "reload_settings", "DEFAULT_PROMOTIONAL_KEYWORDS"]
+__all__ = [
+    "get_promotional_keywords",
+    "get_promotional_matcher",
+    "reload_settings",
+    "DEFAULT_PROMOTIONAL_KEYWORDS",
+]
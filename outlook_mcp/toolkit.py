@@ -11,6 +11,8 @@ ToolBinder = Callable[[FastMCP], None]
 _tool_binders: List[ToolBinder] = []
 _registered = False
 _current_mcp: Optional[FastMCP] = None
+# Bumped on every (re)registration so callers can cache data derived from the tool list.
+_registration_generation = 0
 
 
 def mcp_tool(*decorator_args, **decorator_kwargs):
@@ -28,13 +30,14 @@ def mcp_tool(*decorator_args, **decorator_kwargs):
 
 def register_all_tools(mcp: FastMCP, *, force: bool = False) -> None:
     """Register all deferred tool definitions against the supplied FastMCP instance."""
-    global _registered, _current_mcp
+    global _registered, _current_mcp, _registration_generation
     if _registered and not force:
         return
     _current_mcp = mcp
     for binder in _tool_binders:
         binder(mcp)
     _registered = True
+    _registration_generation += 1
 
 
 def iter_registered_tool_binders() -> Iterable[ToolBinder]:
@@ -44,9 +47,15 @@ def iter_registered_tool_binders() -> Iterable[ToolBinder]:
 
 def reset_tool_registry() -> None:
     """Allow forcing a re-registration (used by configuration reloads)."""
-    global _registered, _current_mcp
+    global _registered, _current_mcp, _registration_generation
     _registered = False
     _current_mcp = None
+    _registration_generation += 1
+
+
+def get_registration_generation() -> int:
+    """Return a counter that changes whenever the tool registry is (re)built."""
+    return _registration_generation
 
 
 def get_current_mcp() -> FastMCP:
@@ -56,4 +65,11 @@ def get_current_mcp() -> FastMCP:
     return _current_mcp
 
 
-__all__ = ["mcp_tool", "register_all_tools", "iter_registered_tool_binders", "reset_tool_registry", "get_current_mcp"]
+__all__ = [
+    "mcp_tool",
+    "register_all_tools",
+    "iter_registered_tool_binders",
+    "reset_tool_registry",
+    "get_registration_generation",
+    "get_current_mcp",
+]
@@ -7,21 +7,92 @@ This module exposes two tools:
 
 from __future__ import annotations
 
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Set, Tuple
+import itertools
 import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool  # FastMCP
 
 from outlook_mcp import logger
-from outlook_mcp.utils import coerce_bool, ensure_string_list, safe_filename, safe_entry_id, obfuscate_identifier
+from outlook_mcp.constants import OL_BY_VALUE, PR_ATTACH_DATA_BIN, PR_ATTACH_LONG_FILENAME, PR_ATTACH_SIZE
+from outlook_mcp.com import run_in_com_thread
+from outlook_mcp.utils import coerce_bool, ensure_string_list, safe_filename, safe_entry_id, obfuscate_identifier, unique_strings
 from outlook_mcp.services.email import resolve_mail_item
 from mcp.server.fastmcp.exceptions import ToolError
 
 
+# PR_ATTACH_SIZE is a signed 32-bit PT_LONG. pywin32 hands a VT_ERROR element back as a
+# plain int holding the SCODE (e.g. MAPI_E_NOT_FOUND), which is negative as a signed value
+# and at least 0x80000000 as an unsigned one: neither can be a real size.
+_MAX_ATTACHMENT_SIZE = 0x7FFFFFFF
+
+
+def _is_attachment_size(value: Any) -> bool:
+    """Tell a real PR_ATTACH_SIZE value apart from a missing property's error code."""
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= _MAX_ATTACHMENT_SIZE
+
+
+def _read_attachment_header(attachment, position: int) -> Tuple[Any, Any, Any]:
+    """Return ``(name, size, property_accessor)`` for an attachment.
+
+    Name and size come from one ``GetProperties`` call; the accessor is handed back so
+    a download can reuse it. Missing MAPI properties come back as error codes (ints
+    for the size), in which case the object model properties are read instead.
+    """
+    accessor = None
+    name = size = None
+    try:
+        accessor = attachment.PropertyAccessor
+        name, size = accessor.GetProperties((PR_ATTACH_LONG_FILENAME, PR_ATTACH_SIZE))
+    except Exception:
+        logger.debug("GetProperties non disponibile per l'allegato %s.", position, exc_info=True)
+    if not isinstance(name, str):
+        name = getattr(attachment, "FileName", f"Allegato {position}")
+    if not _is_attachment_size(size):
+        size = getattr(attachment, "Size", None)
+    return name, size, accessor
+
+
+def _save_attachment(attachment, destination: str, accessor: Any = None) -> None:
+    """Write an attachment to ``destination``.
+
+    Plain file attachments are read through PR_ATTACH_DATA_BIN and written in one
+    pass; embedded items, OLE objects and oversized properties use SaveAsFile.
+    """
+    data = None
+    try:
+        if getattr(attachment, "Type", None) == OL_BY_VALUE:
+            data = (accessor or attachment.PropertyAccessor).GetProperty(PR_ATTACH_DATA_BIN)
+    except Exception:
+        logger.debug("PR_ATTACH_DATA_BIN non disponibile, uso SaveAsFile.", exc_info=True)
+        data = None
+    if data is None:
+        attachment.SaveAsFile(destination)
+        return
+    with open(destination, "wb") as handle:
+        handle.write(bytes(data))
+
+
+def _unique_filename(safe_name: str, existing_names: Set[str]) -> str:
+    """Return ``safe_name`` or a variant with a short random suffix not yet taken.
+
+    ``existing_names`` holds ``os.path.normcase``-d names (case-insensitive on Windows).
+    """
+    if os.path.normcase(safe_name) not in existing_names:
+        return safe_name
+    base, ext = os.path.splitext(safe_name)
+    while True:
+        candidate = f"{base}_{secrets.token_hex(3)}{ext}"
+        if os.path.normcase(candidate) not in existing_names:
+            return candidate
+
+
 @mcp_tool()
 @feature_gate(group="attachments")
-def get_attachments(
+async def get_attachments(
     email_number: Optional[int] = None,
     message_id: Optional[str] = None,
     save_to: Optional[str] = None,
@@ -37,6 +108,17 @@ def get_attachments(
         download: Se True, salva i file su disco in `save_to`
         limit: Massimo numero di allegati da processare
     """
+    # COM round trips and disk writes run on the COM worker thread, off the event loop.
+    return await run_in_com_thread(_get_attachments, email_number, message_id, save_to, download, limit)
+
+
+def _get_attachments(
+    email_number: Optional[int],
+    message_id: Optional[str],
+    save_to: Optional[str],
+    download: bool,
+    limit: Optional[int],
+) -> str:
     try:
         download_bool = coerce_bool(download)
         if limit is not None:
@@ -69,14 +151,19 @@ def get_attachments(
         except ToolError as exc:
             return f"Errore: {exc}"
 
-        if not hasattr(mail_item, "Attachments") or mail_item.Attachments.Count == 0:
+        attachments = getattr(mail_item, "Attachments", None)
+        total_attachments = attachments.Count if attachments is not None else 0
+        if not total_attachments:
             return "Questo messaggio non contiene allegati."
 
-        total_attachments = mail_item.Attachments.Count
         max_index = total_attachments if limit_value is None else min(total_attachments, limit_value)
 
+        existing_names: Set[str] = set()
         if download_bool and save_to:
             os.makedirs(save_to, exist_ok=True)
+            # One directory snapshot instead of an exists() probe per candidate name.
+            with os.scandir(save_to) as entries:
+                existing_names = {os.path.normcase(entry.name) for entry in entries}
 
         lines = [
             f"Allegati trovati: {total_attachments} (mostrati {max_index}).",
@@ -84,31 +171,25 @@ def get_attachments(
         ]
         saved_paths: List[str] = []
 
-        for position in range(1, max_index + 1):
-            attachment = mail_item.Attachments(position)
-            name = getattr(attachment, "FileName", f"Allegato {position}")
-            size = getattr(attachment, "Size", None)
+        # Enumerate the collection once instead of an indexed COM call per attachment.
+        for position, attachment in enumerate(itertools.islice(attachments, max_index), start=1):
+            name, size, accessor = _read_attachment_header(attachment, position)
             size_text = f"{size} byte" if isinstance(size, int) else "dimensione sconosciuta"
             lines.append(f"- {name} ({size_text})")
 
             if download_bool and save_to:
-                safe_name = safe_filename(name or f"allegato_{position}")
-                base, ext = os.path.splitext(safe_name)
+                safe_name = _unique_filename(safe_filename(name or f"allegato_{position}"), existing_names)
+                existing_names.add(os.path.normcase(safe_name))
                 destination = os.path.join(save_to, safe_name)
-                counter = 1
-                while os.path.exists(destination):
-                    destination = os.path.join(save_to, f"{base}_{counter}{ext}")
-                    counter += 1
                 try:
-                    attachment.SaveAsFile(destination)
+                    _save_attachment(attachment, destination, accessor)
                     saved_paths.append(destination)
                 except Exception as exc:
                     logger.exception("Impossibile salvare l'allegato %s.", name)
                     lines.append(f"  * Errore nel salvataggio: {exc}")
 
         if download_bool and saved_paths:
-            lines.append("")
-            lines.append("Allegati salvati in:")
+            lines.extend(("", "Allegati salvati in:"))
             lines.extend(f"- {path}" for path in saved_paths)
 
         return "\n".join(lines)
@@ -117,9 +198,50 @@ def get_attachments(
         return f"Errore durante la gestione degli allegati: {exc}"
 
 
+def _list_directory(directory: str) -> Optional[Set[str]]:
+    """Return the normcase-d names in ``directory``, or None when it cannot be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries}
+    except OSError:
+        return None
+
+
+def _absolute_path(path_value: str) -> str:
+    # abspath() calls getcwd() even for paths that are already absolute.
+    if os.path.isabs(path_value):
+        return os.path.normpath(os.fspath(path_value))
+    return os.path.abspath(path_value)
+
+
+def _first_missing_path(absolute_paths: List[str], split_paths: List[Tuple[str, str]]) -> Optional[str]:
+    """Return the first path that does not exist, listing each parent directory once.
+
+    ``split_paths`` holds the ``os.path.split`` of each absolute path, computed by the
+    caller so the base names can be reused. Distinct directories (often on different
+    shares) are listed concurrently. A name missing from its listing, or in a directory
+    that cannot be listed (traverse-only shares), is checked with ``os.path.exists``
+    before being reported: 8.3 short names never appear in a listing.
+    """
+    directories = list(dict.fromkeys(directory for directory, _ in split_paths))
+    if len(directories) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(directories))) as executor:
+            listings = dict(zip(directories, executor.map(_list_directory, directories)))
+    else:
+        listings = {directory: _list_directory(directory) for directory in directories}
+
+    for absolute, (directory, name) in zip(absolute_paths, split_paths):
+        listing = listings[directory]
+        if listing is not None and os.path.normcase(name) in listing:
+            continue
+        if not os.path.exists(absolute):
+            return absolute
+    return None
+
+
 @mcp_tool()
 @feature_gate(group="attachments")
-def attach_to_email(
+async def attach_to_email(
     attachments: Any,
     email_number: Optional[int] = None,
     message_id: Optional[str] = None,
@@ -133,6 +255,16 @@ def attach_to_email(
         message_id: EntryID del messaggio (se non si usa email_number)
         send: Se True, invia subito il messaggio dopo l'allegato
     """
+    # Attachments.Add/Save/Send can block for seconds: keep them off the event loop.
+    return await run_in_com_thread(_attach_to_email, attachments, email_number, message_id, send)
+
+
+def _attach_to_email(
+    attachments: Any,
+    email_number: Optional[int],
+    message_id: Optional[str],
+    send: bool,
+) -> str:
     try:
         attachment_paths = ensure_string_list(attachments)
         if not attachment_paths:
@@ -154,14 +286,22 @@ def attach_to_email(
         except ToolError as exc:
             return f"Errore: {exc}"
 
+        # The same file listed twice would cost a second Attachments.Add round trip.
+        absolute_paths = unique_strings(
+            (_absolute_path(path_value) for path_value in attachment_paths), key=os.path.normcase
+        )
+        split_paths = [os.path.split(absolute) for absolute in absolute_paths]
+        missing_path = _first_missing_path(absolute_paths, split_paths)
+        if missing_path:
+            return f"Errore: file '{missing_path}' non trovato."
+
         attached_files: List[str] = []
-        for path_value in attachment_paths:
-            absolute = os.path.abspath(path_value)
-            if not os.path.exists(absolute):
-                return f"Errore: file '{absolute}' non trovato."
+        basenames: List[str] = []
+        for absolute, (_, name) in zip(absolute_paths, split_paths):
             try:
-                mail_item.Attachments.Add(absolute)
+                mail_item.Attachments.Add(absolute, OL_BY_VALUE)
                 attached_files.append(absolute)
+                basenames.append(name)
             except Exception as exc:
                 logger.exception("Impossibile allegare il file %s.", absolute)
                 return f"Errore: impossibile allegare '{absolute}' ({exc})."
@@ -188,7 +328,7 @@ def attach_to_email(
         except Exception:
             pass
         return (
-            f"Allegati aggiunti al messaggio ({', '.join(os.path.basename(p) for p in attached_files)}). "
+            f"Allegati aggiunti al messaggio ({', '.join(basenames)}). "
             f"(message_id={reference_id})"
         )
     except Exception as exc:
@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Tuple
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool
 
 from outlook_mcp import logger
-from outlook_mcp.utils import coerce_bool
+from outlook_mcp.utils import coerce_bool, truncate_text
 from outlook_mcp import MAX_EVENT_LOOKAHEAD_DAYS
 
 # Reuse server helpers to avoid duplication
 from outlook_mcp.services.calendar import (
     get_all_calendar_folders,
     get_calendar_folder_by_name,
+    get_default_calendar_folder,
     collect_events_across_calendars,
     get_events_from_folder,
     present_event_listing,
@@ -28,7 +29,28 @@ def _connect():
 
 
 def _get_calendar_folder(namespace, calendar_name: Optional[str]):
-    return get_calendar_folder_by_name(namespace, calendar_name) if calendar_name else namespace.GetDefaultFolder(9)
+    return get_calendar_folder_by_name(namespace, calendar_name) if calendar_name else get_default_calendar_folder(namespace)
+
+
+EventSource = Tuple[Optional[List[Dict[str, Any]]], str]
+
+
+def _events_from_all_calendars(namespace, calendar_name: Optional[str], days: int, search_term: Optional[str]) -> EventSource:
+    calendars = get_all_calendar_folders(namespace)
+    return collect_events_across_calendars(calendars, days, search_term), "Tutti i calendari"
+
+
+def _events_from_single_calendar(namespace, calendar_name: Optional[str], days: int, search_term: Optional[str]) -> EventSource:
+    """Read one calendar; returns ``(None, ...)`` when ``calendar_name`` does not exist."""
+    calendar_folder = _get_calendar_folder(namespace, calendar_name)
+    if not calendar_folder:
+        return None, calendar_name or "Calendario"
+    calendar_display = calendar_folder.Name if calendar_name else "Calendario"
+    return get_events_from_folder(calendar_folder, days, search_term), calendar_display
+
+
+# Picked once per call from include_all_calendars; neither source re-checks the flag.
+_EVENT_SOURCES = {True: _events_from_all_calendars, False: _events_from_single_calendar}
 
 
 @mcp_tool()
@@ -62,16 +84,9 @@ def list_upcoming_events(
     try:
         _, namespace = _connect()
 
-        if include_all:
-            calendars = get_all_calendar_folders(namespace)
-            events = collect_events_across_calendars(calendars, days)
-            calendar_display = "Tutti i calendari"
-        else:
-            calendar_folder = _get_calendar_folder(namespace, calendar_name)
-            if not calendar_folder:
-                return f"Errore: calendario '{calendar_name}' non trovato"
-            calendar_display = calendar_folder.Name if calendar_name else "Calendario"
-            events = get_events_from_folder(calendar_folder, days)
+        events, calendar_display = _EVENT_SOURCES[include_all](namespace, calendar_name, days, None)
+        if events is None:
+            return f"Errore: calendario '{calendar_name}' non trovato"
 
         return present_event_listing(
             events=events,
@@ -123,16 +138,9 @@ def search_calendar_events(
     try:
         _, namespace = _connect()
 
-        if include_all:
-            calendars = get_all_calendar_folders(namespace)
-            events = collect_events_across_calendars(calendars, days, search_term)
-            calendar_display = "Tutti i calendari"
-        else:
-            calendar_folder = _get_calendar_folder(namespace, calendar_name)
-            if not calendar_folder:
-                return f"Errore: calendario '{calendar_name}' non trovato"
-            calendar_display = calendar_folder.Name if calendar_name else "Calendario"
-            events = get_events_from_folder(calendar_folder, days, search_term)
+        events, calendar_display = _EVENT_SOURCES[include_all](namespace, calendar_name, days, search_term)
+        if events is None:
+            return f"Errore: calendario '{calendar_name}' non trovato"
 
         return present_event_listing(
             events=events,
@@ -151,6 +159,38 @@ def search_calendar_events(
         return f"Errore durante la ricerca degli eventi: {str(e)}"
 
 
+_OPTIONAL_EVENT_DETAILS = (
+    ("required_attendees", "Partecipanti obbligatori"),
+    ("optional_attendees", "Partecipanti facoltativi"),
+    ("categories", "Categorie"),
+    ("preview", "Anteprima descrizione"),
+)
+
+
+def _render_event_details(event: Dict[str, Any]) -> str:
+    """Render the detail block shown by get_event_by_number (without its header)."""
+    lines = [
+        f"Oggetto: {event.get('subject', '(Senza oggetto)')}",
+        f"Inizio: {event.get('start_time', 'Sconosciuto')}",
+        f"Fine: {event.get('end_time', 'Sconosciuto')}",
+        f"Luogo: {event.get('location', '') or 'Non specificato'}",
+        f"Organizzatore: {event.get('organizer', 'Non disponibile')}",
+        f"Calendario: {event.get('folder_path', '')}",
+        f"Giornata intera: {'Si' if event.get('all_day') else 'No'}",
+    ]
+
+    lines.extend(
+        f"{label}: {event[key]}" for key, label in _OPTIONAL_EVENT_DETAILS if event.get(key)
+    )
+
+    body_content = event.get("body", "")
+    if body_content:
+        body_content = truncate_text(body_content, 4000, "[Descrizione troncata per brevita]")
+
+    lines.extend(("", "Descrizione completa:", body_content or "(Nessuna descrizione)"))
+    return "\n".join(lines)
+
+
 @mcp_tool()
 @feature_gate(group="calendar.read")
 def get_event_by_number(event_number: int) -> str:
@@ -169,36 +209,12 @@ def get_event_by_number(event_number: int) -> str:
         event = calendar_cache[event_number]
         logger.info("Recupero dettagli completi per l'evento #%s.", event_number)
 
-        lines = [
-            f"Dettagli evento #{event_number}:",
-            "",
-            f"Oggetto: {event.get('subject', '(Senza oggetto)')}",
-            f"Inizio: {event.get('start_time', 'Sconosciuto')}",
-            f"Fine: {event.get('end_time', 'Sconosciuto')}",
-            f"Luogo: {event.get('location', '') or 'Non specificato'}",
-            f"Organizzatore: {event.get('organizer', 'Non disponibile')}",
-            f"Calendario: {event.get('folder_path', '')}",
-            f"Giornata intera: {'Si' if event.get('all_day') else 'No'}",
-        ]
-
-        if event.get("required_attendees"):
-            lines.append(f"Partecipanti obbligatori: {event['required_attendees']}")
-        if event.get("optional_attendees"):
-            lines.append(f"Partecipanti facoltativi: {event['optional_attendees']}")
-        if event.get("categories"):
-            lines.append(f"Categorie: {event['categories']}")
-        if event.get("preview"):
-            lines.append(f"Anteprima descrizione: {event['preview']}")
-
-        body_content = event.get("body", "")
-        if body_content and len(body_content) > 4000:
-            body_content = body_content[:4000].rstrip() + "\n[Descrizione troncata per brevita]"
-
-        lines.append("")
-        lines.append("Descrizione completa:")
-        lines.append(body_content or "(Nessuna descrizione)")
-
-        return "\n".join(lines)
+        details = event.get("_details_rendered")
+        if details is None:
+            # Cached events are replaced on every listing/write, so the rendering can be memoized.
+            details = _render_event_details(event)
+            event["_details_rendered"] = details
+        return f"Dettagli evento #{event_number}:\n\n{details}"
     except Exception as e:
         logger.exception("Errore nel recupero dei dettagli per l'evento #%s.", event_number)
         return f"Errore durante il recupero dei dettagli dell'evento: {str(e)}"
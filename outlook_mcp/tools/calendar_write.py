@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import datetime
+import time
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool
 
-from outlook_mcp import logger, clear_calendar_cache, calendar_cache
-from outlook_mcp.utils import ensure_string_list, ensure_naive_datetime, safe_entry_id, to_python_datetime
+from outlook_mcp import logger, calendar_cache
+from outlook_mcp.com import run_in_com_thread
+from outlook_mcp.constants import (
+    OL_APPOINTMENT_ITEM,
+    OL_FOLDER_CALENDAR,
+    OL_MEETING,
+    OL_MEETING_RECEIVED,
+    OL_REQUIRED,
+)
+from outlook_mcp.utils import (
+    coerce_bool,
+    ensure_string_list,
+    ensure_naive_datetime,
+    safe_entry_id,
+    to_python_datetime,
+    unique_strings,
+)
 from outlook_mcp.services.common import parse_datetime_string
-from outlook_mcp.services.calendar import get_calendar_folder_by_name
+from outlook_mcp.services.calendar import get_calendar_folder_by_name, invalidate_calendar_entry
 
 
 def _connect():
@@ -25,12 +41,22 @@ def _parse_dt(value: Optional[str]):
 
 
 def _calendar_by_name(namespace, name: Optional[str]):
-    return get_calendar_folder_by_name(namespace, name) if name else namespace.GetDefaultFolder(9)
+    return get_calendar_folder_by_name(namespace, name) if name else namespace.GetDefaultFolder(OL_FOLDER_CALENDAR)
+
+
+# astimezone() yields a fixed UTC offset, so the value is only reused briefly to follow DST changes.
+_LOCAL_TZ_TTL_SECONDS = 60.0
+_local_tz_cache: Optional[Tuple[float, datetime.tzinfo]] = None
 
 
 def _local_timezone() -> datetime.tzinfo:
-    tz = datetime.datetime.now().astimezone().tzinfo
-    return tz or datetime.timezone.utc
+    global _local_tz_cache
+    now = time.monotonic()
+    if _local_tz_cache is not None and now - _local_tz_cache[0] < _LOCAL_TZ_TTL_SECONDS:
+        return _local_tz_cache[1]
+    tz = datetime.datetime.now().astimezone().tzinfo or datetime.timezone.utc
+    _local_tz_cache = (now, tz)
+    return tz
 
 
 def _ensure_local(dt: datetime.datetime) -> datetime.datetime:
@@ -57,7 +83,7 @@ def _safe_set_datetime_attr(item, attr_name: str, value: Optional[datetime.datet
 
 @mcp_tool()
 @feature_gate(group="calendar.write")
-def create_calendar_event(
+async def create_calendar_event(
     subject: str,
     start_time: str,
     duration_minutes: Optional[int] = 60,
@@ -70,6 +96,142 @@ def create_calendar_event(
     send_invitations: bool = True,
 ) -> str:
     """Crea un nuovo evento di calendario e, se richiesto, invia gli inviti."""
+    # Save/Send/Move are blocking MAPI round trips: run them on the COM worker thread.
+    return await run_in_com_thread(
+        _create_calendar_event,
+        subject,
+        start_time,
+        duration_minutes,
+        location,
+        body,
+        attendees,
+        reminder_minutes,
+        calendar_name,
+        all_day,
+        send_invitations,
+    )
+
+
+_BULK_EVENT_FIELDS = (
+    "subject",
+    "start_time",
+    "duration_minutes",
+    "location",
+    "body",
+    "attendees",
+    "reminder_minutes",
+    "calendar_name",
+    "all_day",
+    "send_invitations",
+)
+_BULK_EVENT_DEFAULTS: Dict[str, Any] = {
+    "duration_minutes": 60,
+    "location": None,
+    "body": None,
+    "attendees": None,
+    "reminder_minutes": 15,
+    "calendar_name": None,
+    "all_day": False,
+    "send_invitations": True,
+}
+_BULK_EVENT_TEXT_FIELDS = ("location", "body", "calendar_name")
+_BULK_EVENT_INT_FIELDS = ("duration_minutes", "reminder_minutes")
+MAX_BULK_EVENTS = 50
+
+
+@mcp_tool()
+@feature_gate(group="calendar.write")
+async def create_calendar_events_bulk(events: List[Dict[str, Any]]) -> str:
+    """Crea più eventi di calendario in un'unica chiamata.
+
+    Args:
+        events: Lista (max 50) di oggetti con gli stessi campi di create_calendar_event
+            (subject e start_time obbligatori).
+    """
+    # One hop to the COM thread for the whole batch; events are created in request order
+    # so the report lists them by their position in ``events``.
+    return await run_in_com_thread(_create_calendar_events_bulk, events)
+
+
+def _create_calendar_events_bulk(events: Any) -> str:
+    if not isinstance(events, list) or not events:
+        return "Errore: 'events' deve essere una lista non vuota di eventi."
+    if len(events) > MAX_BULK_EVENTS:
+        return f"Errore: al massimo {MAX_BULK_EVENTS} eventi per chiamata."
+
+    logger.info("create_calendar_events_bulk chiamato con %s eventi.", len(events))
+    successes: List[str] = []
+    failures: List[str] = []
+    for position, event in enumerate(events, 1):
+        if not isinstance(event, dict):
+            failures.append(f"evento {position}: deve essere un oggetto con i campi dell'evento")
+            continue
+        unknown = sorted(set(event) - set(_BULK_EVENT_FIELDS))
+        if unknown:
+            failures.append(f"evento {position}: campi non riconosciuti ({', '.join(unknown)})")
+            continue
+        params = {**_BULK_EVENT_DEFAULTS, **event}
+        problem = _bulk_event_problem(params)
+        if problem:
+            failures.append(f"evento {position}: {problem}")
+            continue
+        params["all_day"] = coerce_bool(params["all_day"])
+        params["send_invitations"] = coerce_bool(params["send_invitations"])
+        try:
+            outcome = _create_calendar_event(*(params[field] for field in _BULK_EVENT_FIELDS))
+        except Exception as exc:
+            logger.exception("Creazione dell'evento %s del lotto non riuscita.", position)
+            failures.append(f"evento {position}: errore imprevisto ({exc})")
+            continue
+        if outcome.startswith("Errore"):
+            failures.append(f"evento {position}: {outcome}")
+        else:
+            successes.append(f"evento {position}: {outcome.splitlines()[0]}")
+
+    result_lines = [
+        f"Eventi creati: {len(successes)}",
+        f"Eventi non creati: {len(failures)}",
+    ]
+    if successes:
+        result_lines.append("")
+        result_lines.append("Dettagli riusciti:")
+        result_lines.extend(f"- {line}" for line in successes)
+    if failures:
+        result_lines.append("")
+        result_lines.append("Errori:")
+        result_lines.extend(f"- {line}" for line in failures)
+    return "\n".join(result_lines)
+
+
+def _bulk_event_problem(params: Dict[str, Any]) -> Optional[str]:
+    """Return why a bulk event entry cannot be passed to _create_calendar_event, if anything."""
+    for field in ("subject", "start_time"):
+        if not isinstance(params.get(field), str) or not params[field].strip():
+            return f"'{field}' deve essere un testo non vuoto"
+    for field in _BULK_EVENT_TEXT_FIELDS:
+        if params[field] is not None and not isinstance(params[field], str):
+            return f"'{field}' deve essere un testo"
+    for field in _BULK_EVENT_INT_FIELDS:
+        value = params[field]
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int)):
+            return f"'{field}' deve essere un intero"
+    if params["attendees"] is not None and not isinstance(params["attendees"], (str, list)):
+        return "'attendees' deve essere un testo o una lista di indirizzi"
+    return None
+
+
+def _create_calendar_event(
+    subject: str,
+    start_time: str,
+    duration_minutes: Optional[int],
+    location: Optional[str],
+    body: Optional[str],
+    attendees: Optional[Any],
+    reminder_minutes: Optional[int],
+    calendar_name: Optional[str],
+    all_day: bool,
+    send_invitations: bool,
+) -> str:
     if not subject or not subject.strip():
         return "Errore: specifica un oggetto ('subject') per l'evento."
 
@@ -77,8 +239,8 @@ def create_calendar_event(
     if not start_dt:
         return "Errore: 'start_time' deve essere una data valida (es. '2025-10-20 10:30')."
 
-    all_day_bool = bool(all_day)
-    send_bool = bool(send_invitations)
+    all_day_bool = coerce_bool(all_day)
+    send_bool = coerce_bool(send_invitations)
 
     if not all_day_bool:
         if duration_minutes is None:
@@ -93,7 +255,7 @@ def create_calendar_event(
     else:
         duration_value = None
 
-    attendee_list = ensure_string_list(attendees)
+    attendee_list = unique_strings(ensure_string_list(attendees), key=str.lower)
 
     reminder_set = False
     reminder_value: Optional[int] = None
@@ -126,10 +288,20 @@ def create_calendar_event(
             if not target_calendar:
                 return f"Errore: calendario '{calendar_name}' non trovato."
         else:
-            target_calendar = namespace.GetDefaultFolder(9)  # olFolderCalendar
+            target_calendar = namespace.GetDefaultFolder(OL_FOLDER_CALENDAR)
 
         calendar_display = getattr(target_calendar, "Name", "Calendario")
-        appointment = outlook.CreateItem(1)  # olAppointmentItem
+        needs_move = False
+        if calendar_name:
+            # Created in place, the item is written once instead of saved and then moved.
+            try:
+                appointment = target_calendar.Items.Add("IPM.Appointment")
+            except Exception:
+                logger.debug("Items.Add non riuscito nel calendario '%s', uso CreateItem.", calendar_display, exc_info=True)
+                appointment = outlook.CreateItem(OL_APPOINTMENT_ITEM)
+                needs_move = True
+        else:
+            appointment = outlook.CreateItem(OL_APPOINTMENT_ITEM)
 
         subject_clean = subject.strip()
         appointment.Subject = subject_clean
@@ -155,16 +327,26 @@ def create_calendar_event(
             appointment.Body = body
 
         if attendee_list:
-            appointment.MeetingStatus = 1  # olMeeting
-            for email in attendee_list:
-                if not email:
-                    continue
+            appointment.MeetingStatus = OL_MEETING
+            recipients = appointment.Recipients
+            added = []
+            for email in attendee_list:  # ensure_string_list already drops empty entries
                 try:
-                    recipient = appointment.Recipients.Add(email)
-                    if hasattr(recipient, "Type"):
-                        recipient.Type = 1  # Required attendee
+                    added.append((email, recipients.Add(email)))
                 except Exception as exc:
                     logger.warning("Impossibile aggiungere il destinatario '%s': %s", email, exc)
+            # Assigned directly: a hasattr() probe would cost an extra property read per attendee.
+            for email, recipient in added:
+                try:
+                    recipient.Type = OL_REQUIRED
+                except Exception as exc:
+                    logger.warning("Impossibile impostare il tipo del destinatario '%s': %s", email, exc)
+            # Resolve every address in one address-book pass instead of one lookup per recipient.
+            try:
+                if not recipients.ResolveAll():
+                    logger.warning("Alcuni destinatari non sono stati risolti nella rubrica.")
+            except Exception as exc:
+                logger.warning("Risoluzione dei destinatari non riuscita: %s", exc)
 
         appointment.ReminderSet = reminder_set
         if reminder_set and reminder_value is not None:
@@ -176,7 +358,7 @@ def create_calendar_event(
             logger.exception("Salvataggio dell'appuntamento fallito.")
             return f"Errore: impossibile salvare l'evento ({exc})."
 
-        if calendar_name:
+        if needs_move:
             try:
                 moved = appointment.Move(target_calendar)
                 if moved:
@@ -200,14 +382,13 @@ def create_calendar_event(
             actual_local = ensure_naive_datetime(to_python_datetime(getattr(appointment, "Start", None)))
             if actual_local and abs((actual_local - desired_local).total_seconds()) >= 60:
                 try:
+                    # Outlook keeps Duration when Start moves and derives End from both.
                     appointment.Start = desired_local
-                    minutes = appointment.Duration or duration_value or 60
-                    appointment.Duration = minutes
                     appointment.Save()
                 except Exception:
                     logger.debug("Correzione orario evento non riuscita.", exc_info=True)
 
-        clear_calendar_cache()
+        # A new event does not renumber the current listing, so the event cache stays valid.
 
         entry_id = safe_entry_id(appointment) or "N/D"
         display_start = normalized_start if all_day_bool and normalized_start else ensure_naive_datetime(to_python_datetime(getattr(appointment, "Start", None))) or local_start
@@ -251,9 +432,9 @@ def move_calendar_event(
             number = int(event_number)
         except (TypeError, ValueError):
             return "Errore: 'event_number' deve essere un intero."
-        if number not in calendar_cache:
+        cached_event = calendar_cache.get(number)
+        if cached_event is None:
             return "Errore: evento non trovato nella cache corrente. Elenca gli eventi e riprova."
-        cached_event = calendar_cache[number]
         target_id = cached_event.get("id")
         if not target_id:
             return "Errore: l'evento selezionato non espone un EntryID valido."
@@ -292,6 +473,8 @@ def move_calendar_event(
             return f"Errore: impossibile recuperare l'evento (EntryID={target_id}): {exc}"
 
         desired_local_target: Optional[datetime.datetime] = None
+        # Moving or rescheduling never toggles all-day, so one COM read serves every branch.
+        is_all_day = bool(getattr(appointment, "AllDayEvent", False))
 
         if new_start_time:
             parsed_start = _parse_dt(new_start_time)
@@ -299,7 +482,7 @@ def move_calendar_event(
                 return "Errore: 'new_start_time' non è in un formato valido (usa es. '2025-10-23 09:00')."
             local_start_tz = _ensure_local(parsed_start)
             local_start = ensure_naive_datetime(local_start_tz) or parsed_start
-            if getattr(appointment, "AllDayEvent", False):
+            if is_all_day:
                 normalized = local_start.replace(hour=0, minute=0, second=0, microsecond=0)
                 appointment.Start = normalized
                 _safe_set_datetime_attr(appointment, "End", normalized + datetime.timedelta(days=1))
@@ -307,7 +490,7 @@ def move_calendar_event(
                 appointment.Start = local_start
                 desired_local_target = local_start
 
-        if duration_value is not None and not getattr(appointment, "AllDayEvent", False):
+        if duration_value is not None and not is_all_day:
             appointment.Duration = duration_value
 
         if new_location:
@@ -333,7 +516,7 @@ def move_calendar_event(
             logger.exception("Salvataggio dell'evento aggiornato fallito.")
             return f"Errore: impossibile salvare le modifiche all'evento ({exc})."
 
-        if send_bool and getattr(appointment, "MeetingStatus", 0) in (1, 3):  # olMeeting / olMeetingReceivedAndCanceled
+        if send_bool and getattr(appointment, "MeetingStatus", 0) in (OL_MEETING, OL_MEETING_RECEIVED):
             try:
                 appointment.Send()
             except Exception as exc:
@@ -343,24 +526,23 @@ def move_calendar_event(
                     f"({exc})."
                 )
 
-        if desired_local_target and not getattr(appointment, "AllDayEvent", False):
-            actual_local = ensure_naive_datetime(to_python_datetime(getattr(appointment, "Start", None)))
-            if actual_local and abs((actual_local - desired_local_target).total_seconds()) >= 60:
+        current_start = ensure_naive_datetime(to_python_datetime(getattr(appointment, "Start", None)))
+        if desired_local_target and not is_all_day:
+            if current_start and abs((current_start - desired_local_target).total_seconds()) >= 60:
                 try:
+                    # Outlook keeps Duration when Start moves and derives End from both.
                     appointment.Start = desired_local_target
-                    minutes = appointment.Duration or duration_value or 60
-                    appointment.Duration = minutes
                     appointment.Save()
+                    current_start = desired_local_target
                 except Exception:
                     logger.debug("Correzione orario evento durante lo spostamento non riuscita.", exc_info=True)
 
-        clear_calendar_cache()
+        invalidate_calendar_entry(target_id, appointment)
 
         summary_lines = ["Evento aggiornato con successo."]
-        current_start = ensure_naive_datetime(to_python_datetime(getattr(appointment, "Start", None)))
         if current_start:
             summary_lines.append(f"Nuovo inizio: {current_start.strftime('%Y-%m-%d %H:%M')}")
-        if not getattr(appointment, "AllDayEvent", False):
+        if not is_all_day:
             summary_lines.append(f"Durata: {getattr(appointment, 'Duration', duration_value or 0)} minuti")
         if new_location:
             summary_lines.append(f"Nuova posizione: {appointment.Location}")
@@ -390,9 +572,9 @@ def delete_calendar_event(
             number = int(event_number)
         except (TypeError, ValueError):
             return "Errore: 'event_number' deve essere un intero."
-        if number not in calendar_cache:
+        cached_event = calendar_cache.get(number)
+        if cached_event is None:
             return "Errore: evento non trovato nella cache corrente. Elenca gli eventi e riprova."
-        cached_event = calendar_cache[number]
         target_id = cached_event.get("id")
         if not target_id:
             return "Errore: l'evento selezionato non espone un EntryID valido."
@@ -419,7 +601,7 @@ def delete_calendar_event(
         meeting_status = getattr(appointment, "MeetingStatus", 0)
         cancellation_sent = False
 
-        if send_bool and meeting_status in (1, 3):  # olMeeting or meeting request received
+        if send_bool and meeting_status in (OL_MEETING, OL_MEETING_RECEIVED):
             try:
                 cancel_item = appointment.CancelMeeting()
                 if cancel_item:
@@ -438,11 +620,11 @@ def delete_calendar_event(
             logger.exception("Eliminazione dell'evento fallita.")
             return f"Errore: impossibile eliminare l'evento (EntryID={target_id}): {exc}"
 
-        clear_calendar_cache()
+        invalidate_calendar_entry(target_id)
 
         if cancellation_sent:
             return "Evento eliminato e cancellazione inviata ai partecipanti."
-        if send_bool and meeting_status in (1, 3):
+        if send_bool and meeting_status in (OL_MEETING, OL_MEETING_RECEIVED):
             return "Evento eliminato, ma invio della cancellazione ai partecipanti non riuscito."
         return "Evento eliminato con successo."
     except Exception as exc:
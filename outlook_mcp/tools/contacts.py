@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool
 from outlook_mcp import logger
+from outlook_mcp.constants import CONTACT_SEARCH_PROPERTIES, OL_FOLDER_CONTACTS
 
 def _connect():
     from outlook_mcp import connect_to_outlook
@@ -12,6 +13,133 @@ def _connect():
     return connect_to_outlook()
 
 
+# Contact properties read per contact; also valid Table column names.
+_CONTACT_COLUMNS = (
+    "FullName",
+    "FileAs",
+    "CompanyName",
+    "Email1Address",
+    "Email2Address",
+    "Email3Address",
+    "MobileTelephoneNumber",
+    "BusinessTelephoneNumber",
+    "HomeTelephoneNumber",
+    "PrimaryTelephoneNumber",
+    "Categories",
+)
+_CONTACT_TABLE_BATCH = 500
+
+
+def _match_contact(values: Dict[str, Any], normalized_term: str) -> Optional[Dict[str, str]]:
+    """Build the contact summary from raw property values; ``None`` if it does not match."""
+    display_name = next(
+        (value for value in (values["FullName"], values["FileAs"], values["CompanyName"]) if value),
+        "Senza nome",
+    )
+    primary_email = next(
+        (value for value in (values["Email1Address"], values["Email2Address"], values["Email3Address"]) if value),
+        "",
+    )
+    phone_number = next(
+        (
+            value
+            for value in (
+                values["MobileTelephoneNumber"],
+                values["BusinessTelephoneNumber"],
+                values["HomeTelephoneNumber"],
+                values["PrimaryTelephoneNumber"],
+            )
+            if value
+        ),
+        "",
+    )
+    company = values["CompanyName"] or ""
+    categories = values["Categories"] or ""
+
+    # Checked field by field: no joined, lowercased copy of the whole contact per row.
+    if normalized_term and not any(
+        normalized_term in str(part).lower()
+        for part in (display_name, primary_email, company, phone_number, categories)
+        if part
+    ):
+        return None
+
+    return {
+        "name": str(display_name),
+        "email": str(primary_email).strip() if primary_email else "",
+        "company": company.strip(),
+        "phone": str(phone_number).strip() if phone_number else "",
+    }
+
+
+def _build_contact_filter(normalized_term: str) -> Optional[str]:
+    """Return a DASL filter selecting a superset of the contacts ``_match_contact`` accepts.
+
+    Unnamed contacts are matched as "Senza nome", which no store property holds, so
+    terms that could hit that placeholder stay unfiltered.
+    """
+    if not normalized_term or normalized_term in "senza nome":
+        return None
+    escaped = normalized_term.replace("'", "''")
+    return "@SQL=" + " OR ".join(f"\"{prop}\" LIKE '%{escaped}%'" for prop in CONTACT_SEARCH_PROPERTIES)
+
+
+def _open_contact_table(folder, contact_filter: Optional[str]):
+    if contact_filter:
+        try:
+            return folder.GetTable(contact_filter)
+        except Exception as exc:
+            logger.debug("Filtro DASL dei contatti rifiutato, leggo la tabella completa: %s", exc)
+    return folder.GetTable()
+
+
+def _format_contact_line(index: int, info: Dict[str, str]) -> str:
+    """Render ``N. Nome <email> (azienda; telefono)``, omitting empty parts."""
+    email, company, phone = info["email"], info["company"], info["phone"]
+    email_part = f" <{email}>" if email else ""
+    if company and phone:
+        details = f" ({company}; {phone})"
+    elif company or phone:
+        details = f" ({company or phone})"
+    else:
+        details = ""
+    return f"{index}. {info['name']}{email_part}{details}"
+
+
+def _search_contacts_via_table(
+    folder,
+    normalized_term: str,
+    max_results: int,
+    contact_filter: Optional[str] = None,
+) -> Optional[List[Dict[str, str]]]:
+    """Match contacts from ``GetArray`` batches; ``None`` if the folder has no Table support."""
+    matches: List[Dict[str, str]] = []
+    try:
+        table = _open_contact_table(folder, contact_filter)
+        columns = table.Columns
+        columns.RemoveAll()
+        for column in _CONTACT_COLUMNS:
+            columns.Add(column)
+        try:
+            table.Sort("[FileAs]", False)
+        except Exception as exc:
+            logger.debug("Ordinamento della tabella contatti non riuscito: %s", exc)
+        while len(matches) < max_results and not table.EndOfTable:
+            rows = table.GetArray(_CONTACT_TABLE_BATCH) or ()
+            if not rows:
+                break
+            for row in rows:
+                match = _match_contact(dict(zip(_CONTACT_COLUMNS, row)), normalized_term)
+                if match is not None:
+                    matches.append(match)
+                    if len(matches) >= max_results:
+                        break
+    except Exception as exc:
+        logger.debug("Tabella contatti non disponibile, uso la lettura per elemento: %s", exc)
+        return None
+    return matches
+
+
 @mcp_tool()
 @feature_gate(group="contacts")
 def search_contacts(
@@ -38,7 +166,7 @@ def search_contacts(
 
         _, namespace = _connect()
         try:
-            contacts_folder = namespace.GetDefaultFolder(10)  # Contacts default folder
+            contacts_folder = namespace.GetDefaultFolder(OL_FOLDER_CONTACTS)
         except Exception as exc:
             logger.exception("Impossibile accedere alla cartella Contatti.")
             return f"Errore: impossibile accedere alla cartella dei contatti ({exc})."
@@ -50,58 +178,34 @@ def search_contacts(
         matches: List[dict] = []
         total_count = getattr(items, "Count", None)
 
+        # The store narrows the candidates; _match_contact still applies the exact filter.
+        contact_filter = _build_contact_filter(normalized_term)
+        table_matches = _search_contacts_via_table(contacts_folder, normalized_term, max_results, contact_filter)
+        if table_matches is not None:
+            matches = table_matches
         # Iteration strategy: prefer direct indexing if available
-        if hasattr(items, "Count") and hasattr(items, "__call__"):
+        elif hasattr(items, "Count") and hasattr(items, "__call__"):
+            # Sort before Restrict: the restricted collection keeps the order, and the
+            # first max_results matches are then the first ones alphabetically.
+            try:
+                items.Sort("[FileAs]", False)
+            except Exception as exc:
+                logger.debug("Ordinamento dei contatti non riuscito: %s", exc)
+            if contact_filter and hasattr(items, "Restrict"):
+                try:
+                    items = items.Restrict(contact_filter)
+                except Exception as exc:
+                    logger.debug("Restrict sui contatti non riuscito, scansione completa: %s", exc)
             for index in range(1, items.Count + 1):
                 contact = items(index)
                 if not contact:
                     continue
 
-                name_candidates = [
-                    getattr(contact, "FullName", None),
-                    getattr(contact, "FileAs", None),
-                    getattr(contact, "CompanyName", None),
-                ]
-                display_name = next((value for value in name_candidates if value), "Senza nome")
-
-                email_candidates = [
-                    getattr(contact, "Email1Address", None),
-                    getattr(contact, "Email2Address", None),
-                    getattr(contact, "Email3Address", None),
-                ]
-                primary_email = next((value for value in email_candidates if value), "")
-
-                phone_candidates = [
-                    getattr(contact, "MobileTelephoneNumber", None),
-                    getattr(contact, "BusinessTelephoneNumber", None),
-                    getattr(contact, "HomeTelephoneNumber", None),
-                    getattr(contact, "PrimaryTelephoneNumber", None),
-                ]
-                phone_number = next((value for value in phone_candidates if value), "")
-
-                company = getattr(contact, "CompanyName", "") or ""
-                categories = getattr(contact, "Categories", "") or ""
-
-                if normalized_term:
-                    haystack_parts = [
-                        str(display_name),
-                        str(primary_email or ""),
-                        company,
-                        str(phone_number or ""),
-                        categories,
-                    ]
-                    haystack = " ".join(part.lower() for part in haystack_parts if part)
-                    if normalized_term not in haystack:
-                        continue
-
-                matches.append(
-                    {
-                        "name": str(display_name),
-                        "email": str(primary_email).strip() if primary_email else "",
-                        "company": company.strip(),
-                        "phone": str(phone_number).strip() if phone_number else "",
-                    }
-                )
+                values = {column: getattr(contact, column, None) for column in _CONTACT_COLUMNS}
+                match = _match_contact(values, normalized_term)
+                if match is None:
+                    continue
+                matches.append(match)
 
                 if len(matches) >= max_results:
                     break
@@ -142,18 +246,7 @@ def search_contacts(
         if total_count is not None:
             header_suffix = f" su {total_count}"
         lines = [f"Trovati {len(matches)} contatti{header_suffix}.", ""]
-        for index, info in enumerate(matches, 1):
-            parts = [f"{index}. {info['name']}"]
-            if info["email"]:
-                parts.append(f"<{info['email']}>")
-            details: List[str] = []
-            if info["company"]:
-                details.append(info["company"])
-            if info["phone"]:
-                details.append(info["phone"])
-            if details:
-                parts.append(f"({'; '.join(details)})")
-            lines.append(" ".join(parts))
+        lines.extend(_format_contact_line(index, info) for index, info in enumerate(matches, 1))
 
         if normalized_term:
             lines.append("")
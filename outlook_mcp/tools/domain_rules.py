@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Optional, List, Any, Dict
+import functools
+from typing import Optional, Any, Dict, Sequence, Tuple
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool
 
 from outlook_mcp import logger
+from outlook_mcp.constants import OL_FOLDER_INBOX
 from outlook_mcp.utils import coerce_bool
 
 
@@ -23,12 +25,29 @@ def _resolve(namespace, *, email_number: Optional[int], message_id: Optional[str
     return resolve_mail_item(namespace, email_number=email_number, message_id=message_id)
 
 
-def _ensure_structure(namespace, domain: str, root_folder_name: str, subfolders: Optional[List[str]]):
+_DEFAULT_SUBFOLDERS = ("Da leggere", "In lavorazione", "Archivio")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_subfolders(raw: Optional[str]) -> Tuple[str, ...]:
+    """Split a ``a|b|c`` subfolder list; cached because bulk routing repeats the same value."""
+    if not raw:
+        return ()
+    return tuple(segment.strip() for segment in raw.split("|") if segment.strip())
+
+
+def _ensure_structure(namespace, domain: str, root_folder_name: str, subfolders: Optional[Sequence[str]]):
     from outlook_mcp.services.email import ensure_domain_folder_structure
 
     return ensure_domain_folder_structure(namespace, domain, root_folder_name, subfolders)
 
 
+def _find_subfolder(namespace, parent, name: str):
+    from outlook_mcp.services.email import find_subfolder
+
+    return find_subfolder(namespace, parent, name)
+
+
 def _extract_domain(address: Optional[str]) -> Optional[str]:
     from outlook_mcp.services.email import extract_email_domain
 
@@ -72,16 +91,12 @@ def ensure_domain_folder(
         if not domain:
             return f"Errore: impossibile determinare il dominio dal mittente '{target_email}'."
 
-        custom_subfolders: Optional[List[str]] = None
-        if subfolders:
-            custom_subfolders = [folder.strip() for folder in subfolders.split("|") if folder.strip()]
-
         _, namespace = _connect()
         domain_folder, domain_created, created_subfolders = _ensure_structure(
             namespace=namespace,
             domain=domain,
             root_folder_name=root_folder_name or "Clienti",
-            subfolders=custom_subfolders or ["Da leggere", "In lavorazione", "Archivio"],
+            subfolders=_parse_subfolders(subfolders) or _DEFAULT_SUBFOLDERS,
         )
         folder_path = getattr(domain_folder, "FolderPath", f"{domain_folder}")
         summary_parts = [f"Cartella dominio '{domain}' pronta: {folder_path}"]
@@ -112,10 +127,9 @@ def move_email_to_domain_folder(
     try:
         from outlook_mcp import email_cache
 
-        if not email_cache or email_number not in email_cache:
+        email_entry = email_cache.get(email_number)
+        if email_entry is None:
             return "Errore: nessun elenco messaggi attivo o numero non valido."
-
-        email_entry = email_cache[email_number]
         sender = _derive_sender(email_entry)
         if not sender:
             return "Errore: il messaggio non contiene un mittente valido."
@@ -126,32 +140,16 @@ def move_email_to_domain_folder(
         _, namespace = _connect()
 
         if coerce_bool(create_if_missing):
-            custom_subfolders = [seg.strip() for seg in subfolders.split("|") if seg.strip()] if subfolders else None
             domain_folder, _, _ = _ensure_structure(
                 namespace=namespace,
                 domain=domain,
                 root_folder_name=root_folder_name or "Clienti",
-                subfolders=custom_subfolders or ["Da leggere", "In lavorazione", "Archivio"],
+                subfolders=_parse_subfolders(subfolders) or _DEFAULT_SUBFOLDERS,
             )
         else:
-            inbox = namespace.GetDefaultFolder(6)
-            root_folder = None
-            try:
-                for sub in inbox.Folders:
-                    if sub.Name.lower() == (root_folder_name or "Clienti").lower():
-                        root_folder = sub
-                        break
-            except Exception:
-                root_folder = None
-            domain_folder = None
-            if root_folder:
-                try:
-                    for sub in root_folder.Folders:
-                        if sub.Name.lower() == domain.lower():
-                            domain_folder = sub
-                            break
-                except Exception:
-                    pass
+            inbox = namespace.GetDefaultFolder(OL_FOLDER_INBOX)
+            root_folder = _find_subfolder(namespace, inbox, root_folder_name or "Clienti")
+            domain_folder = _find_subfolder(namespace, root_folder, domain) if root_folder else None
             if not domain_folder:
                 return (
                     f"Errore: cartella dominio '{domain}' non trovata sotto '{root_folder_name or 'Clienti'}'. "
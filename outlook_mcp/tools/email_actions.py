@@ -2,23 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional, List, Dict
+import datetime
+import logging
+from typing import Any, Optional, List, Dict, Tuple
 import os
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool  # FastMCP instance
 
-from outlook_mcp import logger
+from outlook_mcp import email_cache, logger
 from outlook_mcp.utils import (
     coerce_bool,
     ensure_string_list,
     ensure_int_list,
     obfuscate_identifier,
     safe_entry_id,
-    safe_folder_path,
+    safe_store_id,
     normalize_folder_path,
+    unique_strings,
 )
 from outlook_mcp import folders as folder_service
+from outlook_mcp.constants import OL_BY_VALUE
+from outlook_mcp.com import com_worker_pool, run_in_com_thread
 from outlook_mcp.services.email import (
     resolve_mail_item,
     update_cached_email,
@@ -26,9 +31,20 @@ from outlook_mcp.services.email import (
 )
 from outlook_mcp.services.common import (
     parse_importance,
+    parse_iso_input,
     parse_sensitivity,
 )
 
+# mark_as/flag vocabulary -> target UnRead value.
+_UNREAD_BY_MARK = {
+    "read": False,
+    "letto": False,
+    "letta": False,
+    "unread": True,
+    "non letto": True,
+    "non letta": True,
+}
+
 # Import runtime helpers lazily to avoid circular imports
 def _connect():
     from outlook_mcp import connect_to_outlook
@@ -48,9 +64,69 @@ def _apply_cats(mail_item, categories: List[str], overwrite: bool, append: bool)
     return apply_categories_to_item(mail_item, categories, overwrite, append)
 
 
+def _already_in_folder(mail_item, folder_entry_id: Optional[str]) -> bool:
+    """Tell whether the item already lives in the folder, so a Move would be a no-op."""
+    if not folder_entry_id:
+        return False
+    try:
+        return safe_entry_id(mail_item.Parent) == folder_entry_id
+    except Exception:
+        return False
+
+
+# Below this many messages a single apartment finishes before the pool pays off.
+_BATCH_PARALLEL_MIN_ITEMS = 8
+# One contiguous slice of jobs per COM pool thread.
+_BATCH_WORKERS = 4
+MAX_BATCH_EMAILS = 500
+# Successful operations listed in the batch report; failures are always listed in full.
+_BATCH_DETAIL_LINES = 50
+_NOT_CACHED_MESSAGE = "Messaggio non presente nella cache corrente. Elenca prima le email o specifica un message_id."
+
+
+def _destination_path(folder, fallback: str = "") -> Tuple[Optional[str], str]:
+    """Return the folder's own FolderPath and a display label, with one COM property read.
+
+    ``safe_folder_path`` reads ``Parent.FolderPath`` (meant for items), which for a
+    folder would name its parent; the Name is only fetched when FolderPath is missing.
+    """
+    try:
+        path = folder.FolderPath or None
+    except Exception:
+        path = None
+    if path:
+        return path, path
+    return None, getattr(folder, "Name", fallback) or fallback
+
+
+def _resolve_attachment_paths(path_values: List[str]) -> Tuple[List[str], Optional[str]]:
+    """Return the absolute attachment paths, or the first one that cannot be stat'ed."""
+    absolute_paths: List[str] = []
+    for path_value in path_values:
+        absolute = os.path.abspath(path_value)
+        try:
+            os.stat(absolute)
+        except OSError:
+            return absolute_paths, absolute
+        absolute_paths.append(absolute)
+    return absolute_paths, None
+
+
+# Outlook commits the read flag on assignment (MAPI SetReadFlag), without a Save.
+_SELF_PERSISTING_PROPERTIES = frozenset({"UnRead"})
+
+
+def _apply_mutations(mail_item, mutations: Dict[str, Any], *, save: bool = True) -> None:
+    """Assign all pending properties, then persist them with at most one Save."""
+    for name, value in mutations.items():
+        setattr(mail_item, name, value)
+    if save and not _SELF_PERSISTING_PROPERTIES.issuperset(mutations):
+        mail_item.Save()
+
+
 @mcp_tool()
 @feature_gate(group="email.actions")
-def move_email_to_folder(
+async def move_email_to_folder(
     target_folder_id: Optional[str] = None,
     target_folder_path: Optional[str] = None,
     target_folder_name: Optional[str] = None,
@@ -59,6 +135,26 @@ def move_email_to_folder(
     create_if_missing: bool = False,
 ) -> str:
     """Sposta un messaggio in una cartella risolta (id/path/nome), con creazione opzionale."""
+    # Move is a blocking MAPI round trip: run it on the COM worker thread.
+    return await run_in_com_thread(
+        _move_email_to_folder,
+        target_folder_id,
+        target_folder_path,
+        target_folder_name,
+        email_number,
+        message_id,
+        create_if_missing,
+    )
+
+
+def _move_email_to_folder(
+    target_folder_id: Optional[str],
+    target_folder_path: Optional[str],
+    target_folder_name: Optional[str],
+    email_number: Optional[int],
+    message_id: Optional[str],
+    create_if_missing: bool,
+) -> str:
     try:
         if not (target_folder_id or target_folder_path or target_folder_name):
             return "Errore: specifica una cartella di destinazione tramite id, path o nome."
@@ -80,7 +176,7 @@ def move_email_to_folder(
         except Exception as exc:
             return f"Errore: {exc}"
 
-        target_folder, attempts = folder_service.resolve_folder(
+        target_folder, attempts = folder_service.resolve_folder_cached(
             namespace,
             folder_id=target_folder_id,
             folder_path=target_folder_path,
@@ -108,16 +204,18 @@ def move_email_to_folder(
                         attempts.append("Cartella padre non trovata per la creazione automatica.")
 
         if not target_folder:
-            detail = "; ".join(attempts) if attempts else "cartella di destinazione non trovata."
+            detail = "; ".join(attempts) or "cartella di destinazione non trovata."
             return f"Errore: {detail}"
 
         try:
             moved_item = mail_item.Move(target_folder)
         except Exception as exc:
+            # The cached destination may have been deleted or renamed meanwhile.
+            folder_service.invalidate_resolved_folder_cache()
             logger.exception("Outlook ha rifiutato lo spostamento del messaggio.")
             return f"Errore: impossibile spostare il messaggio ({exc})."
 
-        destination_path = safe_folder_path(target_folder) or getattr(target_folder, "Name", "(destinazione)")
+        _, destination_path = _destination_path(target_folder, "(destinazione)")
         new_entry_id = safe_entry_id(moved_item) or safe_entry_id(mail_item)
         if email_number is not None:
             _update_cache(
@@ -138,13 +236,23 @@ def move_email_to_folder(
 
 @mcp_tool()
 @feature_gate(group="email.actions")
-def mark_email_read_unread(
+async def mark_email_read_unread(
     email_number: Optional[int] = None,
     message_id: Optional[str] = None,
     unread: Optional[bool] = None,
     flag: Optional[str] = None,
 ) -> str:
     """Imposta lo stato di lettura (letto/non letto) di un messaggio."""
+    # Save is a blocking MAPI round trip: keep it off the event loop.
+    return await run_in_com_thread(_mark_email_read_unread, email_number, message_id, unread, flag)
+
+
+def _mark_email_read_unread(
+    email_number: Optional[int],
+    message_id: Optional[str],
+    unread: Optional[bool],
+    flag: Optional[str],
+) -> str:
     try:
         if unread is None and flag is None:
             return "Errore: specifica 'unread' True/False oppure flag='read'/'unread'."
@@ -152,12 +260,8 @@ def mark_email_read_unread(
         if unread is not None:
             target_unread = bool(coerce_bool(unread))
         else:
-            normalized = str(flag).strip().lower()
-            if normalized in {"read", "letto", "letta"}:
-                target_unread = False
-            elif normalized in {"unread", "non letto", "non letta"}:
-                target_unread = True
-            else:
+            target_unread = _UNREAD_BY_MARK.get(str(flag).strip().lower())
+            if target_unread is None:
                 return "Errore: flag deve essere 'read' o 'unread'."
 
         logger.info(
@@ -174,8 +278,7 @@ def mark_email_read_unread(
             return f"Errore: {exc}"
 
         try:
-            mail_item.UnRead = target_unread
-            mail_item.Save()
+            _apply_mutations(mail_item, {"UnRead": target_unread})
         except Exception as exc:
             logger.exception("Outlook ha rifiutato l'aggiornamento dello stato lettura.")
             return f"Errore: impossibile aggiornare lo stato lettura ({exc})."
@@ -200,16 +303,35 @@ def apply_category(
     append: bool = False,
 ) -> str:
     """Applica una o piu' categorie Outlook a un messaggio (unisci/sovrascrivi)."""
+    # ensure_string_list already drops empty entries and maps None to [].
+    category_list = ensure_string_list(categories) + ensure_string_list(category)
+    return _apply_category(category_list, email_number, message_id, coerce_bool(overwrite), coerce_bool(append))
+
+
+@mcp_tool()
+@feature_gate(group="email.actions")
+def set_email_category(
+    email_number: int,
+    category: str,
+    overwrite: bool = False,
+) -> str:
+    """Compatibilita' retro: applica una singola categoria (alias di apply_category)."""
+    overwrite_bool = coerce_bool(overwrite)
+    # Shares the implementation directly instead of re-entering the gated apply_category tool.
+    return _apply_category(ensure_string_list([category]), email_number, None, overwrite_bool, not overwrite_bool)
+
+
+def _apply_category(
+    category_list: List[str],
+    email_number: Optional[int],
+    message_id: Optional[str],
+    overwrite_bool: bool,
+    append_bool: bool,
+) -> str:
     try:
-        category_list = ensure_string_list(categories)
-        if category:
-            category_list.extend(ensure_string_list(category))
-        category_list = [cat for cat in category_list if cat]
         if not category_list:
             return "Errore: specifica almeno una categoria da applicare."
 
-        overwrite_bool = coerce_bool(overwrite)
-        append_bool = coerce_bool(append)
         logger.info(
             "apply_category chiamato (categorie=%s numero=%s id=%s overwrite=%s append=%s).",
             category_list,
@@ -230,11 +352,13 @@ def apply_category(
         except ValueError as exc:
             return f"Errore: {exc}"
 
+        # Outlook uses ";" as the category separator, so names never contain "; ".
+        joined_categories = "; ".join(final_categories)
         if email_number is not None:
-            _update_cache(email_number, categories="; ".join(final_categories))
+            _update_cache(email_number, categories=joined_categories)
 
         reference = f"#{email_number}" if email_number is not None else (message_id or safe_entry_id(mail_item) or "messaggio")
-        return f"Categorie applicate al messaggio {reference}: {', '.join(final_categories) if final_categories else '(nessuna)'}."
+        return f"Categorie applicate al messaggio {reference}: {joined_categories.replace('; ', ', ') or '(nessuna)'}."
     except Exception as exc:
         logger.exception("Errore durante apply_category.")
         return f"Errore durante l'aggiornamento delle categorie: {exc}"
@@ -242,25 +366,7 @@ def apply_category(
 
 @mcp_tool()
 @feature_gate(group="email.actions")
-def set_email_category(
-    email_number: int,
-    category: str,
-    overwrite: bool = False,
-) -> str:
-    """Compatibilita' retro: applica una singola categoria (alias di apply_category)."""
-    overwrite_bool = coerce_bool(overwrite)
-    append_flag = not overwrite_bool
-    return apply_category(
-        categories=[category],
-        email_number=email_number,
-        overwrite=overwrite_bool,
-        append=append_flag,
-    )
-
-
-@mcp_tool()
-@feature_gate(group="email.actions")
-def reply_to_email_by_number(
+async def reply_to_email_by_number(
     email_number: Optional[int] = None,
     reply_text: str = "",
     message_id: Optional[str] = None,
@@ -274,6 +380,36 @@ def reply_to_email_by_number(
     request_delivery_receipt: bool = False,
 ) -> str:
     """Risponde a un messaggio (reply/reply-all), con allegati, proprietà avanzate e invio opzionale."""
+    # Reply/Attachments.Add/Send can block for seconds: run them on the COM worker thread.
+    return await run_in_com_thread(
+        _reply_to_email_by_number,
+        email_number,
+        reply_text,
+        message_id,
+        reply_all,
+        send,
+        attachments,
+        use_html,
+        importance,
+        sensitivity,
+        request_read_receipt,
+        request_delivery_receipt,
+    )
+
+
+def _reply_to_email_by_number(
+    email_number: Optional[int],
+    reply_text: str,
+    message_id: Optional[str],
+    reply_all: bool,
+    send: bool,
+    attachments: Optional[Any],
+    use_html: bool,
+    importance: Optional[str],
+    sensitivity: Optional[str],
+    request_read_receipt: bool,
+    request_delivery_receipt: bool,
+) -> str:
     try:
         if not reply_text.strip():
             return "Errore: specifica il testo della risposta."
@@ -296,6 +432,18 @@ def reply_to_email_by_number(
             sensitivity,
         )
 
+        importance_code = parse_importance(importance) if importance else None
+        if importance and importance_code is None:
+            return "Errore: importanza non valida. Usa: bassa, normale, alta"
+        sensitivity_code = parse_sensitivity(sensitivity) if sensitivity else None
+        if sensitivity and sensitivity_code is None:
+            return "Errore: sensibilità non valida. Usa: normale, personale, privato, confidenziale"
+
+        # Check attachments before building the reply, so a bad path fails fast.
+        absolute_paths, missing_path = _resolve_attachment_paths(attachment_paths)
+        if missing_path:
+            return f"Errore: file '{missing_path}' non trovato."
+
         _, namespace = _connect()
         try:
             _, mail_item = _resolve(namespace, email_number=email_number, message_id=message_id)
@@ -314,19 +462,10 @@ def reply_to_email_by_number(
             reply.Body = reply_text
 
         # Set advanced properties
-        if importance:
-            importance_code = parse_importance(importance)
-            if importance_code is not None:
-                reply.Importance = importance_code
-            else:
-                return "Errore: importanza non valida. Usa: bassa, normale, alta"
-
-        if sensitivity:
-            sensitivity_code = parse_sensitivity(sensitivity)
-            if sensitivity_code is not None:
-                reply.Sensitivity = sensitivity_code
-            else:
-                return "Errore: sensibilità non valida. Usa: normale, personale, privato, confidenziale"
+        if importance_code is not None:
+            reply.Importance = importance_code
+        if sensitivity_code is not None:
+            reply.Sensitivity = sensitivity_code
 
         if request_read_bool:
             reply.ReadReceiptRequested = True
@@ -334,12 +473,9 @@ def reply_to_email_by_number(
         if request_delivery_bool:
             reply.OriginatorDeliveryReportRequested = True
 
-        for path_value in attachment_paths:
-            absolute = os.path.abspath(path_value)
-            if not os.path.exists(absolute):
-                return f"Errore: file '{absolute}' non trovato."
+        for absolute in absolute_paths:
             try:
-                reply.Attachments.Add(absolute)
+                reply.Attachments.Add(absolute, OL_BY_VALUE)
             except Exception as exc:
                 logger.exception("Impossibile allegare il file %s alla risposta.", absolute)
                 return f"Errore: impossibile allegare '{absolute}' ({exc})."
@@ -366,7 +502,7 @@ def reply_to_email_by_number(
 
 @mcp_tool()
 @feature_gate(group="email.actions")
-def compose_email(
+async def compose_email(
     recipient_email: str,
     subject: str,
     body: str,
@@ -382,6 +518,40 @@ def compose_email(
     voting_options: Optional[str] = None,
 ) -> str:
     """Crea e invia/archivia una nuova email con CC/BCC, allegati e proprietà avanzate."""
+    # CreateItem/Attachments.Add/Send can block for seconds: run them on the COM worker thread.
+    return await run_in_com_thread(
+        _compose_email,
+        recipient_email,
+        subject,
+        body,
+        cc_email,
+        bcc_email,
+        attachments,
+        send,
+        use_html,
+        importance,
+        sensitivity,
+        request_read_receipt,
+        request_delivery_receipt,
+        voting_options,
+    )
+
+
+def _compose_email(
+    recipient_email: str,
+    subject: str,
+    body: str,
+    cc_email: Optional[str],
+    bcc_email: Optional[str],
+    attachments: Optional[Any],
+    send: bool,
+    use_html: bool,
+    importance: Optional[str],
+    sensitivity: Optional[str],
+    request_read_receipt: bool,
+    request_delivery_receipt: bool,
+    voting_options: Optional[str],
+) -> str:
     try:
         if not recipient_email.strip():
             return "Errore: specifica almeno un destinatario."
@@ -404,6 +574,18 @@ def compose_email(
             sensitivity,
         )
 
+        importance_code = parse_importance(importance) if importance else None
+        if importance and importance_code is None:
+            return "Errore: importanza non valida. Usa: bassa, normale, alta"
+        sensitivity_code = parse_sensitivity(sensitivity) if sensitivity else None
+        if sensitivity and sensitivity_code is None:
+            return "Errore: sensibilità non valida. Usa: normale, personale, privato, confidenziale"
+
+        # Check attachments before creating the item, so a bad path fails fast.
+        absolute_paths, missing_path = _resolve_attachment_paths(attachment_paths)
+        if missing_path:
+            return f"Errore: file '{missing_path}' non trovato."
+
         outlook, _ = _connect()
         mail = outlook.CreateItem(0)
         mail.To = recipient_email
@@ -414,25 +596,17 @@ def compose_email(
         mail.Subject = subject
 
         if use_html_bool:
-            existing = getattr(mail, "HTMLBody", "")
-            mail.HTMLBody = f"{body}{existing}"
+            # A fresh CreateItem has no signature (Outlook only adds it on Display), so
+            # reading HTMLBody back would just transfer the empty default skeleton.
+            mail.HTMLBody = body
         else:
             mail.Body = body
 
         # Set advanced properties
-        if importance:
-            importance_code = parse_importance(importance)
-            if importance_code is not None:
-                mail.Importance = importance_code
-            else:
-                return "Errore: importanza non valida. Usa: bassa, normale, alta"
-
-        if sensitivity:
-            sensitivity_code = parse_sensitivity(sensitivity)
-            if sensitivity_code is not None:
-                mail.Sensitivity = sensitivity_code
-            else:
-                return "Errore: sensibilità non valida. Usa: normale, personale, privato, confidenziale"
+        if importance_code is not None:
+            mail.Importance = importance_code
+        if sensitivity_code is not None:
+            mail.Sensitivity = sensitivity_code
 
         if request_read_bool:
             mail.ReadReceiptRequested = True
@@ -444,12 +618,9 @@ def compose_email(
             # Voting options format: "Approve;Reject;Review"
             mail.VotingOptions = voting_options
 
-        for path_value in attachment_paths:
-            absolute = os.path.abspath(path_value)
-            if not os.path.exists(absolute):
-                return f"Errore: file '{absolute}' non trovato."
+        for absolute in absolute_paths:
             try:
-                mail.Attachments.Add(absolute)
+                mail.Attachments.Add(absolute, OL_BY_VALUE)
             except Exception as exc:
                 logger.exception("Impossibile allegare il file %s alla bozza.", absolute)
                 return f"Errore: impossibile allegare '{absolute}' ({exc})."
@@ -482,123 +653,204 @@ def batch_manage_emails(
 ) -> str:
     """Operazioni batch: sposta, marca come letto/non letto o elimina per numeri/ID."""
     try:
-        numbers = ensure_int_list(email_numbers)
-        ids = ensure_string_list(message_ids)
+        numbers = list(dict.fromkeys(ensure_int_list(email_numbers)))
+        ids = unique_strings(ensure_string_list(message_ids))
         if not numbers and not ids:
             return "Errore: specifica almeno un email_number o message_id."
+        if len(numbers) + len(ids) > MAX_BATCH_EMAILS:
+            return f"Errore: al massimo {MAX_BATCH_EMAILS} messaggi per chiamata."
 
         delete_bool = coerce_bool(delete)
 
         mark_target: Optional[bool] = None
         if mark_as is not None:
-            normalized = str(mark_as).strip().lower()
-            if normalized in {"read", "letto", "letta"}:
-                mark_target = False
-            elif normalized in {"unread", "non letto", "non letta"}:
-                mark_target = True
-            else:
+            mark_target = _UNREAD_BY_MARK.get(str(mark_as).strip().lower())
+            if mark_target is None:
                 return "Errore: 'mark_as' deve essere 'read' o 'unread'."
 
         move_requested = any([move_to_folder_id, move_to_folder_path, move_to_folder_name])
-        masked_ids = [obfuscate_identifier(entry) for entry in ids]
-        logger.info(
-            "batch_manage_emails chiamato (numeri=%s ids=%s move=%s mark=%s delete=%s).",
-            numbers,
-            masked_ids,
-            move_requested,
-            mark_target,
-            delete_bool,
-        )
+        if not (move_requested or mark_target is not None or delete_bool):
+            return "Errore: specifica almeno un'operazione (spostamento, mark_as o delete)."
+        # Masking up to MAX_BATCH_EMAILS ids is only worth it when the line is emitted.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "batch_manage_emails chiamato (numeri=%s ids=%s move=%s mark=%s delete=%s).",
+                numbers,
+                [obfuscate_identifier(entry) for entry in ids],
+                move_requested,
+                mark_target,
+                delete_bool,
+            )
 
         _, namespace = _connect()
         target_folder = None
         target_attempts: List[str] = []
         if move_requested:
-            target_folder, target_attempts = folder_service.resolve_folder(
+            target_folder, target_attempts = folder_service.resolve_folder_cached(
                 namespace,
                 folder_id=move_to_folder_id,
                 folder_path=move_to_folder_path,
                 folder_name=move_to_folder_name,
             )
             if not target_folder:
-                detail = "; ".join(target_attempts) if target_attempts else "cartella di destinazione non trovata."
+                detail = "; ".join(target_attempts) or "cartella di destinazione non trovata."
                 return f"Errore: {detail}"
 
-        successes: List[str] = []
-        failures: List[str] = []
-
-        def process_email(number: Optional[int], entry_id: Optional[str], label: str) -> None:
+        target_label = ""
+        target_path = None
+        target_entry_id = None
+        target_store_id = None
+        if target_folder is not None:
+            target_path, target_label = _destination_path(target_folder)
+            target_entry_id = safe_entry_id(target_folder)
+            target_store_id = safe_store_id(target_folder)
+        moved_message = f"spostato in {target_label}"
+        already_there_message = f"già in {target_label}"
+        mark_message = "contrassegnato come non letto" if mark_target else "contrassegnato come letto"
+
+        def process_email(
+            namespace, target_folder, number: Optional[int], entry_id: str, label: str
+        ) -> Tuple[bool, str, Dict[str, Any]]:
+            """Act on one message and report (ok, line, cache updates); shared state is left to the caller."""
             try:
-                _, mail_item = _resolve(namespace, email_number=number, message_id=entry_id)
+                _, mail_item = _resolve(namespace, email_number=None, message_id=entry_id)
             except Exception as exc:
-                failures.append(f"{label}: {exc}")
-                return
+                return False, f"{label}: {exc}", {}
 
-            reference_id = safe_entry_id(mail_item) or entry_id or "N/D"
+            # The job already carries the EntryID: only a Move can change it.
+            reference_id = entry_id
+            moved = False
             operations: List[str] = []
 
             if move_requested and target_folder:
                 try:
-                    mail_item = mail_item.Move(target_folder)
-                    operations.append(
-                        f"spostato in {safe_folder_path(target_folder) or getattr(target_folder, 'Name', '')}"
-                    )
+                    if _already_in_folder(mail_item, target_entry_id):
+                        operations.append(already_there_message)
+                    else:
+                        mail_item = mail_item.Move(target_folder)
+                        moved = True
+                        operations.append(moved_message)
                 except Exception as exc:
-                    failures.append(f"{label} (id={reference_id}): errore nello spostamento ({exc})")
-                    return
+                    folder_service.invalidate_resolved_folder_cache()
+                    return False, f"{label} (id={reference_id}): errore nello spostamento ({exc})", {}
 
+            # Move already persists the item: Save only runs when a property was
+            # changed, and never on an item that is about to be deleted.
+            mutations: Dict[str, Any] = {}
             if mark_target is not None:
+                mutations["UnRead"] = mark_target
+            if mutations:
                 try:
-                    mail_item.UnRead = mark_target
-                    operations.append(
-                        "contrassegnato come non letto" if mark_target else "contrassegnato come letto"
-                    )
+                    _apply_mutations(mail_item, mutations, save=not delete_bool)
+                    operations.append(mark_message)
                 except Exception as exc:
-                    failures.append(
-                        f"{label} (id={reference_id}): impossibile aggiornare lo stato lettura ({exc})"
-                    )
-                    return
+                    return False, f"{label} (id={reference_id}): impossibile aggiornare lo stato lettura ({exc})", {}
 
             if delete_bool:
                 try:
                     mail_item.Delete()
                     operations.append("eliminato")
                 except Exception as exc:
-                    failures.append(f"{label} (id={reference_id}): eliminazione non riuscita ({exc})")
-                    return
-            else:
-                try:
-                    mail_item.Save()
-                except Exception:
-                    pass
-
-            if number is not None:
-                if delete_bool:
-                    try:
-                        from outlook_mcp import email_cache
-
-                        email_cache.pop(number, None)
-                    except Exception:
-                        pass
-                else:
-                    updates: Dict[str, Any] = {}
-                    if move_requested and target_folder:
-                        updates["folder_path"] = safe_folder_path(target_folder)
-                        updates["id"] = safe_entry_id(mail_item) or reference_id
-                    if mark_target is not None:
-                        updates["unread"] = mark_target
-                    if updates:
-                        _update_cache(number, **updates)
-
-            final_ref = safe_entry_id(mail_item) or reference_id
+                    return False, f"{label} (id={reference_id}): eliminazione non riuscita ({exc})", {}
+
+            final_ref = (safe_entry_id(mail_item) or reference_id) if moved else reference_id
+
+            updates: Dict[str, Any] = {}
+            if number is not None and not delete_bool:
+                if move_requested and target_folder:
+                    updates["folder_path"] = target_path
+                    updates["id"] = final_ref
+                if mark_target is not None:
+                    updates["unread"] = mark_target
+
             if not operations:
                 operations.append("nessuna modifica")
-            successes.append(f"{label} (id={final_ref}): {', '.join(operations)}")
+            return True, f"{label} (id={final_ref}): {', '.join(operations)}", updates
 
+        def process_slice(
+            jobs_slice: List[Tuple[int, Optional[int], str, str]],
+        ) -> List[Optional[Tuple[bool, str, Dict[str, Any]]]]:
+            """Run a slice of jobs on a COM pool thread with that thread's own connection.
+
+            Every job gets exactly one outcome, except when the slice cannot be set up:
+            then none of its jobs ran and all are left as None for the caller.
+            """
+            try:
+                _, worker_namespace = _connect()
+                worker_target = None
+                if target_folder is not None:
+                    worker_target = worker_namespace.GetFolderFromID(target_entry_id, target_store_id)
+            except Exception as exc:
+                logger.warning("batch_manage_emails: worker COM non disponibile, elaborazione seriale (%s).", exc)
+                return [None] * len(jobs_slice)
+            results: List[Optional[Tuple[bool, str, Dict[str, Any]]]] = []
+            for job in jobs_slice:
+                try:
+                    results.append(process_email(worker_namespace, worker_target, *job[1:]))
+                except Exception as exc:
+                    results.append((False, f"{job[3]}: errore imprevisto ({exc})", {}))
+            return results
+
+        # Cache lookups stay on this thread: each job carries the EntryID it acts on, and a
+        # message listed both by number and by EntryID is acted on once, since a second
+        # Move/Delete of the same item would only fail.
+        outcomes: List[Optional[Tuple[bool, str, Dict[str, Any]]]] = []
+        slot_numbers: List[Optional[int]] = []
+        jobs: List[Tuple[int, Optional[int], str, str]] = []
+        listed_ids = set()
         for number in numbers:
-            process_email(number, None, f"numero={number}")
+            label = f"numero={number}"
+            cached = email_cache.get(number)
+            cached_id = cached.get("id") if cached else None
+            slot_numbers.append(number)
+            if not cached_id:
+                outcomes.append((False, f"{label}: {_NOT_CACHED_MESSAGE}", {}))
+                continue
+            listed_ids.add(cached_id)
+            jobs.append((len(outcomes), number, cached_id, label))
+            outcomes.append(None)
         for entry_id in ids:
-            process_email(None, entry_id, f"id={entry_id}")
+            if entry_id in listed_ids:
+                logger.debug("batch_manage_emails: id %s già incluso tramite numero.", obfuscate_identifier(entry_id))
+                continue
+            jobs.append((len(outcomes), None, entry_id, f"id={entry_id}"))
+            slot_numbers.append(None)
+            outcomes.append(None)
+
+        pool = com_worker_pool() if len(jobs) >= _BATCH_PARALLEL_MIN_ITEMS else None
+        # Workers re-open the destination by ID in their own apartment.
+        if pool is not None and (target_folder is None or (target_entry_id and target_store_id)):
+            size = -(-len(jobs) // _BATCH_WORKERS)
+            slices = [jobs[index:index + size] for index in range(0, len(jobs), size)]
+            futures = [pool.submit(process_slice, jobs_slice) for jobs_slice in slices]
+            for jobs_slice, future in zip(slices, futures):
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    # Whether any of these jobs ran is unknown, so none is retried.
+                    logger.exception("batch_manage_emails: worker COM interrotto.")
+                    results = [(False, f"{job[3]}: errore imprevisto ({exc})", {}) for job in jobs_slice]
+                for job, outcome in zip(jobs_slice, results):
+                    outcomes[job[0]] = outcome
+
+        # Serial path, and the jobs of any slice whose worker could not be set up.
+        for job in jobs:
+            if outcomes[job[0]] is None:
+                outcomes[job[0]] = process_email(namespace, target_folder, *job[1:])
+
+        successes: List[str] = []
+        failures: List[str] = []
+        for job_number, (ok, line, updates) in zip(slot_numbers, outcomes):
+            if not ok:
+                failures.append(line)
+                continue
+            successes.append(line)
+            if job_number is None:
+                continue
+            if delete_bool:
+                email_cache.pop(job_number, None)
+            elif updates:
+                _update_cache(job_number, **updates)
 
         result_lines = [
             f"Operazioni riuscite: {len(successes)}",
@@ -607,7 +859,10 @@ def batch_manage_emails(
         if successes:
             result_lines.append("")
             result_lines.append("Dettagli riusciti:")
-            result_lines.extend(f"- {line}" for line in successes)
+            result_lines.extend(f"- {line}" for line in successes[:_BATCH_DETAIL_LINES])
+            if len(successes) > _BATCH_DETAIL_LINES:
+                result_lines.append(f"(Altre {len(successes) - _BATCH_DETAIL_LINES} operazioni non visualizzate)")
+        # Every failure is listed: the caller needs each one to retry or report it.
         if failures:
             result_lines.append("")
             result_lines.append("Errori:")
@@ -621,7 +876,7 @@ def batch_manage_emails(
 
 @mcp_tool()
 @feature_gate(group="email.actions")
-def flag_email(
+async def flag_email(
     email_number: Optional[int] = None,
     message_id: Optional[str] = None,
     flag_status: Optional[str] = None,
@@ -630,9 +885,27 @@ def flag_email(
     clear_flag: bool = False,
 ) -> str:
     """Imposta o rimuove il contrassegno follow-up su un'email con promemoria opzionale."""
-    try:
-        import datetime
+    # Save is a blocking MAPI round trip: keep it off the event loop.
+    return await run_in_com_thread(
+        _flag_email,
+        email_number,
+        message_id,
+        flag_status,
+        due_date,
+        reminder_time,
+        clear_flag,
+    )
 
+
+def _flag_email(
+    email_number: Optional[int],
+    message_id: Optional[str],
+    flag_status: Optional[str],
+    due_date: Optional[str],
+    reminder_time: Optional[str],
+    clear_flag: bool,
+) -> str:
+    try:
         clear_flag_bool = coerce_bool(clear_flag)
 
         logger.info(
@@ -645,6 +918,23 @@ def flag_email(
             clear_flag_bool,
         )
 
+        # Parse dates once, before touching Outlook; clearing ignores them.
+        due_dt: Optional[datetime.datetime] = None
+        reminder_dt: Optional[datetime.datetime] = None
+        if not clear_flag_bool:
+            if due_date:
+                try:
+                    due_dt = parse_iso_input(due_date)
+                except Exception as exc:
+                    logger.warning("Formato data scadenza non valido: %s (%s)", due_date, exc)
+                    return f"Errore: formato data scadenza non valido. Usa formato ISO (es: 2025-10-22 o 2025-10-22T14:30)"
+            if reminder_time:
+                try:
+                    reminder_dt = parse_iso_input(reminder_time)
+                except Exception as exc:
+                    logger.warning("Formato data promemoria non valido: %s (%s)", reminder_time, exc)
+                    return f"Errore: formato data promemoria non valido. Usa formato ISO (es: 2025-10-22T14:30)"
+
         _, namespace = _connect()
         try:
             _, mail_item = _resolve(namespace, email_number=email_number, message_id=message_id)
@@ -672,31 +962,23 @@ def flag_email(
             return f"Errore: impossibile impostare il contrassegno ({exc})"
 
         # Set due date
-        if due_date:
+        if due_dt is not None:
             try:
-                due_dt = datetime.datetime.fromisoformat(due_date.replace("T", " ").replace("Z", ""))
                 mail_item.FlagDueBy = due_dt
             except Exception as exc:
-                logger.warning("Formato data scadenza non valido: %s (%s)", due_date, exc)
-                return f"Errore: formato data scadenza non valido. Usa formato ISO (es: 2025-10-22 o 2025-10-22T14:30)"
+                logger.warning("Impossibile impostare la scadenza %s (%s)", due_date, exc)
+                return f"Errore: impossibile impostare la data di scadenza ({exc})"
 
-        # Set reminder
-        if reminder_time:
+        # Set reminder; without an explicit one it defaults to the due date
+        reminder_value = reminder_dt or due_dt
+        if reminder_value is not None:
             try:
-                reminder_dt = datetime.datetime.fromisoformat(reminder_time.replace("T", " ").replace("Z", ""))
                 mail_item.ReminderSet = True
-                mail_item.ReminderTime = reminder_dt
+                mail_item.ReminderTime = reminder_value
             except Exception as exc:
-                logger.warning("Formato data promemoria non valido: %s (%s)", reminder_time, exc)
-                return f"Errore: formato data promemoria non valido. Usa formato ISO (es: 2025-10-22T14:30)"
-        elif due_date:
-            # If due_date is set but no reminder, set reminder to same time
-            try:
-                due_dt = datetime.datetime.fromisoformat(due_date.replace("T", " ").replace("Z", ""))
-                mail_item.ReminderSet = True
-                mail_item.ReminderTime = due_dt
-            except Exception:
-                pass
+                if reminder_dt is not None:
+                    logger.warning("Impossibile impostare il promemoria %s (%s)", reminder_time, exc)
+                    return f"Errore: impossibile impostare il promemoria ({exc})"
 
         try:
             mail_item.Save()
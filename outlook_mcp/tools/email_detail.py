@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Tuple
 
 from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool  # FastMCP instance
@@ -15,6 +15,7 @@ from outlook_mcp.utils import (
     trim_conversation_id,
     safe_entry_id,
     safe_folder_path,
+    safe_store_id,
     obfuscate_identifier,
 )
 
@@ -22,6 +23,23 @@ from outlook_mcp.utils import (
 from outlook_mcp.services.email import resolve_mail_item, format_email, build_conversation_outline
 
 
+def _entry_id_at_position(folder, index: int) -> Tuple[Optional[str], int]:
+    """Return the EntryID of the ``index``-th newest item read from a one-column Table.
+
+    Returns ``(None, row_count)`` when the folder holds fewer than ``index`` items and
+    raises when the folder has no Table support.
+    """
+    table = folder.GetTable()
+    columns = table.Columns
+    columns.RemoveAll()
+    columns.Add("EntryID")
+    table.Sort("[ReceivedTime]", True)
+    rows = table.GetArray(index) or ()
+    if len(rows) < index:
+        return None, len(rows)
+    return rows[index - 1][0], len(rows)
+
+
 @mcp_tool()
 @feature_gate(group="email.detail")
 def get_email_by_number(
@@ -55,9 +73,10 @@ def get_email_by_number(
         if email_number is not None:
             if not email_cache:
                 return "Errore: nessun elenco messaggi attivo. Mostra prima le email e poi ripeti la richiesta."
-            if email_number not in email_cache:
+            cached_entry = email_cache.get(email_number)
+            if cached_entry is None:
                 return f"Errore: il messaggio #{email_number} non e presente nell'elenco corrente."
-            email_data = dict(email_cache[email_number])
+            email_data = dict(cached_entry)
             message_id = message_id or email_data.get("id")
 
         if message_id and not mail_item:
@@ -80,13 +99,30 @@ def get_email_by_number(
             if not folder:
                 detail = "; ".join(attempts) if attempts else "cartella non trovata."
                 return f"Errore: impossibile individuare la cartella specificata ({detail})."
+            # A sorted EntryID-only Table avoids sorting and binding the whole Items collection.
+            row_count: Optional[int] = None
             try:
-                items = folder.Items
-                items.Sort("[ReceivedTime]", True)
-                if index > items.Count:
-                    return f"Errore: la cartella contiene solo {items.Count} elementi."
-                mail_item = items(index)
-                message_id = message_id or safe_entry_id(mail_item)
+                entry_id, row_count = _entry_id_at_position(folder, index)
+            except Exception as exc:
+                logger.debug("Tabella della cartella non disponibile, uso Items: %s", exc)
+            try:
+                if row_count is None:
+                    items = folder.Items
+                    items.Sort("[ReceivedTime]", True)
+                    if index > items.Count:
+                        return f"Errore: la cartella contiene solo {items.Count} elementi."
+                    mail_item = items(index)
+                    message_id = message_id or safe_entry_id(mail_item)
+                elif entry_id is None:
+                    return f"Errore: la cartella contiene solo {row_count} elementi."
+                else:
+                    # The folder may live in a secondary store, which GetItemFromID only searches when told.
+                    store_id = safe_store_id(folder)
+                    if store_id:
+                        mail_item = namespace.GetItemFromID(entry_id, store_id)
+                    else:
+                        mail_item = namespace.GetItemFromID(entry_id)
+                    message_id = message_id or entry_id
             except Exception as exc:
                 logger.exception("Impossibile recuperare il messaggio %s dalla cartella.", index)
                 return f"Errore: impossibile recuperare il messaggio in posizione {index} ({exc})."
@@ -153,11 +189,13 @@ def get_email_by_number(
             result_lines.append(f"Nomi allegati: {', '.join(attachment_names_preview)}")
 
         attachment_lines: List[str] = []
-        if mail_item and email_data.get("has_attachments") and hasattr(mail_item, "Attachments"):
+        if mail_item and email_data.get("has_attachments"):
+            # Bind the collection once instead of re-reading mail_item.Attachments per row.
             try:
-                for i in range(1, mail_item.Attachments.Count + 1):
-                    attachment = mail_item.Attachments(i)
-                    attachment_lines.append(f"  - {attachment.FileName}")
+                attachments = mail_item.Attachments
+                attachment_lines = [
+                    f"  - {attachments.Item(position).FileName}" for position in range(1, attachments.Count + 1)
+                ]
             except Exception:
                 attachment_lines = []
 
@@ -207,13 +245,12 @@ def get_email_context(
         _, namespace = connect_to_outlook()
         include_thread_bool = coerce_bool(include_thread)
 
-        if not email_cache or email_number not in email_cache:
+        focus_email = email_cache.get(email_number)
+        if focus_email is None:
             return (
                 "Errore: nessun elenco messaggi attivo o numero non valido. "
                 "Elenca prima le email per costruire il contesto."
             )
-
-        focus_email = email_cache[email_number]
         outline = build_conversation_outline(
             namespace=namespace,
             email_data=focus_email,
@@ -27,7 +27,7 @@ from outlook_mcp.services.email import (
     email_has_user_reply_with_context,
     build_conversation_outline,
 )
-from outlook_mcp.settings import get_promotional_keywords
+from outlook_mcp.settings import get_promotional_matcher
 
 def _connect():
     from outlook_mcp import connect_to_outlook
@@ -394,7 +394,7 @@ def list_pending_replies(
             addr for addr in (normalize_email_address(addr) for addr in user_addresses) if addr
         }
 
-        promotional_keywords = get_promotional_keywords()
+        promotional_matcher = get_promotional_matcher()
 
         if include_all_bool:
             if folder_name:
@@ -455,7 +455,7 @@ def list_pending_replies(
                 )
             ).lower()
 
-            if any(keyword in subject_preview_text for keyword in promotional_keywords):
+            if promotional_matcher.search(subject_preview_text):
                 continue
 
             to_addresses = {
@@ -8,6 +8,9 @@ from outlook_mcp.toolkit import mcp_tool
 from outlook_mcp import logger
 from outlook_mcp.utils import coerce_bool, safe_folder_path
 from outlook_mcp import folders as folder_service
+from outlook_mcp.services.calendar import invalidate_calendar_folder_cache
+from outlook_mcp.services.email import invalidate_subfolder_index
+from outlook_mcp.services.tasks import invalidate_task_folder_cache
 
 
 def _connect():
@@ -157,6 +160,10 @@ def create_folder(
                 item_type=item_type,
                 allow_existing=allow_existing_bool,
             )
+            invalidate_task_folder_cache()
+            invalidate_calendar_folder_cache()
+            invalidate_subfolder_index()
+            folder_service.invalidate_resolved_folder_cache()
             return message
         except ValueError as exc:
             return f"Errore: {exc}"
@@ -205,6 +212,10 @@ def rename_folder(
             return f"Errore: {exc}"
         except RuntimeError as exc:
             return f"Errore: {exc}"
+        invalidate_task_folder_cache()
+        invalidate_calendar_folder_cache()
+        invalidate_subfolder_index()
+        folder_service.invalidate_resolved_folder_cache()
 
         path_display = safe_folder_path(target) or new_name.strip()
         return f"Cartella rinominata in '{new_name.strip()}' (percorso attuale: {path_display})."
@@ -249,6 +260,10 @@ def delete_folder(
             folder_service.delete_folder(target)
         except RuntimeError as exc:
             return f"Errore: {exc}"
+        invalidate_task_folder_cache()
+        invalidate_calendar_folder_cache()
+        invalidate_subfolder_index()
+        folder_service.invalidate_resolved_folder_cache()
 
         return (
             f"Cartella eliminata: {path_display}. (Se previsto, Outlook l'ha spostata in Posta eliminata.)"
@@ -9,6 +9,7 @@ from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool
 
 from outlook_mcp import logger
+from outlook_mcp.services.common import parse_iso_input
 
 
 def _connect():
@@ -97,12 +98,12 @@ def get_freebusy_info(
 
         # Parse dates
         try:
-            start_dt = datetime.datetime.fromisoformat(start_date.replace("T", " ").replace("Z", ""))
+            start_dt = parse_iso_input(start_date)
         except Exception as exc:
             return f"Errore: formato start_date non valido. Usa formato ISO (es: 2025-10-22 o 2025-10-22T08:00)"
 
         try:
-            end_dt = datetime.datetime.fromisoformat(end_date.replace("T", " ").replace("Z", ""))
+            end_dt = parse_iso_input(end_date)
         except Exception as exc:
             return f"Errore: formato end_date non valido. Usa formato ISO (es: 2025-10-22 o 2025-10-22T18:00)"
 
@@ -229,8 +230,8 @@ def find_free_time_slots(
 
         # Parse dates
         try:
-            base_start = datetime.datetime.fromisoformat(start_date.replace("T", " ").replace("Z", ""))
-            base_end = datetime.datetime.fromisoformat(end_date.replace("T", " ").replace("Z", ""))
+            base_start = parse_iso_input(start_date)
+            base_end = parse_iso_input(end_date)
         except Exception:
             return "Errore: formato date non valido. Usa formato ISO (es: 2025-10-22)"
 
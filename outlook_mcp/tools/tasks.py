@@ -9,16 +9,18 @@ from ..features import feature_gate
 from outlook_mcp.toolkit import mcp_tool
 
 from outlook_mcp import logger
-from outlook_mcp.utils import coerce_bool, safe_entry_id
+from outlook_mcp.utils import coerce_bool, safe_entry_id, truncate_text
 from outlook_mcp import MAX_TASK_DAYS, DEFAULT_TASK_MAX_RESULTS
 
 # Reuse shared helpers from services
+from outlook_mcp.services.common import parse_iso_input
 from outlook_mcp.services.tasks import (
     get_all_task_folders,
     get_task_folder_by_name,
     get_tasks_from_folder,
     collect_tasks_across_folders,
     present_task_listing,
+    load_task_body,
     parse_task_status,
     parse_task_priority,
 )
@@ -72,7 +74,7 @@ def list_tasks(
             if folder_name:
                 logger.info("Parametro folder_name ignorato perché include_all_folders=True.")
             folders = get_all_task_folders(namespace)
-            tasks = collect_tasks_across_folders(
+            tasks, total_found = collect_tasks_across_folders(
                 folders,
                 days=days,
                 include_completed=include_completed_bool,
@@ -90,6 +92,7 @@ def list_tasks(
                 folder_display = "Attività"
 
             tasks = get_tasks_from_folder(folder, days, include_completed_bool)
+            total_found = len(tasks)
 
         return present_task_listing(
             tasks=tasks,
@@ -97,6 +100,8 @@ def list_tasks(
             max_results=max_results,
             include_preview=include_preview_bool,
             log_context="list_tasks",
+            namespace=namespace,
+            total_found=total_found,
         )
     except Exception as exc:
         logger.exception("Errore nel recupero delle attività per la cartella '%s'.", folder_name or "Attività")
@@ -152,7 +157,7 @@ def search_tasks(
             if folder_name:
                 logger.info("Parametro folder_name ignorato perché include_all_folders=True.")
             folders = get_all_task_folders(namespace)
-            tasks = collect_tasks_across_folders(
+            tasks, total_found = collect_tasks_across_folders(
                 folders,
                 days=days,
                 include_completed=include_completed_bool,
@@ -171,6 +176,7 @@ def search_tasks(
                 folder_display = "Attività"
 
             tasks = get_tasks_from_folder(folder, days, include_completed_bool, search_term)
+            total_found = len(tasks)
 
         return present_task_listing(
             tasks=tasks,
@@ -178,6 +184,8 @@ def search_tasks(
             max_results=max_results,
             include_preview=include_preview_bool,
             log_context="search_tasks",
+            namespace=namespace,
+            total_found=total_found,
         )
     except Exception as exc:
         logger.exception(
@@ -206,6 +214,10 @@ def get_task_by_number(task_number: int) -> str:
         task = task_cache[task_number]
         logger.info("Recupero dettagli completi per l'attività #%s.", task_number)
 
+        if task.get("body") is None:
+            _, namespace = _connect()
+            load_task_body(namespace, task)
+
         lines = [
             f"Dettagli attività #{task_number}:",
             "",
@@ -232,8 +244,8 @@ def get_task_by_number(task_number: int) -> str:
             lines.append(f"Cartella: {task['folder_path']}")
 
         body_content = task.get("body", "")
-        if body_content and len(body_content) > 4000:
-            body_content = body_content[:4000].rstrip() + "\n[Descrizione troncata per brevità]"
+        if body_content:
+            body_content = truncate_text(body_content, 4000, "[Descrizione troncata per brevità]")
 
         lines.append("")
         lines.append("Descrizione completa:")
@@ -283,7 +295,7 @@ def create_task(
         # Parse and set dates
         if due_date:
             try:
-                due_dt = datetime.datetime.fromisoformat(due_date.replace("T", " ").replace("Z", ""))
+                due_dt = parse_iso_input(due_date)
                 task.DueDate = due_dt
             except Exception as exc:
                 logger.warning("Formato data scadenza non valido: %s (%s)", due_date, exc)
@@ -291,7 +303,7 @@ def create_task(
 
         if start_date:
             try:
-                start_dt = datetime.datetime.fromisoformat(start_date.replace("T", " ").replace("Z", ""))
+                start_dt = parse_iso_input(start_date)
                 task.StartDate = start_dt
             except Exception as exc:
                 logger.warning("Formato data inizio non valido: %s (%s)", start_date, exc)
@@ -316,7 +328,7 @@ def create_task(
         # Set reminder
         if reminder_time:
             try:
-                reminder_dt = datetime.datetime.fromisoformat(reminder_time.replace("T", " ").replace("Z", ""))
+                reminder_dt = parse_iso_input(reminder_time)
                 task.ReminderSet = True
                 task.ReminderTime = reminder_dt
             except Exception as exc:
@@ -376,9 +388,9 @@ def update_task(
         # Resolve task
         if task_number is not None:
             from outlook_mcp import task_cache
-            if not task_cache or task_number not in task_cache:
+            cached_task = task_cache.get(task_number)
+            if cached_task is None:
                 return f"Errore: attività #{task_number} non presente in cache. Elenca prima le attività."
-            cached_task = task_cache[task_number]
             task_id = cached_task.get("id")
 
         if not task_id:
@@ -404,7 +416,7 @@ def update_task(
 
         if due_date is not None:
             try:
-                due_dt = datetime.datetime.fromisoformat(due_date.replace("T", " ").replace("Z", ""))
+                due_dt = parse_iso_input(due_date)
                 task.DueDate = due_dt
                 updates.append("scadenza")
             except Exception as exc:
@@ -412,7 +424,7 @@ def update_task(
 
         if start_date is not None:
             try:
-                start_dt = datetime.datetime.fromisoformat(start_date.replace("T", " ").replace("Z", ""))
+                start_dt = parse_iso_input(start_date)
                 task.StartDate = start_dt
                 updates.append("data inizio")
             except Exception as exc:
@@ -444,7 +456,7 @@ def update_task(
 
         if reminder_time is not None:
             try:
-                reminder_dt = datetime.datetime.fromisoformat(reminder_time.replace("T", " ").replace("Z", ""))
+                reminder_dt = parse_iso_input(reminder_time)
                 task.ReminderSet = True
                 task.ReminderTime = reminder_dt
                 updates.append("promemoria")
@@ -486,9 +498,9 @@ def mark_task_complete(
         # Resolve task
         if task_number is not None:
             from outlook_mcp import task_cache
-            if not task_cache or task_number not in task_cache:
+            cached_task = task_cache.get(task_number)
+            if cached_task is None:
                 return f"Errore: attività #{task_number} non presente in cache. Elenca prima le attività."
-            cached_task = task_cache[task_number]
             task_id = cached_task.get("id")
 
         if not task_id:
@@ -533,9 +545,9 @@ def delete_task(
         # Resolve task
         if task_number is not None:
             from outlook_mcp import task_cache
-            if not task_cache or task_number not in task_cache:
+            cached_task = task_cache.get(task_number)
+            if cached_task is None:
                 return f"Errore: attività #{task_number} non presente in cache. Elenca prima le attività."
-            cached_task = task_cache[task_number]
             task_id = cached_task.get("id")
 
         if not task_id:
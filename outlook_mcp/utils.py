@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import datetime
 import hashlib
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from .constants import (
     ATTACHMENT_NAME_PREVIEW_MAX,
@@ -43,6 +43,19 @@ def build_body_preview(body: Optional[str], max_chars: int = BODY_PREVIEW_MAX_CH
     return normalized[: max_chars - 3].rstrip() + "..."
 
 
+def truncate_text(text: str, max_chars: int, marker: str) -> str:
+    """Cut ``text`` to ``max_chars`` (dropping trailing whitespace) and append ``marker``.
+
+    Only the tail of the kept prefix is scanned, so large bodies are sliced once.
+    """
+    if len(text) <= max_chars:
+        return text
+    end = max_chars
+    while end > 0 and text[end - 1].isspace():
+        end -= 1
+    return f"{text[:end]}\n{marker}"
+
+
 def trim_conversation_id(conversation_id: Optional[str], max_chars: int = CONVERSATION_ID_PREVIEW_MAX) -> Optional[str]:
     """Shorten long conversation identifiers so they stay readable."""
     if not conversation_id:
@@ -243,6 +256,16 @@ def ensure_string_list(value: Optional[Any]) -> List[str]:
         return []
 
 
+def unique_strings(values: Iterable[str], key: Optional[Callable[[str], str]] = None) -> List[str]:
+    """Drop repeated entries, keeping the first occurrence; ``key`` normalises the comparison."""
+    if key is None:
+        return list(dict.fromkeys(values))
+    seen: Dict[str, str] = {}
+    for value in values:
+        seen.setdefault(key(value), value)
+    return list(seen.values())
+
+
 def ensure_int_list(value: Optional[Any]) -> List[int]:
     """Normalize a value into a list of integers (ignoring invalid entries)."""
     if value is None:
@@ -339,5 +362,7 @@ __all__ = [
     "shorten_identifier",
     "obfuscate_identifier",
     "trim_conversation_id",
+    "truncate_text",
     "to_python_datetime",
+    "unique_strings",
 ]
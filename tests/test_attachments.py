@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.tools import attachments
+
+
+def _attachment(name, size):
+    accessor = SimpleNamespace(GetProperties=lambda tags: (name, size))
+    return SimpleNamespace(PropertyAccessor=accessor, FileName="oggetto.pdf", Size=2048)
+
+
+def test_read_attachment_header_uses_batched_properties():
+    name, size, _ = attachments._read_attachment_header(_attachment("report.pdf", 1024), 1)
+
+    assert (name, size) == ("report.pdf", 1024)
+
+
+def test_read_attachment_header_rejects_mapi_error_codes():
+    for error_code in (-2147221233, 0x8004010F):  # MAPI_E_NOT_FOUND, signed and unsigned
+        name, size, _ = attachments._read_attachment_header(_attachment(error_code, error_code), 1)
+
+        assert (name, size) == ("oggetto.pdf", 2048)
+
+
+def test_first_missing_path_checks_unlisted_names_before_reporting(monkeypatch, tmp_path):
+    present = tmp_path / "presente.txt"
+    present.write_text("x")
+    paths = [str(present), str(tmp_path / "assente.txt")]
+    split_paths = [attachments.os.path.split(path) for path in paths]
+
+    assert attachments._first_missing_path(paths, split_paths) == paths[1]
+
+    # Traverse-only directory: the listing fails but the file can still be opened.
+    monkeypatch.setattr(attachments, "_list_directory", lambda directory: None)
+    assert attachments._first_missing_path(paths[:1], split_paths[:1]) is None
+    # 8.3 short name: absent from the listing, yet present on disk.
+    monkeypatch.setattr(attachments, "_list_directory", lambda directory: set())
+    assert attachments._first_missing_path(paths[:1], split_paths[:1]) is None
+    assert attachments._first_missing_path(paths, split_paths) == paths[1]
@@ -1,4 +1,5 @@
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -8,7 +9,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from outlook_mcp.cache import TimedLRUCache
-from outlook_mcp.utils import obfuscate_identifier
+from outlook_mcp.utils import obfuscate_identifier, truncate_text, unique_strings
 
 
 def test_timed_lru_cache_evicts_oldest_when_full():
@@ -46,3 +47,47 @@ def test_obfuscate_identifier_masks_value():
     assert masked.startswith("ABCD…")
     assert len(masked) > 8
     assert "123456" not in masked
+
+
+def test_timed_lru_cache_replace_all_swaps_content():
+    cache = TimedLRUCache(max_entries=3, ttl_seconds=None)
+    cache[9] = "vecchio"
+
+    cache.replace_all(enumerate(["a", "b", "c", "d"], start=1))
+
+    assert 9 not in cache
+    assert 1 not in cache  # oldest entry trimmed to max_entries
+    assert [cache[key] for key in (2, 3, 4)] == ["b", "c", "d"]
+
+
+def test_timed_lru_cache_survives_concurrent_writers():
+    cache = TimedLRUCache(max_entries=50, ttl_seconds=60)
+    errors = []
+
+    def writer(offset):
+        try:
+            for index in range(2000):
+                cache[offset + index % 100] = index
+                cache.pop(offset + (index + 1) % 100, -1)
+                list(cache.items())
+        except Exception as exc:  # pragma: no cover - only reached on a race
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(offset,)) for offset in (0, 1000)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache) <= 50
+
+
+def test_truncate_text_trims_tail_whitespace_once():
+    assert truncate_text("breve", 10, "[...]") == "breve"
+    assert truncate_text("abc   \n  def", 8, "[troncato]") == "abc\n[troncato]"
+
+
+def test_unique_strings_keeps_first_occurrence():
+    assert unique_strings(["a", "b", "a"]) == ["a", "b"]
+    assert unique_strings(["Mario@x.it", "luca@x.it", "mario@X.it"], key=str.lower) == ["Mario@x.it", "luca@x.it"]
@@ -1,5 +1,6 @@
 import datetime
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -195,7 +196,8 @@ def test_get_events_from_folder_filters_search_term(monkeypatch):
     events = calendar_service.get_events_from_folder(folder, days=14, search_term="meeting")
 
     assert [event["subject"] for event in events] == ["Quarterly meeting"]
-    assert folder.Items.last_find_filter is not None
+    assert folder.Items.last_restriction.startswith("@SQL=")
+    assert "LIKE '%meeting%'" in folder.Items.last_restriction
 
 
 def test_get_events_from_folder_handles_timezone_aware(monkeypatch):
@@ -231,3 +233,156 @@ def test_collect_events_across_calendars_deduplicates(monkeypatch):
     aggregated = calendar_service.collect_events_across_calendars([folder_one, folder_two], days=14)
 
     assert aggregated == [event_a, event_b]
+
+
+def test_calendar_folders_are_memoized_per_namespace():
+    class CountingNamespace:
+        def __init__(self):
+            self.enumerations = 0
+            self.calendar = SimpleNamespace(Name="Calendario", FolderPath="\\\\Cassetta\\Calendario", DefaultItemType=1, Folders=[])
+            self.root = SimpleNamespace(Name="Cassetta", FolderPath="\\\\Cassetta", DefaultItemType=0, Folders=[self.calendar])
+
+        def GetDefaultFolder(self, folder_type):
+            return self.calendar
+
+        @property
+        def Folders(self):
+            self.enumerations += 1
+            return [self.root]
+
+    calendar_service.invalidate_calendar_folder_cache()
+    namespace = CountingNamespace()
+
+    assert calendar_service.get_all_calendar_folders(namespace) == [namespace.calendar]
+    assert calendar_service.get_calendar_folder_by_name(namespace, "calendario") is namespace.calendar
+    assert calendar_service.get_default_calendar_folder(namespace) is namespace.calendar
+    assert namespace.enumerations == 1
+
+    calendar_service.invalidate_calendar_folder_cache()
+    calendar_service.get_all_calendar_folders(namespace)
+    assert namespace.enumerations == 2
+    calendar_service.invalidate_calendar_folder_cache()
+
+
+def test_collect_events_across_calendars_reads_folders_concurrently(monkeypatch):
+    events_by_id = {
+        ("A", "S"): [{"id": "1", "start_iso": "2025-10-20T09:00", "source": "A"}],
+        ("B", "S"): [
+            {"id": "1", "start_iso": "2025-10-20T09:00", "source": "B"},
+            {"id": "2", "start_iso": "2025-10-19T09:00", "source": "B"},
+        ],
+    }
+    namespace = SimpleNamespace(GetFolderFromID=lambda entry_id, store_id: (entry_id, store_id))
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(calendar_service, "com_worker_pool", lambda: pool)
+    monkeypatch.setattr(calendar_service, "connect_to_outlook", lambda: (None, namespace))
+    monkeypatch.setattr(
+        calendar_service,
+        "get_events_from_folder",
+        lambda folder, days, search_term=None: list(events_by_id[folder]),
+    )
+
+    folders = [SimpleNamespace(EntryID="A", StoreID="S"), SimpleNamespace(EntryID="B", StoreID="S")]
+    try:
+        events = calendar_service.collect_events_across_calendars(folders, 7)
+    finally:
+        pool.shutdown(wait=True)
+
+    assert [(event["id"], event["source"]) for event in events] == [("2", "B"), ("1", "A")]
+
+
+def test_present_event_listing_renders_blocks_and_fills_cache():
+    events = [
+        {"subject": "Riunione", "start_time": "2025-10-18 11:00", "end_time": "2025-10-18 12:00", "categories": "Lavoro", "preview": "Agenda"},
+        {"subject": "Pranzo", "start_time": "2025-10-18 13:00", "end_time": "2025-10-18 14:00", "all_day": False},
+        {"subject": "Nascosto"},
+    ]
+
+    output = calendar_service.present_event_listing(events, "Calendario", 7, 2, True, "test")
+
+    assert output == (
+        "Trovati 3 eventi in Calendario nei prossimi 7 giorni. Mostro i primi 2 risultati.\n"
+        "\n"
+        "Evento #1\n"
+        "Oggetto: Riunione\n"
+        "Inizio: 2025-10-18 11:00\n"
+        "Fine: 2025-10-18 12:00\n"
+        "Calendario: Calendario\n"
+        "Luogo: Non specificato\n"
+        "Organizzatore: Non disponibile\n"
+        "Giornata intera: No\n"
+        "Categorie: Lavoro\n"
+        "Anteprima: Agenda\n"
+        "\n"
+        "Evento #2\n"
+        "Oggetto: Pranzo\n"
+        "Inizio: 2025-10-18 13:00\n"
+        "Fine: 2025-10-18 14:00\n"
+        "Calendario: Calendario\n"
+        "Luogo: Non specificato\n"
+        "Organizzatore: Non disponibile\n"
+        "Giornata intera: No"
+    )
+    assert sorted(calendar_service.calendar_cache) == [1, 2]
+    assert calendar_service.calendar_cache[2] is events[1]
+    calendar_service.clear_calendar_cache()
+
+
+def test_get_calendar_folder_by_name_indexes_names_once():
+    class NamedFolder:
+        def __init__(self, name):
+            self._name = name
+            self.name_reads = 0
+            self.FolderPath = f"\\\\Cassetta\\{name}"
+            self.DefaultItemType = 1
+            self.Folders = []
+
+        @property
+        def Name(self):
+            self.name_reads += 1
+            return self._name
+
+    work, home = NamedFolder("Lavoro"), NamedFolder("Casa")
+    root = SimpleNamespace(FolderPath="\\\\Cassetta", DefaultItemType=0, Folders=[work, home])
+    namespace = SimpleNamespace(GetDefaultFolder=lambda folder_type: work, Folders=[root])
+
+    calendar_service.invalidate_calendar_folder_cache()
+    assert calendar_service.get_calendar_folder_by_name(namespace, "casa") is home
+    assert calendar_service.get_calendar_folder_by_name(namespace, "LAVORO") is work
+    assert calendar_service.get_calendar_folder_by_name(namespace, "altro") is None
+    assert work.name_reads == home.name_reads == 1
+    calendar_service.invalidate_calendar_folder_cache()
+
+
+def test_invalidate_calendar_entry_touches_only_the_changed_event(monkeypatch):
+    calendar_service.clear_calendar_cache()
+    first, second = {"id": "A", "subject": "Prima"}, {"id": "B", "subject": "Seconda"}
+    calendar_service.calendar_cache.replace_all([(1, first), (2, second)])
+    monkeypatch.setattr(calendar_service, "format_calendar_event", lambda item: {"id": "A", "subject": item.Subject})
+
+    calendar_service.invalidate_calendar_entry("A", SimpleNamespace(Subject="Spostata"))
+    assert calendar_service.calendar_cache[1]["subject"] == "Spostata"
+    assert calendar_service.calendar_cache[2] is second
+
+    calendar_service.invalidate_calendar_entry("B")
+    assert 2 not in calendar_service.calendar_cache
+    assert 1 in calendar_service.calendar_cache
+    calendar_service.clear_calendar_cache()
+
+
+def test_invalidate_calendar_entry_drops_recurring_occurrences(monkeypatch):
+    calendar_service.clear_calendar_cache()
+    monday, tuesday = {"id": "S", "start": "lunedì"}, {"id": "S", "start": "martedì"}
+    other = {"id": "B", "subject": "Seconda"}
+    calendar_service.calendar_cache.replace_all([(1, monday), (2, tuesday), (3, other)])
+    monkeypatch.setattr(calendar_service, "format_calendar_event", lambda item: {"id": "S", "start": "serie"})
+
+    calendar_service.invalidate_calendar_entry("S", SimpleNamespace(IsRecurring=False))
+    assert 1 not in calendar_service.calendar_cache
+    assert 2 not in calendar_service.calendar_cache
+    assert calendar_service.calendar_cache[3] is other
+
+    calendar_service.calendar_cache[4] = {"id": "R", "start": "mercoledì"}
+    calendar_service.invalidate_calendar_entry("R", SimpleNamespace(IsRecurring=True))
+    assert 4 not in calendar_service.calendar_cache
+    calendar_service.clear_calendar_cache()
@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.tools import calendar_write
+
+
+def _record_calls(monkeypatch, outcome="Evento creato."):
+    calls = []
+
+    def fake_create(*args):
+        calls.append(dict(zip(calendar_write._BULK_EVENT_FIELDS, args)))
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(calendar_write, "_create_calendar_event", fake_create)
+    return calls
+
+
+def test_bulk_events_coerce_flags_and_apply_defaults(monkeypatch):
+    calls = _record_calls(monkeypatch)
+
+    result = calendar_write._create_calendar_events_bulk(
+        [{"subject": "Riunione", "start_time": "2025-10-20 10:30", "all_day": "false", "send_invitations": "no"}]
+    )
+
+    assert "Eventi creati: 1" in result
+    assert calls[0]["all_day"] is False
+    assert calls[0]["send_invitations"] is False
+    assert calls[0]["duration_minutes"] == 60
+
+
+def test_bulk_events_reject_invalid_fields_without_calling_outlook(monkeypatch):
+    calls = _record_calls(monkeypatch)
+
+    result = calendar_write._create_calendar_events_bulk(
+        [
+            {"subject": 42, "start_time": "2025-10-20 10:30"},
+            {"subject": "Riunione", "start_time": ["2025-10-20"]},
+            {"subject": "Riunione", "start_time": "2025-10-20 10:30", "duration_minutes": "lungo"},
+            {"subject": "Riunione", "start_time": "2025-10-20 10:30", "reminder_minutes": True},
+        ]
+    )
+
+    assert calls == []
+    assert "Eventi non creati: 4" in result
+    assert "evento 1: 'subject' deve essere un testo non vuoto" in result
+    assert "evento 2: 'start_time' deve essere un testo non vuoto" in result
+    assert "evento 3: 'duration_minutes' deve essere un intero" in result
+    assert "evento 4: 'reminder_minutes' deve essere un intero" in result
+
+
+def test_bulk_events_record_unexpected_errors_per_event(monkeypatch):
+    _record_calls(monkeypatch, outcome=RuntimeError("COM non disponibile"))
+
+    result = calendar_write._create_calendar_events_bulk(
+        [
+            {"subject": "Uno", "start_time": "2025-10-20 10:30"},
+            {"subject": "Due", "start_time": "2025-10-21 10:30"},
+        ]
+    )
+
+    assert "Eventi non creati: 2" in result
+    assert "evento 1: errore imprevisto (COM non disponibile)" in result
+    assert "evento 2: errore imprevisto (COM non disponibile)" in result
@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp import connection
+
+
+class FakeOutlook:
+    def __init__(self):
+        self.alive = True
+        self.Version = "16.0.0"
+
+    @property
+    def Name(self):
+        if not self.alive:
+            raise RuntimeError("RPC server unavailable")
+        return "Outlook"
+
+    def GetNamespace(self, name):
+        return SimpleNamespace(name=name)
+
+
+def test_connect_to_outlook_reuses_connection_until_it_dies(monkeypatch):
+    dispatched = []
+
+    def fake_dispatch(prog_id):
+        dispatched.append(FakeOutlook())
+        return dispatched[-1]
+
+    monkeypatch.setattr(
+        connection.win32com.client,
+        "gencache",
+        SimpleNamespace(EnsureDispatch=fake_dispatch),
+        raising=False,
+    )
+    monkeypatch.setattr(connection, "_LIVENESS_CHECK_INTERVAL", 0.0)
+    connection.reset_outlook_connection()
+
+    first = connection.connect_to_outlook()
+    assert connection.connect_to_outlook() is first
+    assert len(dispatched) == 1
+
+    dispatched[0].alive = False
+    second = connection.connect_to_outlook()
+    assert second is not first
+    assert len(dispatched) == 2
+
+    connection.reset_outlook_connection()
+
+
+def test_connect_to_outlook_skips_liveness_probe_right_after_a_check(monkeypatch):
+    probes = []
+
+    class CountingOutlook(FakeOutlook):
+        @property
+        def Name(self):
+            probes.append(1)
+            return "Outlook"
+
+    monkeypatch.setattr(
+        connection.win32com.client,
+        "gencache",
+        SimpleNamespace(EnsureDispatch=lambda prog_id: CountingOutlook()),
+        raising=False,
+    )
+    connection.reset_outlook_connection()
+
+    first = connection.connect_to_outlook()
+    for _ in range(5):
+        assert connection.connect_to_outlook() is first
+    assert probes == []
+
+    connection.reset_outlook_connection()
+
+
+def test_connect_to_outlook_falls_back_to_late_binding(monkeypatch):
+    def broken_ensure_dispatch(prog_id):
+        raise AttributeError("gen_py cache corrotta")
+
+    monkeypatch.setattr(
+        connection.win32com.client,
+        "gencache",
+        SimpleNamespace(EnsureDispatch=broken_ensure_dispatch),
+        raising=False,
+    )
+    monkeypatch.setattr(connection.win32com.client, "Dispatch", lambda prog_id: FakeOutlook())
+    connection.reset_outlook_connection()
+
+    outlook, namespace = connection.connect_to_outlook()
+
+    assert isinstance(outlook, FakeOutlook)
+    assert namespace.name == "MAPI"
+    connection.reset_outlook_connection()
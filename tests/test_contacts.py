@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.tools import contacts as contacts_tool
+
+
+class MockColumns:
+    def __init__(self):
+        self.names = []
+
+    def RemoveAll(self):
+        self.names = []
+
+    def Add(self, name):
+        self.names.append(name)
+
+
+class MockContactTable:
+    def __init__(self, contacts):
+        self._contacts = list(contacts)
+        self.Columns = MockColumns()
+        self.EndOfTable = False
+        self.calls = 0
+        self.last_sort = None
+
+    def Sort(self, key, descending):
+        self.last_sort = (key, descending)
+        attribute = key.strip("[]")
+        self._contacts.sort(key=lambda contact: contact.get(attribute) or "", reverse=descending)
+
+    def GetArray(self, max_rows):
+        self.calls += 1
+        batch, self._contacts = self._contacts[:max_rows], self._contacts[max_rows:]
+        self.EndOfTable = not self._contacts
+        return tuple(tuple(contact.get(name) for name in self.Columns.names) for contact in batch)
+
+
+def test_search_contacts_reads_rows_from_table(monkeypatch):
+    contacts = [
+        {"FullName": "Mario Rossi", "FileAs": "Rossi, Mario", "Email1Address": "mario@example.com", "CompanyName": "ACME"},
+        {"FileAs": "Bianchi, Luca", "Email2Address": "luca@example.com", "MobileTelephoneNumber": "333"},
+        {"FullName": "Anna Verdi", "Categories": "Fornitori"},
+    ]
+    table = MockContactTable(contacts)
+    filters = []
+
+    def get_table(contact_filter=None):
+        filters.append(contact_filter)
+        return table
+
+    folder = SimpleNamespace(GetTable=get_table, Items=SimpleNamespace(Count=len(contacts)))
+    namespace = SimpleNamespace(GetDefaultFolder=lambda folder_type: folder)
+    monkeypatch.setattr(contacts_tool, "_connect", lambda: (None, namespace))
+
+    output = contacts_tool.search_contacts("example")
+
+    assert output == (
+        "Trovati 2 contatti su 3.\n"
+        "\n"
+        "1. Bianchi, Luca <luca@example.com> (333)\n"
+        "2. Mario Rossi <mario@example.com> (ACME)\n"
+        "\n"
+        "Filtro applicato: 'example'."
+    )
+    assert table.calls == 1
+    assert table.last_sort == ("[FileAs]", False)
+    assert filters[0].startswith("@SQL=") and "LIKE '%example%'" in filters[0]
+
+
+def test_build_contact_filter_escapes_terms_and_skips_placeholder():
+    assert contacts_tool._build_contact_filter("") is None
+    assert "'%mario rossi%'" in contacts_tool._build_contact_filter("mario rossi")
+    assert contacts_tool._build_contact_filter("nome") is None
+    assert "'%d''amico%'" in contacts_tool._build_contact_filter("d'amico")
@@ -0,0 +1,221 @@
+import asyncio
+import datetime
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.tools import email_actions
+
+
+class MockMailItem:
+    def __init__(self, entry_id):
+        self.EntryID = entry_id
+        self.UnRead = True
+        self.calls = []
+
+    def Move(self, folder):
+        self.calls.append("Move")
+        return self
+
+    def Save(self):
+        self.calls.append("Save")
+
+    def Delete(self):
+        self.calls.append("Delete")
+
+
+def _patch_batch(monkeypatch, items):
+    target = SimpleNamespace(Name="Archivio", FolderPath="\\\\Cassetta\\Archivio")
+    monkeypatch.setattr(email_actions, "_connect", lambda: (None, object()))
+    monkeypatch.setattr(
+        email_actions,
+        "_resolve",
+        lambda namespace, *, email_number, message_id: (None, items[message_id]),
+    )
+    monkeypatch.setattr(
+        email_actions.folder_service,
+        "resolve_folder",
+        lambda namespace, **kwargs: (target, []),
+    )
+
+
+def test_batch_manage_emails_skips_saves_for_move_and_read_state(monkeypatch):
+    items = {"A": MockMailItem("A"), "B": MockMailItem("B"), "C": MockMailItem("C")}
+    _patch_batch(monkeypatch, items)
+
+    moved = email_actions.batch_manage_emails(message_ids=["A", "A"], move_to_folder_name="Archivio")
+    marked = email_actions.batch_manage_emails(message_ids=["B"], move_to_folder_name="Archivio", mark_as="read")
+    deleted = email_actions.batch_manage_emails(message_ids=["C"], mark_as="read", delete=True)
+
+    assert "Operazioni riuscite: 1" in moved
+    assert items["A"].calls == ["Move"]
+    assert items["B"].calls == ["Move"]
+    assert items["B"].UnRead is False
+    assert items["C"].calls == ["Delete"]
+    assert "Operazioni fallite: 0" in deleted and "Operazioni fallite: 0" in marked
+
+
+def test_batch_manage_emails_skips_moves_into_current_folder(monkeypatch):
+    items = {"A": MockMailItem("A"), "B": MockMailItem("B")}
+    items["A"].Parent = SimpleNamespace(EntryID="ARCHIVIO")
+    items["B"].Parent = SimpleNamespace(EntryID="INBOX")
+    _patch_batch(monkeypatch, items)
+    target = SimpleNamespace(Name="Archivio", FolderPath="\\\\Cassetta\\Archivio", EntryID="ARCHIVIO")
+    monkeypatch.setattr(email_actions.folder_service, "resolve_folder", lambda namespace, **kwargs: (target, []))
+
+    output = email_actions.batch_manage_emails(message_ids=["A", "B"], move_to_folder_name="Archivio")
+
+    assert items["A"].calls == []
+    assert items["B"].calls == ["Move"]
+    assert "id=A (id=A): già in \\\\Cassetta\\Archivio" in output
+
+
+def test_batch_manage_emails_reports_every_message_in_request_order(monkeypatch):
+    items = {f"M{index}": MockMailItem(f"M{index}") for index in range(10)}
+    _patch_batch(monkeypatch, items)
+
+    output = email_actions.batch_manage_emails(message_ids=list(items), move_to_folder_name="Archivio")
+
+    assert "Operazioni riuscite: 10" in output
+    assert [line.split(" ")[1] for line in output.splitlines() if line.startswith("- ")] == [f"id={key}" for key in items]
+    assert all(item.calls == ["Move"] for item in items.values())
+
+
+def _patch_pool(monkeypatch, items, *, worker_connect_fails=False):
+    target = SimpleNamespace(Name="Archivio", FolderPath="\\\\Cassetta\\Archivio", EntryID="ARCHIVIO", StoreID="S")
+    main_thread = threading.current_thread()
+    connections = []
+
+    def connect():
+        on_worker = threading.current_thread() is not main_thread
+        connections.append(on_worker)
+        if on_worker and worker_connect_fails:
+            raise RuntimeError("CoInitialize non riuscito")
+        return None, SimpleNamespace(GetFolderFromID=lambda entry_id, store_id: target)
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    _patch_batch(monkeypatch, items)
+    monkeypatch.setattr(email_actions.folder_service, "resolve_folder", lambda namespace, **kwargs: (target, []))
+    monkeypatch.setattr(email_actions, "_connect", connect)
+    monkeypatch.setattr(email_actions, "com_worker_pool", lambda: pool)
+    return pool, connections
+
+
+def test_batch_manage_emails_spreads_large_batches_over_the_com_pool(monkeypatch):
+    items = {f"M{index}": MockMailItem(f"M{index}") for index in range(10)}
+    pool, connections = _patch_pool(monkeypatch, items)
+
+    try:
+        output = email_actions.batch_manage_emails(message_ids=list(items), move_to_folder_name="Archivio")
+    finally:
+        pool.shutdown(wait=True)
+
+    assert "Operazioni riuscite: 10" in output
+    assert [line.split(" ")[1] for line in output.splitlines() if line.startswith("- ")] == [f"id={key}" for key in items]
+    assert all(item.calls == ["Move"] for item in items.values())
+    assert connections.count(True) == email_actions._BATCH_WORKERS
+
+
+def test_batch_manage_emails_runs_jobs_once_when_workers_cannot_connect(monkeypatch):
+    items = {f"M{index}": MockMailItem(f"M{index}") for index in range(10)}
+    pool, connections = _patch_pool(monkeypatch, items, worker_connect_fails=True)
+
+    try:
+        output = email_actions.batch_manage_emails(message_ids=list(items), move_to_folder_name="Archivio")
+    finally:
+        pool.shutdown(wait=True)
+
+    assert "Operazioni riuscite: 10" in output
+    assert all(item.calls == ["Move"] for item in items.values())
+    assert connections.count(False) == 1
+
+
+def test_compose_email_rejects_missing_attachment_before_creating_item(monkeypatch, tmp_path):
+    created = []
+    outlook = SimpleNamespace(CreateItem=lambda item_type: created.append(item_type))
+    monkeypatch.setattr(email_actions, "_connect", lambda: (outlook, None))
+    existing = tmp_path / "presente.txt"
+    existing.write_text("ok")
+    missing = tmp_path / "assente.txt"
+
+    output = asyncio.run(
+        email_actions.compose_email("a@example.com", "Oggetto", "Corpo", attachments=[str(existing), str(missing)])
+    )
+
+    assert output == f"Errore: file '{missing}' non trovato."
+    assert created == []
+
+
+def test_flag_email_parses_dates_once_and_defaults_reminder_to_due_date(monkeypatch):
+    connections = []
+    item = MockMailItem("A")
+    monkeypatch.setattr(email_actions, "_connect", lambda: connections.append(1) or (None, object()))
+    monkeypatch.setattr(email_actions, "_resolve", lambda namespace, *, email_number, message_id: (None, item))
+
+    invalid = asyncio.run(email_actions.flag_email(message_id="A", due_date="domani"))
+    output = asyncio.run(email_actions.flag_email(message_id="A", due_date="2025-10-22T14:30Z"))
+
+    assert invalid.startswith("Errore: formato data scadenza non valido")
+    assert connections == [1]
+    assert item.FlagDueBy == item.ReminderTime == datetime.datetime(2025, 10, 22, 14, 30)
+    assert item.ReminderSet is True
+    assert item.calls == ["Save"]
+    assert output.startswith("Messaggio A contrassegnato: Follow up")
+
+
+def test_batch_manage_emails_rejects_oversized_batches_before_connecting(monkeypatch):
+    def fail_connect():
+        raise AssertionError("nessuna connessione attesa")
+
+    monkeypatch.setattr(email_actions, "_connect", fail_connect)
+    ids = [f"ID{index}" for index in range(email_actions.MAX_BATCH_EMAILS + 1)]
+
+    output = email_actions.batch_manage_emails(message_ids=ids + ids, mark_as="read")
+
+    assert output == f"Errore: al massimo {email_actions.MAX_BATCH_EMAILS} messaggi per chiamata."
+
+
+def test_batch_manage_emails_truncates_only_successful_details(monkeypatch):
+    items = {f"M{index}": MockMailItem(f"M{index}") for index in range(email_actions._BATCH_DETAIL_LINES + 3)}
+    _patch_batch(monkeypatch, items)
+
+    output = email_actions.batch_manage_emails(message_ids=list(items), mark_as="unread")
+    lines = output.splitlines()
+
+    assert lines[0] == f"Operazioni riuscite: {len(items)}"
+    assert sum(line.startswith("- ") for line in lines) == email_actions._BATCH_DETAIL_LINES
+    assert lines[-1] == "(Altre 3 operazioni non visualizzate)"
+
+    missing = list(range(1000, 1000 + email_actions._BATCH_DETAIL_LINES + 3))
+    failed = email_actions.batch_manage_emails(email_numbers=missing, mark_as="unread").splitlines()
+
+    assert failed[1] == f"Operazioni fallite: {len(missing)}"
+    assert sum(line.startswith("- numero=") for line in failed) == len(missing)
+    assert not any(line.startswith("(Altre") for line in failed)
+
+
+def test_set_email_category_reuses_apply_category_implementation(monkeypatch):
+    applied = []
+    item = MockMailItem("A")
+    monkeypatch.setattr(email_actions, "_connect", lambda: (None, object()))
+    monkeypatch.setattr(email_actions, "_resolve", lambda namespace, *, email_number, message_id: (None, item))
+    monkeypatch.setattr(
+        email_actions,
+        "_apply_cats",
+        lambda mail_item, categories, overwrite, append: applied.append((categories, overwrite, append)) or categories,
+    )
+    monkeypatch.setattr(email_actions, "apply_category", lambda **kwargs: pytest.fail("tool non previsto"))
+
+    output = email_actions.set_email_category(7, " Clienti ")
+
+    assert applied == [(["Clienti"], False, True)]
+    assert output == "Categorie applicate al messaggio #7: Clienti."
+    assert email_actions.set_email_category(7, "  ") == "Errore: specifica almeno una categoria da applicare."
@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.tools import email_detail
+
+
+class MockColumns:
+    def __init__(self):
+        self.names = []
+
+    def RemoveAll(self):
+        self.names = []
+
+    def Add(self, name):
+        self.names.append(name)
+
+
+class MockTable:
+    def __init__(self, items):
+        self._items = list(items)
+        self.Columns = MockColumns()
+        self.requested_rows = None
+
+    def Sort(self, key, descending):
+        attribute = key.strip("[]")
+        self._items.sort(key=lambda item: getattr(item, attribute), reverse=descending)
+
+    def GetArray(self, max_rows):
+        self.requested_rows = max_rows
+        return tuple(tuple(getattr(item, name) for name in self.Columns.names) for item in self._items[:max_rows])
+
+
+def test_entry_id_at_position_reads_only_the_entry_id_column():
+    items = [SimpleNamespace(EntryID=f"ID{day}", ReceivedTime=day) for day in (3, 1, 2)]
+    table = MockTable(items)
+    folder = SimpleNamespace(GetTable=lambda: table)
+
+    assert email_detail._entry_id_at_position(folder, 2) == ("ID2", 2)
+    assert table.Columns.names == ["EntryID"]
+    assert table.requested_rows == 2
+    assert email_detail._entry_id_at_position(folder, 5) == (None, 3)
+
+
+def test_get_email_by_number_opens_table_rows_in_the_folder_store(monkeypatch):
+    import outlook_mcp
+
+    items = [SimpleNamespace(EntryID="ID1", ReceivedTime=1)]
+    folder = SimpleNamespace(GetTable=lambda: MockTable(items), StoreID="ARCHIVIO-PST")
+    lookups = []
+
+    def get_item(entry_id, *store):
+        lookups.append((entry_id, *store))
+        return SimpleNamespace(EntryID=entry_id)
+
+    namespace = SimpleNamespace(GetItemFromID=get_item)
+    monkeypatch.setattr(outlook_mcp, "connect_to_outlook", lambda: (None, namespace))
+    monkeypatch.setattr(email_detail.folder_service, "resolve_folder", lambda namespace, **kwargs: (folder, []))
+    monkeypatch.setattr(email_detail, "format_email", lambda item: {"id": item.EntryID, "subject": "Oggetto"})
+
+    email_detail.get_email_by_number(folder_path="\\\\Archivio\\Posta", index=1, include_body=False)
+
+    assert lookups == [("ID1", "ARCHIVIO-PST")]
@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.services import email as email_service
+
+
+class MockFolders(list):
+    def __init__(self, owner, children=()):
+        super().__init__(children)
+        self.owner = owner
+
+    def Add(self, name):
+        folder = MockFolder(name)
+        self.append(folder)
+        return folder
+
+
+class MockFolder:
+    def __init__(self, name, children=()):
+        self.Name = name
+        self.EntryID = f"ID-{name}"
+        self._folders = MockFolders(self, children)
+        self.enumerations = 0
+
+    @property
+    def Folders(self):
+        self.enumerations += 1
+        return self._folders
+
+
+def test_domain_structure_reuses_subfolder_index():
+    clients = MockFolder("Clienti", [MockFolder("example.com", [MockFolder("Archivio")])])
+    inbox = MockFolder("Posta in arrivo", [clients])
+    namespace = SimpleNamespace(GetDefaultFolder=lambda folder_type: inbox)
+    email_service.invalidate_subfolder_index()
+
+    domain_folder, created, new_subfolders = email_service.ensure_domain_folder_structure(
+        namespace, "example.com", "clienti", ["Archivio", "Offerte"]
+    )
+    assert domain_folder.Name == "example.com"
+    assert not created
+    assert new_subfolders == ["Offerte"]
+
+    assert email_service.find_subfolder(namespace, clients, "EXAMPLE.COM") is domain_folder
+    assert email_service.find_subfolder(namespace, domain_folder, "offerte").Name == "Offerte"
+    assert email_service.find_subfolder(namespace, clients, "altro.it") is None
+    assert inbox.enumerations == 1
+    assert clients.enumerations == 1
+
+    email_service.invalidate_subfolder_index()
+    email_service.find_subfolder(namespace, clients, "example.com")
+    assert clients.enumerations == 2
+    email_service.invalidate_subfolder_index()
+
+
+def test_get_or_create_subfolder_rescans_before_adding(monkeypatch):
+    parent = MockFolder("Clienti")
+    namespace = object()
+    email_service.invalidate_subfolder_index()
+    assert email_service.find_subfolder(namespace, parent, "nuova") is None
+
+    # Another client creates the folder after the index was built.
+    external = MockFolder("Nuova")
+    parent._folders.append(external)
+    monkeypatch.setattr(parent._folders, "Add", lambda name: pytest.fail("Add su una cartella esistente"))
+
+    folder, created = email_service._get_or_create_subfolder(parent, "Nuova", namespace)
+
+    assert folder is external and not created
+    assert email_service.find_subfolder(namespace, parent, "nuova") is external
+    email_service.invalidate_subfolder_index()
+
+
+def test_created_subfolder_is_added_to_the_index():
+    parent = MockFolder("Clienti")
+    namespace = object()
+    email_service.invalidate_subfolder_index()
+
+    created, was_created = email_service._get_or_create_subfolder(parent, "Nuova", namespace)
+    enumerations = parent.enumerations
+
+    assert was_created and created.Name == "Nuova"
+    assert email_service.find_subfolder(namespace, parent, "NUOVA") is created
+    assert parent.enumerations == enumerations
+    email_service.invalidate_subfolder_index()
@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp import folders as folder_service
+
+
+def test_resolve_folder_cached_reuses_successful_resolutions():
+    lookups = []
+    archive = SimpleNamespace(Name="Archivio")
+
+    def get_folder(entry_id):
+        lookups.append(entry_id)
+        return archive if entry_id == "ARCHIVIO" else None
+
+    namespace = SimpleNamespace(GetFolderFromID=get_folder)
+    other_namespace = SimpleNamespace(GetFolderFromID=get_folder)
+    folder_service.invalidate_resolved_folder_cache()
+
+    assert folder_service.resolve_folder_cached(namespace, folder_id="ARCHIVIO") == (archive, [])
+    assert folder_service.resolve_folder_cached(namespace, folder_id="ARCHIVIO") == (archive, [])
+    assert folder_service.resolve_folder_cached(namespace, folder_id="ALTRO")[0] is None
+    assert folder_service.resolve_folder_cached(namespace, folder_id="ALTRO")[0] is None
+    assert folder_service.resolve_folder_cached(other_namespace, folder_id="ARCHIVIO")[0] is archive
+    assert lookups == ["ARCHIVIO", "ALTRO", "ALTRO", "ARCHIVIO"]
+
+    folder_service.invalidate_resolved_folder_cache()
+    folder_service.resolve_folder_cached(namespace, folder_id="ARCHIVIO")
+    assert lookups[-1] == "ARCHIVIO" and len(lookups) == 5
@@ -0,0 +1,30 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp import settings
+
+
+def test_promotional_keywords_follow_config_file_changes(tmp_path, monkeypatch):
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"filters": {"promotional_keywords": ["Saldi"]}}), encoding="utf-8")
+    monkeypatch.setattr(settings, "CONFIG_FILE", config_file)
+    settings.reload_settings()
+
+    assert settings.get_promotional_keywords() == {"saldi"}
+    assert settings.get_promotional_matcher().search("Grandi SALDI estivi")
+
+    config_file.write_text(json.dumps({"promotional_keywords": ["offerta"]}), encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert settings.get_promotional_keywords() == {"offerta"}
+    assert settings.get_promotional_matcher().search("Grandi saldi") is None
+
+    monkeypatch.undo()
+    settings.reload_settings()
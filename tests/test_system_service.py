@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.services import system as system_service
+
+
+class CountingAccounts(list):
+    def __init__(self, accounts):
+        super().__init__(accounts)
+        self.enumerations = 0
+
+    def __iter__(self):
+        self.enumerations += 1
+        return super().__iter__()
+
+
+def _namespace(accounts):
+    return SimpleNamespace(Application=SimpleNamespace(Session=SimpleNamespace(Accounts=accounts)))
+
+
+def test_accounts_are_cached_per_namespace():
+    system_service.invalidate_accounts_cache()
+    old_accounts = CountingAccounts([SimpleNamespace(DisplayName="Mario", SmtpAddress="mario@example.com")])
+    new_accounts = CountingAccounts([SimpleNamespace(DisplayName="Lucia", SmtpAddress="lucia@example.com")])
+    session, reconnected = _namespace(old_accounts), _namespace(new_accounts)
+
+    first = system_service._safe_collect_accounts(session)
+    again = system_service._safe_collect_accounts(session)
+    after_reconnect = system_service._safe_collect_accounts(reconnected)
+
+    assert first == again == [{"display_name": "Mario", "smtp_address": "mario@example.com"}]
+    assert old_accounts.enumerations == 1
+    assert after_reconnect == [{"display_name": "Lucia", "smtp_address": "lucia@example.com"}]
+
+    system_service.invalidate_accounts_cache()
+    system_service._safe_collect_accounts(reconnected)
+    assert new_accounts.enumerations == 2
+    system_service.invalidate_accounts_cache()
@@ -0,0 +1,309 @@
+import datetime
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from outlook_mcp.services import tasks as task_service
+
+
+class MockColumns:
+    def __init__(self):
+        self.names = []
+
+    def RemoveAll(self):
+        self.names = []
+
+    def Add(self, name):
+        self.names.append(name)
+
+
+class MockTable:
+    def __init__(self, tasks):
+        self._tasks = list(tasks)
+        self.Columns = MockColumns()
+        self.EndOfTable = False
+        self.last_sort = None
+
+    def Sort(self, key, descending):
+        self.last_sort = (key, descending)
+        attribute = key.strip("[]")
+        self._tasks.sort(key=lambda task: getattr(task, attribute), reverse=descending)
+
+    def GetArray(self, max_rows):
+        selected = self._tasks[:max_rows]
+        self.EndOfTable = len(self._tasks) <= max_rows
+        return tuple(tuple(getattr(task, name) for name in self.Columns.names) for task in selected)
+
+
+class MockTask:
+    def __init__(self, subject, due, *, entry_id=None, body="", status=0, importance=1):
+        self.EntryID = entry_id or subject
+        self.Subject = subject
+        self.Body = body
+        self.DueDate = due
+        self.StartDate = None
+        self.DateCompleted = None
+        self.CreationTime = datetime.datetime(2025, 1, 1, 9, 0)
+        self.Status = status
+        self.Importance = importance
+        self.PercentComplete = 0
+        self.Complete = False
+        self.Owner = "Owner"
+        self.Categories = ""
+        self.ReminderSet = False
+        self.ReminderTime = None
+
+
+class MockTaskItems:
+    def __init__(self, tasks):
+        self._tasks = list(tasks)
+        self.last_restriction = None
+
+    def Sort(self, key, descending=False):
+        attribute = key.strip("[]")
+        self._tasks.sort(key=lambda task: getattr(task, attribute), reverse=descending)
+
+    def Restrict(self, restriction):
+        self.last_restriction = restriction
+        return self
+
+    def __iter__(self):
+        return iter(self._tasks)
+
+
+class MockTaskFolder:
+    def __init__(self, tasks, *, tables_supported=True):
+        self.FolderPath = "\\\\Cassetta\\Attività"
+        self._tasks = list(tasks)
+        self._tables_supported = tables_supported
+        self.table_filters = []
+        self.Items = MockTaskItems(tasks)
+
+    def GetTable(self, task_filter=None):
+        if not self._tables_supported:
+            raise RuntimeError("GetTable non supportato")
+        self.table_filters.append(task_filter)
+        return MockTable(self._tasks)
+
+
+def test_get_tasks_from_folder_reads_rows_from_table():
+    later = MockTask("Seconda", datetime.datetime(2025, 3, 2, 12, 0), body="Dettagli")
+    sooner = MockTask("Prima", datetime.datetime(2025, 3, 1, 12, 0), status=1, importance=2)
+    folder = MockTaskFolder([later, sooner])
+
+    tasks = task_service.get_tasks_from_folder(folder)
+
+    assert [task["subject"] for task in tasks] == ["Prima", "Seconda"]
+    assert tasks[0]["status"] == "In corso"
+    assert tasks[0]["priority"] == "Alta"
+    assert tasks[0]["due_date"] == "2025-03-01 12:00"
+    assert tasks[0]["folder_path"] == folder.FolderPath
+    assert tasks[1]["body"] is None
+    assert folder.table_filters and folder.table_filters[0]
+
+
+def test_get_tasks_from_folder_falls_back_to_items_without_tables():
+    task = MockTask("Senza tabella", datetime.datetime(2025, 3, 1, 12, 0), body="Corpo")
+    task.Parent = SimpleNamespace(Parent=SimpleNamespace(FolderPath="\\\\Cassetta"))
+    folder = MockTaskFolder([task], tables_supported=False)
+
+    tasks = task_service.get_tasks_from_folder(folder)
+
+    assert [entry["subject"] for entry in tasks] == ["Senza tabella"]
+    assert tasks[0]["body"] == "Corpo"
+    assert folder.Items.last_restriction
+
+
+def test_load_task_body_fetches_only_missing_bodies():
+    task = {"id": "ABC", "body": None, "preview": ""}
+    item = SimpleNamespace(Body="Testo   completo")
+    calls = []
+
+    def get_item(entry_id):
+        calls.append(entry_id)
+        return item
+
+    namespace = SimpleNamespace(GetItemFromID=get_item)
+    task_service.load_task_body(namespace, task)
+    task_service.load_task_body(namespace, task)
+
+    assert task["body"] == "Testo   completo"
+    assert task["preview"] == "Testo completo"
+    assert calls == ["ABC"]
+
+
+def test_build_task_filter_emits_single_dasl_query():
+    query = task_service._build_task_filter(days=7, include_completed=False, search_term="l'offerta")
+
+    assert query.startswith("@SQL=")
+    assert "[Complete]" not in query
+    assert "ci_phrasematch" in query
+    assert "'l''offerta'" in query
+
+    fallback = task_service._build_task_filter(None, True, "offerta", use_content_index=False)
+    assert "LIKE '%offerta%'" in fallback
+    assert task_service._build_task_filter(None, True, None) is None
+
+
+def test_get_task_folder_by_name_reuses_enumeration():
+    class CountingNamespace:
+        def __init__(self):
+            self.enumerations = 0
+            task_folder = SimpleNamespace(Name="Progetti", FolderPath="\\\\Cassetta\\Progetti", DefaultItemType=3, Folders=[])
+            self.root = SimpleNamespace(Name="Cassetta", FolderPath="\\\\Cassetta", DefaultItemType=0, Folders=[task_folder])
+
+        def GetDefaultFolder(self, folder_type):
+            raise RuntimeError("nessuna cartella predefinita")
+
+        @property
+        def Folders(self):
+            self.enumerations += 1
+            return [self.root]
+
+    task_service.invalidate_task_folder_cache()
+    namespace = CountingNamespace()
+
+    assert task_service.get_task_folder_by_name(namespace, "progetti").Name == "Progetti"
+    assert task_service.get_task_folder_by_name(namespace, "PROGETTI").Name == "Progetti"
+    assert task_service.get_task_folder_by_name(namespace, "altro") is None
+    assert namespace.enumerations == 1
+
+    task_service.invalidate_task_folder_cache()
+    task_service.get_all_task_folders(namespace)
+    assert namespace.enumerations == 2
+
+
+def test_format_task_row_labels_unknown_codes():
+    columns = ("EntryID", "Subject", "Status", "Importance")
+
+    known = task_service._format_task_row(columns, ("A", "Nota", 4, 0))
+    unknown = task_service._format_task_row(columns, ("B", "Nota", 9, -1))
+
+    assert known["status"] == "Differita"
+    assert known["priority"] == "Bassa"
+    assert unknown["status"] == "Sconosciuto (9)"
+    assert unknown["priority"] == "Sconosciuto (-1)"
+
+
+def test_present_task_listing_renders_blocks_and_footer():
+    tasks = [
+        {"subject": "Prima", "status": "In corso", "priority": "Alta", "due_date": None, "percent_complete": 50, "categories": "Lavoro", "preview": "Nota"},
+        {"subject": "Seconda", "status": "Non iniziata", "priority": "Normale", "due_date": "2025-03-01 12:00", "percent_complete": 0, "categories": ""},
+        {"subject": "Terza"},
+    ]
+
+    output = task_service.present_task_listing(tasks, "Attività", 2, True, "test")
+
+    assert output == (
+        "Attività in Attività (visualizzate 2 di 3):\n"
+        "\n"
+        "1. Prima\n"
+        "   Stato: In corso | 50% | Priorità: Alta | Scadenza: Nessuna scadenza | Categorie: Lavoro\n"
+        "   Anteprima: Nota\n"
+        "\n"
+        "2. Seconda\n"
+        "   Stato: Non iniziata | Priorità: Normale | Scadenza: 2025-03-01 12:00\n"
+        "\n"
+        "(Altre 1 attività non visualizzate)"
+    )
+
+
+def test_collect_tasks_across_folders_keeps_earliest_targets(monkeypatch):
+    batches = {
+        "A": [{"subject": "A1", "due_date": "2025-03-05 09:00"}, {"subject": "A2", "due_date": None}],
+        "B": [{"subject": "B1", "due_date": "2025-03-01 09:00"}, {"subject": "B2", "due_date": "2025-03-03 09:00"}],
+    }
+    monkeypatch.setattr(task_service, "get_tasks_from_folder", lambda folder, *args: list(batches[folder]))
+
+    limited, limited_total = task_service.collect_tasks_across_folders(["A", "B"], target_total=2)
+    complete, complete_total = task_service.collect_tasks_across_folders(["A", "B"])
+
+    assert [task["subject"] for task in limited] == ["B1", "B2"]
+    assert limited_total == 4
+    assert [task["subject"] for task in complete] == ["B1", "B2", "A1", "A2"]
+    assert complete_total == 4
+
+    listing = task_service.present_task_listing(
+        tasks=limited,
+        folder_display="Tutte le cartelle attività",
+        max_results=2,
+        include_preview=False,
+        log_context="test",
+        total_found=limited_total,
+    )
+    assert "(visualizzate 2 di 4)" in listing
+    assert listing.endswith("(Altre 2 attività non visualizzate)")
+
+
+def test_format_task_date_drops_outlook_sentinel():
+    assert task_service._format_task_date(datetime.datetime(4501, 1, 1)) is None
+    assert task_service._format_task_date(None) is None
+    assert task_service._format_task_date(datetime.datetime(2025, 3, 1, 8, 30)) == "2025-03-01 08:30"
+
+
+def test_collect_tasks_across_folders_keeps_folder_order_on_the_pool(monkeypatch):
+    b_read = threading.Event()
+    folders_by_id = {
+        ("A", "S"): [{"subject": f"A{day}", "due_date": f"2025-03-0{day} 09:00"} for day in range(1, 5)],
+        ("B", "S"): [{"subject": f"B{day}", "due_date": f"2025-04-0{day} 09:00"} for day in range(1, 5)],
+    }
+
+    def get_tasks(folder, *args):
+        if folder[0] == "A":
+            b_read.wait(timeout=5)  # the first folder finishes last
+        else:
+            b_read.set()
+        return list(folders_by_id[folder])
+
+    namespace = SimpleNamespace(GetFolderFromID=lambda entry_id, store_id: (entry_id, store_id))
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(task_service, "com_worker_pool", lambda: pool)
+    monkeypatch.setattr(task_service, "connect_to_outlook", lambda: (None, namespace))
+    monkeypatch.setattr(task_service, "get_tasks_from_folder", get_tasks)
+
+    folders = [SimpleNamespace(EntryID="A", StoreID="S"), SimpleNamespace(EntryID="B", StoreID="S")]
+    try:
+        tasks, total = task_service.collect_tasks_across_folders(folders, target_total=1)
+    finally:
+        pool.shutdown(wait=True)
+
+    assert [task["subject"] for task in tasks] == ["A1"]
+    assert total == 4
+
+
+def test_get_all_task_folders_dedupes_by_entry_id_without_folder_path():
+    class PathlessFolder:
+        def __init__(self, entry_id, item_type, children=()):
+            self.EntryID = entry_id
+            self.DefaultItemType = item_type
+            self.Folders = list(children)
+
+        @property
+        def FolderPath(self):
+            raise AssertionError("FolderPath non dovrebbe essere letto")
+
+    default_tasks = PathlessFolder("TASKS", 3)
+    nested = PathlessFolder("NESTED", 3)
+    root = PathlessFolder("ROOT", 0, [default_tasks, PathlessFolder("INBOX", 0, [nested])])
+    namespace = SimpleNamespace(GetDefaultFolder=lambda folder_type: default_tasks, Folders=[root])
+
+    task_service.invalidate_task_folder_cache()
+    folders = task_service.get_all_task_folders(namespace)
+    task_service.invalidate_task_folder_cache()
+
+    assert [folder.EntryID for folder in folders] == ["TASKS", "NESTED"]
+
+
+def test_format_task_row_shares_repeated_strings():
+    columns = ("EntryID", "Owner", "Categories")
+    first = task_service._format_task_row(columns, ("A", "".join(["Ma", "rio"]), "Lavoro"))
+    second = task_service._format_task_row(columns, ("B", "".join(["Mar", "io"]), "Lavoro"))
+
+    assert first["owner"] is second["owner"]
+    assert first["categories"] is second["categories"]